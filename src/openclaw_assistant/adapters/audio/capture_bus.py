@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import sounddevice as sd
+
+from openclaw_assistant.adapters.audio.ring_buffer import PcmRingBuffer, RingReader
+from openclaw_assistant.observability.metrics import METRICS
+
+BlockSubscriber = Callable[[int, np.ndarray], None]
+
+
+class AudioCaptureBus:
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        device: str | int | None,
+        ring_seconds: float,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.device = device
+        self.ring = PcmRingBuffer(max(1, int(sample_rate * ring_seconds)))
+        self.wake_position: int | None = None
+        self.last_audio_at: float | None = None
+        self._lock = threading.Lock()
+        self._stream: Any | None = None
+        self._subscribers: tuple[BlockSubscriber, ...] = ()
+
+    @property
+    def position(self) -> int:
+        return self.ring.position
+
+    @property
+    def active(self) -> bool:
+        return self._stream is not None and bool(self._stream.active)
+
+    def seconds_to_samples(self, seconds: float) -> int:
+        return int(self.sample_rate * max(0.0, seconds))
+
+    def subscribe(self, subscriber: BlockSubscriber) -> None:
+        with self._lock:
+            self._subscribers = (*self._subscribers, subscriber)
+
+    def unsubscribe(self, subscriber: BlockSubscriber) -> None:
+        with self._lock:
+            self._subscribers = tuple(sub for sub in self._subscribers if sub != subscriber)
+
+    def _callback(self, indata: np.ndarray, _frames: int, _time: Any, status: Any) -> None:
+        if status.input_overflow:
+            METRICS.increment("capture.input_overflows")
+        samples = indata[:, 0]
+        self.ring.write(samples)
+        self.last_audio_at = time.monotonic()
+        # Subscribers run on the PortAudio thread and must copy and return quickly.
+        end_position = self.ring.position
+        for subscriber in self._subscribers:
+            subscriber(end_position, samples)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._stream is None:
+                self.ring.reopen()
+                self._stream = sd.InputStream(
+                    samplerate=self.sample_rate,
+                    channels=1,
+                    dtype="int16",
+                    device=self.device,
+                    callback=self._callback,
+                )
+            if not self._stream.active:
+                self._stream.start()
+
+    def close(self) -> None:
+        with self._lock:
+            stream, self._stream = self._stream, None
+            self.ring.close()
+            if stream is not None:
+                stream.stop()
+                stream.close()
+
+    def restart(self) -> None:
+        METRICS.increment("capture.restarts")
+        try:
+            self.close()
+        except Exception:
+            logging.debug("Ignoring error while closing capture stream.", exc_info=True)
+        self.start()
+
+    def reader(self, start: int | None = None) -> RingReader:
+        self.start()
+        return RingReader(self.ring, start)
+
+    def mark_wake(self, position: int) -> None:
+        self.wake_position = position
+
+    def command_start(self, *, from_wake: bool, preroll_seconds: float) -> int:
+        anchor = self.position
+        if from_wake and self.wake_position is not None:
+            anchor = self.wake_position
+        self.wake_position = None
+        return max(self.ring.oldest, anchor - self.seconds_to_samples(preroll_seconds))
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.endpointer import StreamingEndpointer
+from openclaw_assistant.core.contracts import SpeculationObserver
+from openclaw_assistant.observability.metrics import METRICS
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+class CommandCaptureBuffer:
+    # Preallocated int16 capture plus a float32 output buffer sized for the
+    # longest command. Blocks are read straight into `next_block()` views and
+    # `audio()` converts once into the reused output, so a capture makes no
+    # per-block allocations. The returned audio is a view that the next
+    # capture overwrites; consumers that keep it must copy.
+    def __init__(self, max_samples: int) -> None:
+        if max_samples <= 0:
+            raise ValueError("Command capture buffer must hold at least one sample")
+        self.pcm = np.zeros(max_samples, dtype=np.int16)
+        self._output = np.zeros(max_samples, dtype=np.float32)
+        self.length = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.pcm.size
+
+    @property
+    def remaining(self) -> int:
+        return self.capacity - self.length
+
+    def reset(self) -> None:
+        self.length = 0
+
+    def next_block(self, frames: int) -> np.ndarray:
+        return self.pcm[self.length : self.length + min(frames, self.remaining)]
+
+    def commit(self, frames: int) -> None:
+        self.length = min(self.capacity, self.length + frames)
+
+    def truncate(self, frames: int) -> None:
+        self.length = max(0, min(self.length, frames))
+
+    def audio(self) -> np.ndarray:
+        out = self._output[: self.length]
+        np.multiply(self.pcm[: self.length], _INT16_SCALE, out=out, casting="unsafe")
+        return out
+
+
+def capture_until_endpoint(
+    read_into: Callable[[np.ndarray], bool],
+    endpointer: StreamingEndpointer,
+    buffer: CommandCaptureBuffer,
+    on_block: Callable[[np.ndarray], None] | None = None,
+    speculation: SpeculationObserver | None = None,
+) -> np.ndarray:
+    block_samples = endpointer.block_samples
+    endpointed = False
+    paused = False
+    buffer.reset()
+
+    while buffer.remaining:
+        block = buffer.next_block(block_samples)
+        if not read_into(block):
+            break
+        buffer.commit(block.size)
+        if on_block is not None:
+            on_block(block)
+        if endpointer.process(block):
+            endpointed = True
+            break
+        if speculation is not None and endpointer.speech_paused != paused:
+            paused = not paused
+            if paused:
+                speculation.speech_paused(buffer.audio().copy())
+            else:
+                speculation.speech_resumed()
+
+    if not endpointed and not buffer.remaining:
+        METRICS.increment("capture.max_length_hits")
+    METRICS.observe_ms("capture.command_ms", buffer.length * 1000.0 / endpointer.config.sample_rate)
+    if endpointer.endpoint_sample is not None:
+        buffer.truncate(endpointer.endpoint_sample)
+    return buffer.audio()
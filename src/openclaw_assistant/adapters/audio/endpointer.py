@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from openclaw_assistant.core.contracts import SpeechMap
+
+_NOISE_FLOOR_FAST_ALPHA = 0.3
+_BLOCK_HOPS = 3
+
+
+@dataclass(frozen=True)
+class EndpointerConfig:
+    sample_rate: int
+    min_seconds: float
+    trailing_silence_seconds: float
+    silence_threshold: float
+    hop_ms: float = 10.0
+    noise_ratio: float = 2.0
+    hysteresis: float = 1.5
+    noise_alpha: float = 0.05
+    pause_seconds: float = 0.25
+    max_seconds: float = 8.0
+
+
+class StreamingEndpointer:
+    # Hop-level speech/silence state machine. The silence threshold is the
+    # larger of the static OPENCLAW_SILENCE_THRESHOLD and an exponentially
+    # tracked noise floor times `noise_ratio`; speech must exceed that by
+    # `hysteresis` to (re)enter the speech state. The floor starts at the
+    # static threshold, falls quickly, rises slowly, and is frozen while speech
+    # is active: sustained speech would otherwise raise it past its own level
+    # and cut the command off. A room already louder than the speech level on
+    # the first hop is only bounded by OPENCLAW_RECORD_MAX_SECONDS.
+    def __init__(self, config: EndpointerConfig) -> None:
+        self.config = config
+        self.hop_samples = max(1, int(config.sample_rate * config.hop_ms / 1000.0))
+        self.min_hops = max(1, int(config.min_seconds * 1000.0 / config.hop_ms))
+        self.trailing_hops = max(1, int(config.trailing_silence_seconds * 1000.0 / config.hop_ms))
+        self.pause_hops = max(1, int(config.pause_seconds * 1000.0 / config.hop_ms))
+        self.block_samples = self.hop_samples * _BLOCK_HOPS
+        # Per-hop speech flags, sized for the longest capture; a longer input
+        # (a replayed file) grows it.
+        self._activity = np.zeros(
+            int(config.max_seconds * 1000.0 / config.hop_ms) + _BLOCK_HOPS, dtype=bool
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        self.noise_floor = self.config.silence_threshold / self.config.noise_ratio
+        self.in_speech = False
+        self.speech_seen = False
+        self.silent_hops = 0
+        self.hops = 0
+        self.endpoint_sample: int | None = None
+        self._pending = 0
+        # Reused float32 scratch for hop energies: carried-over samples from the
+        # previous block sit at the front, so steady-state blocks never allocate.
+        self._scratch = np.zeros(0, dtype=np.float32)
+        self._energies = np.zeros(0, dtype=np.float32)
+
+    @property
+    def activity(self) -> np.ndarray:
+        return self._activity[: self.hops]
+
+    @property
+    def silence_level(self) -> float:
+        return max(self.config.silence_threshold, self.noise_floor * self.config.noise_ratio)
+
+    @property
+    def speech_paused(self) -> bool:
+        # Silence after speech that has not yet lasted long enough to endpoint.
+        return self.speech_seen and self.silent_hops >= self.pause_hops
+
+    @property
+    def speech_level(self) -> float:
+        return self.silence_level * self.config.hysteresis
+
+    def hop_energies(self, pcm: np.ndarray) -> np.ndarray:
+        needed = self._pending + pcm.size
+        if self._scratch.size < needed:
+            grown = np.zeros(needed, dtype=np.float32)
+            grown[: self._pending] = self._scratch[: self._pending]
+            self._scratch = grown
+        np.copyto(self._scratch[self._pending : needed], pcm, casting="unsafe")
+        count = needed // self.hop_samples
+        usable = count * self.hop_samples
+        if self._energies.size < count:
+            self._energies = np.zeros(count, dtype=np.float32)
+        energies = self._energies[:count]
+        hops = self._scratch[:usable].reshape(count, self.hop_samples)
+        np.einsum("ij,ij->i", hops, hops, out=energies)
+        np.multiply(energies, np.float32(1.0 / self.hop_samples), out=energies)
+        np.sqrt(energies, out=energies)
+        self._pending = needed - usable
+        if count:
+            # Leftover is shorter than one hop, so source and target never overlap.
+            self._scratch[: self._pending] = self._scratch[usable:needed]
+        return energies
+
+    def _update_noise_floor(self, rms: float) -> None:
+        if self.in_speech:
+            return
+        alpha = _NOISE_FLOOR_FAST_ALPHA if rms < self.noise_floor else self.config.noise_alpha
+        self.noise_floor += alpha * (rms - self.noise_floor)
+
+    def process(self, pcm: np.ndarray) -> bool:
+        if self.endpoint_sample is not None:
+            return True
+        energies = self.hop_energies(pcm)
+        if self.hops + energies.size > self._activity.size:
+            grown = np.zeros(max(2 * self._activity.size, self.hops + energies.size), dtype=bool)
+            grown[: self.hops] = self._activity[: self.hops]
+            self._activity = grown
+        for rms in energies:
+            if self.in_speech:
+                self.in_speech = rms >= self.silence_level
+            else:
+                self.in_speech = rms >= self.speech_level
+            if self.in_speech:
+                self.speech_seen = True
+                self.silent_hops = 0
+            else:
+                self.silent_hops += 1
+            self._update_noise_floor(rms)
+            self._activity[self.hops] = self.in_speech
+            self.hops += 1
+            if self.hops >= self.min_hops and self.silent_hops >= self.trailing_hops:
+                self.endpoint_sample = self.hops * self.hop_samples
+                return True
+        return False
+
+    def speech_map(self, length: int, pad_ms: float) -> SpeechMap:
+        # Speech hops widened by `pad_ms` on both sides (onsets are detected a
+        # hop or two late and soft consonants sit below the threshold);
+        # regions whose padding overlaps are merged.
+        pad = int(self.config.sample_rate * pad_ms / 1000.0)
+        regions: list[tuple[int, int]] = []
+        edges = np.flatnonzero(np.diff(self.activity, prepend=False, append=False))
+        for start, stop in zip(edges[::2].tolist(), edges[1::2].tolist(), strict=True):
+            begin = max(0, start * self.hop_samples - pad)
+            end = min(length, stop * self.hop_samples + pad)
+            if regions and begin <= regions[-1][1]:
+                regions[-1] = (regions[-1][0], end)
+            elif begin < end:
+                regions.append((begin, end))
+        return SpeechMap(self.config.sample_rate, length, tuple(regions))
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+import numpy as np
+
+QueuedBlock = tuple[int, np.ndarray]
+
+
+class BoundedFrameQueue:
+    # Single producer (audio callback) / single consumer. The producer never
+    # blocks or takes a lock: deque append/popleft are atomic, and a full queue
+    # drops its oldest block.
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = max(1, maxsize)
+        self._blocks: deque[QueuedBlock] = deque(maxlen=self.maxsize)
+        self._ready = threading.Event()
+        self.dropped = 0
+        self.high_water = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._blocks)
+
+    def put(self, end_position: int, block: np.ndarray) -> None:
+        if len(self._blocks) >= self.maxsize:
+            self.dropped += 1
+        self._blocks.append((end_position, block))
+        self.high_water = max(self.high_water, len(self._blocks))
+        self._ready.set()
+
+    def get(self, timeout: float | None = None) -> QueuedBlock | None:
+        try:
+            return self._blocks.popleft()
+        except IndexError:
+            pass
+        self._ready.clear()
+        if not self._blocks and not self._ready.wait(timeout):
+            return None
+        try:
+            return self._blocks.popleft()
+        except IndexError:
+            return None
+
+    def clear(self) -> None:
+        self._blocks.clear()
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any, cast
 
 import numpy as np
 import sounddevice as sd
 
+from openclaw_assistant.adapters.audio.capture_bus import AudioCaptureBus
+from openclaw_assistant.adapters.audio.command_buffer import (
+    CommandCaptureBuffer,
+    capture_until_endpoint,
+)
+from openclaw_assistant.adapters.audio.endpointer import EndpointerConfig, StreamingEndpointer
+from openclaw_assistant.adapters.audio.ring_buffer import RingReader
+from openclaw_assistant.core.contracts import CaptureObserver, SpeculationObserver, SpeechMap
+
+_BUS_READ_TIMEOUT_SECONDS = 1.0
+
 
 class AudioInput:
     @staticmethod
@@ -31,40 +43,61 @@ class AudioInput:
         record_min_seconds: float,
         silence_seconds: float,
         silence_threshold: float,
+        endpointer: StreamingEndpointer | None = None,
+        buffer: CommandCaptureBuffer | None = None,
+        on_block: Callable[[np.ndarray], None] | None = None,
+        speculation: SpeculationObserver | None = None,
     ) -> np.ndarray:
-        chunk_seconds = 0.1
-        frames_per_chunk = int(sample_rate * chunk_seconds)
-        max_chunks = int(record_max_seconds / chunk_seconds)
-        min_chunks = max(1, int(record_min_seconds / chunk_seconds))
-        silent_limit = max(1, int(silence_seconds / chunk_seconds))
-
-        chunks: list[np.ndarray] = []
-        silent_chunks = 0
-
+        endpointer = endpointer or StreamingEndpointer(
+            EndpointerConfig(
+                sample_rate=sample_rate,
+                min_seconds=record_min_seconds,
+                trailing_silence_seconds=silence_seconds,
+                silence_threshold=silence_threshold,
+                max_seconds=record_max_seconds,
+            )
+        )
         with sd.InputStream(
             samplerate=sample_rate,
             channels=1,
             dtype="int16",
-            blocksize=frames_per_chunk,
+            blocksize=endpointer.block_samples,
             device=device,
         ) as stream:
-            for index in range(max_chunks):
-                frames, _ = stream.read(frames_per_chunk)
-                pcm = np.asarray(frames[:, 0], dtype=np.int16)
-                chunks.append(pcm)
 
-                rms = float(np.sqrt(np.mean(np.square(pcm.astype(np.float32)))))
-                if rms < silence_threshold:
-                    silent_chunks += 1
-                else:
-                    silent_chunks = 0
+            def _read_into(out: np.ndarray) -> bool:
+                data, _ = stream.read(out.size)
+                out[:] = data[:, 0]
+                return True
 
-                if index + 1 >= min_chunks and silent_chunks >= silent_limit:
-                    break
+            return capture_until_endpoint(
+                _read_into,
+                endpointer,
+                buffer or CommandCaptureBuffer(int(record_max_seconds * sample_rate)),
+                on_block,
+                speculation,
+            )
+
+    @staticmethod
+    def record_until_endpoint(
+        reader: RingReader,
+        endpointer: StreamingEndpointer,
+        *,
+        record_max_seconds: float,
+        buffer: CommandCaptureBuffer | None = None,
+        on_block: Callable[[np.ndarray], None] | None = None,
+        speculation: SpeculationObserver | None = None,
+    ) -> np.ndarray:
+        def _read_into(out: np.ndarray) -> bool:
+            return reader.read_into(out, timeout=_BUS_READ_TIMEOUT_SECONDS)
 
-        if not chunks:
-            return np.zeros(0, dtype=np.float32)
-        return np.concatenate(chunks).astype(np.float32) / 32768.0
+        return capture_until_endpoint(
+            _read_into,
+            endpointer,
+            buffer or CommandCaptureBuffer(int(record_max_seconds * endpointer.config.sample_rate)),
+            on_block,
+            speculation,
+        )
 
 
 class SilenceBoundedListener:
@@ -77,6 +110,16 @@ class SilenceBoundedListener:
         record_min_seconds: float,
         silence_seconds: float,
         silence_threshold: float,
+        capture_bus: AudioCaptureBus | None = None,
+        capture_from_wake: bool = False,
+        preroll_seconds: float = 0.0,
+        endpoint_hop_ms: float = 10.0,
+        endpoint_noise_ratio: float = 2.0,
+        endpoint_hysteresis: float = 1.5,
+        endpoint_noise_alpha: float = 0.05,
+        observer: CaptureObserver | None = None,
+        speech_pad_ms: float | None = None,
+        speculation_pause_ms: float = 250.0,
     ) -> None:
         self.sample_rate = sample_rate
         self.device = device
@@ -84,13 +127,85 @@ class SilenceBoundedListener:
         self.record_min_seconds = record_min_seconds
         self.silence_seconds = silence_seconds
         self.silence_threshold = silence_threshold
+        self.capture_bus = capture_bus
+        self.capture_from_wake = capture_from_wake
+        self.preroll_seconds = preroll_seconds
+        self.endpoint_hop_ms = endpoint_hop_ms
+        self.endpoint_noise_ratio = endpoint_noise_ratio
+        self.endpoint_hysteresis = endpoint_hysteresis
+        self.endpoint_noise_alpha = endpoint_noise_alpha
+        self.observer = observer
+        self.speech_pad_ms = speech_pad_ms
+        self.speculation_pause_ms = speculation_pause_ms
+        self.speculation: SpeculationObserver | None = None
+        self._buffer: CommandCaptureBuffer | None = None
+        self._speech_map: SpeechMap | None = None
+
+    def _capture_buffer(self, sample_rate: int) -> CommandCaptureBuffer:
+        max_samples = int(self.record_max_seconds * sample_rate)
+        if self._buffer is None or self._buffer.capacity != max_samples:
+            self._buffer = CommandCaptureBuffer(max_samples)
+        return self._buffer
+
+    def _endpointer(self, sample_rate: int) -> StreamingEndpointer:
+        return StreamingEndpointer(
+            EndpointerConfig(
+                sample_rate=sample_rate,
+                min_seconds=self.record_min_seconds,
+                trailing_silence_seconds=self.silence_seconds,
+                silence_threshold=self.silence_threshold,
+                hop_ms=self.endpoint_hop_ms,
+                noise_ratio=self.endpoint_noise_ratio,
+                hysteresis=self.endpoint_hysteresis,
+                noise_alpha=self.endpoint_noise_alpha,
+                pause_seconds=self.speculation_pause_ms / 1000.0,
+                max_seconds=self.record_max_seconds,
+            )
+        )
+
+    def _on_block(self, sample_rate: int) -> Callable[[np.ndarray], None] | None:
+        if self.observer is None:
+            return None
+        self.observer.capture_started(sample_rate, self._capture_buffer(sample_rate).capacity)
+        return self.observer.capture_block
+
+    def last_speech_map(self) -> SpeechMap | None:
+        return self._speech_map
+
+    def _remember_speech(self, audio: np.ndarray, endpointer: StreamingEndpointer) -> np.ndarray:
+        if self.speech_pad_ms is not None:
+            self._speech_map = endpointer.speech_map(audio.size, self.speech_pad_ms)
+        return audio
 
     def record_command_audio(self) -> np.ndarray:
-        return AudioInput.record_silence_bounded(
-            sample_rate=self.sample_rate,
-            device=self.device,
+        self._speech_map = None
+        if self.capture_bus is None:
+            endpointer = self._endpointer(self.sample_rate)
+            audio = AudioInput.record_silence_bounded(
+                sample_rate=self.sample_rate,
+                device=self.device,
+                record_max_seconds=self.record_max_seconds,
+                record_min_seconds=self.record_min_seconds,
+                silence_seconds=self.silence_seconds,
+                silence_threshold=self.silence_threshold,
+                endpointer=endpointer,
+                buffer=self._capture_buffer(self.sample_rate),
+                on_block=self._on_block(self.sample_rate),
+                speculation=self.speculation,
+            )
+            return self._remember_speech(audio, endpointer)
+        sample_rate = self.capture_bus.sample_rate
+        start = self.capture_bus.command_start(
+            from_wake=self.capture_from_wake,
+            preroll_seconds=self.preroll_seconds,
+        )
+        endpointer = self._endpointer(sample_rate)
+        audio = AudioInput.record_until_endpoint(
+            self.capture_bus.reader(start),
+            endpointer,
             record_max_seconds=self.record_max_seconds,
-            record_min_seconds=self.record_min_seconds,
-            silence_seconds=self.silence_seconds,
-            silence_threshold=self.silence_threshold,
+            buffer=self._capture_buffer(sample_rate),
+            on_block=self._on_block(sample_rate),
+            speculation=self.speculation,
         )
+        return self._remember_speech(audio, endpointer)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import sounddevice as sd
 
+from openclaw_assistant.adapters.audio.playback import StreamCallback
+
 
 class AudioOutput:
     @staticmethod
@@ -14,3 +16,19 @@ class AudioOutput:
         )
         stream.start()
         return stream
+
+    @staticmethod
+    def create_callback_stream(
+        sample_rate: int,
+        device: str | int | None,
+        callback: StreamCallback,
+    ) -> sd.OutputStream:
+        stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype="float32",
+            device=device,
+            callback=callback,
+        )
+        stream.start()
+        return stream
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from openclaw_assistant.observability.metrics import METRICS
+
+# (outdata, frames, time, status) as passed by a sounddevice callback stream.
+StreamCallback = Callable[[np.ndarray, int, Any, Any], None]
+ProgressCallback = Callable[[float, float], None]
+
+
+class PlaybackHandle:
+    # One queued utterance. Buffers may be appended until `close()`, so a
+    # pipelined reply can start playing before its last unit is synthesized.
+    # Done once closed and fully played, cancelled, or failed.
+    def __init__(
+        self,
+        engine: PlaybackEngine | None,
+        sample_rate: int,
+        on_progress: ProgressCallback | None = None,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.on_progress = on_progress
+        self.queued_samples = 0
+        self.played_samples = 0
+        self.closed = False
+        self.cancelled = False
+        self.error: BaseException | None = None
+        self._engine = engine
+        self._buffers: deque[np.ndarray] = deque()
+        self._offset = 0
+        self._done = threading.Event()
+
+    @classmethod
+    def completed(cls, sample_rate: int = 0) -> PlaybackHandle:
+        handle = cls(None, sample_rate)
+        handle.closed = True
+        handle._done.set()
+        return handle
+
+    @property
+    def played_seconds(self) -> float:
+        return self.played_samples / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def queued_seconds(self) -> float:
+        return self.queued_samples / self.sample_rate if self.sample_rate else 0.0
+
+    def append(self, audio: np.ndarray) -> None:
+        if self._engine is None:
+            raise RuntimeError("Playback handle is not attached to an engine.")
+        self._engine._append(self, np.asarray(audio, dtype=np.float32).reshape(-1))
+
+    def close(self) -> None:
+        if self._engine is not None:
+            self._engine._close(self)
+
+    def fail(self, error: BaseException) -> None:
+        self.error = error
+        self.cancel()
+
+    def cancel(self) -> None:
+        if self._engine is not None:
+            self._engine._cancel(self)
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        if not self._done.wait(timeout):
+            return False
+        if self.error is not None:
+            raise self.error
+        return True
+
+    def _read_into(self, out: np.ndarray) -> int:
+        filled = 0
+        while filled < out.size and self._buffers:
+            buffer = self._buffers[0]
+            count = min(out.size - filled, buffer.size - self._offset)
+            out[filled : filled + count] = buffer[self._offset : self._offset + count]
+            filled += count
+            self._offset += count
+            if self._offset >= buffer.size:
+                self._buffers.popleft()
+                self._offset = 0
+        self.played_samples += filled
+        return filled
+
+
+class PlaybackEngine:
+    # Plays queued handles in order from the output stream's callback, so
+    # callers only enqueue audio and never block on the device. The stream is
+    # opened on first use and kept running; it outputs silence when idle.
+    # An underrun is a callback that ran dry while an unfinished handle was
+    # still waiting for audio, or one the device itself reported.
+    def __init__(
+        self,
+        sample_rate: int,
+        open_stream: Callable[[StreamCallback], Any],
+    ) -> None:
+        self.sample_rate = sample_rate
+        self._open_stream = open_stream
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._queue: deque[PlaybackHandle] = deque()
+        self._stream: Any = None
+        self.underruns = 0
+
+    @property
+    def running(self) -> bool:
+        return self._stream is not None
+
+    def open(self, on_progress: ProgressCallback | None = None) -> PlaybackHandle:
+        handle = PlaybackHandle(self, self.sample_rate, on_progress)
+        with self._lock:
+            self._queue.append(handle)
+        return handle
+
+    def submit(
+        self,
+        audio: np.ndarray,
+        on_progress: ProgressCallback | None = None,
+    ) -> PlaybackHandle:
+        handle = self.open(on_progress)
+        handle.append(audio)
+        handle.close()
+        return handle
+
+    def start(self) -> bool:
+        # True when this call opened the stream.
+        with self._lock:
+            if self._stream is not None:
+                return False
+            self._stream = self._open_stream(self._callback)
+            return True
+
+    def drain(self, timeout: float | None = None) -> bool:
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._queue, timeout)
+
+    def cancel(self) -> None:
+        with self._lock:
+            cancelled = list(self._queue)
+            self._queue.clear()
+            self._idle.notify_all()
+        for handle in cancelled:
+            handle.cancelled = True
+            handle._done.set()
+
+    def close(self) -> None:
+        self.cancel()
+        with self._lock:
+            stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.stop()
+            finally:
+                stream.close()
+
+    def _append(self, handle: PlaybackHandle, audio: np.ndarray) -> None:
+        with self._lock:
+            if handle.closed or handle.cancelled:
+                return
+            handle._buffers.append(audio)
+            handle.queued_samples += audio.size
+        self.start()
+
+    def _close(self, handle: PlaybackHandle) -> None:
+        with self._lock:
+            handle.closed = True
+            if handle not in self._queue or (not handle._buffers and self._queue[0] is handle):
+                self._finish(handle)
+                return
+        # Handles queued behind others finish from the callback.
+        self.start()
+
+    def _cancel(self, handle: PlaybackHandle) -> None:
+        with self._lock:
+            if handle in self._queue:
+                self._queue.remove(handle)
+                self._idle.notify_all()
+            handle.cancelled = True
+            handle._buffers.clear()
+        handle._done.set()
+
+    def _finish(self, handle: PlaybackHandle) -> None:
+        # Called with the lock held.
+        if handle in self._queue:
+            self._queue.remove(handle)
+        handle._done.set()
+        self._idle.notify_all()
+
+    def _callback(self, outdata: np.ndarray, frames: int, _time: Any, status: Any) -> None:
+        out = outdata.reshape(-1)
+        filled = 0
+        starved = bool(status and getattr(status, "output_underflow", False))
+        progressed: list[PlaybackHandle] = []
+        with self._lock:
+            while filled < frames and self._queue:
+                handle = self._queue[0]
+                count = handle._read_into(out[filled:frames])
+                if count:
+                    progressed.append(handle)
+                filled += count
+                if handle._buffers:
+                    continue
+                if handle.closed:
+                    self._finish(handle)
+                    continue
+                # Waiting on synthesis; only a gap once playback has begun.
+                starved = starved or handle.played_samples > 0
+                break
+            if starved:
+                self.underruns += 1
+        out[filled:frames] = 0.0
+        if starved:
+            METRICS.increment("tts.playback.underruns")
+        for handle in progressed:
+            if handle.on_progress is not None:
+                handle.on_progress(handle.played_seconds, handle.queued_seconds)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+
+
+class PcmRingBuffer:
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=np.int16)
+        self._written = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def position(self) -> int:
+        return self._written
+
+    @property
+    def oldest(self) -> int:
+        return max(0, self._written - self.capacity)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write(self, samples: np.ndarray) -> None:
+        count = samples.size
+        if count == 0:
+            return
+        with self._cond:
+            data = samples[-self.capacity :]
+            start = (self._written + count - data.size) % self.capacity
+            first = min(data.size, self.capacity - start)
+            self._buffer[start : start + first] = data[:first]
+            if first < data.size:
+                self._buffer[: data.size - first] = data[first:]
+            self._written += count
+            self._cond.notify_all()
+
+    def copy_into(self, start: int, out: np.ndarray) -> int:
+        with self._cond:
+            # A reader lapped by the writer skips ahead to the oldest retained sample.
+            start = max(start, self.oldest)
+            offset = start % self.capacity
+            first = min(out.size, self.capacity - offset)
+            out[:first] = self._buffer[offset : offset + first]
+            if first < out.size:
+                out[first:] = self._buffer[: out.size - first]
+            return start
+
+    def wait_for(self, end: int, timeout: float | None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._written < end and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return self._written >= end
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def reopen(self) -> None:
+        with self._cond:
+            self._closed = False
+
+
+class RingReader:
+    def __init__(self, ring: PcmRingBuffer, start: int | None = None) -> None:
+        self.ring = ring
+        self.position = ring.position if start is None else max(start, ring.oldest)
+        self.overruns = 0
+
+    @property
+    def available(self) -> int:
+        return self.ring.position - self.position
+
+    def read(self, frames: int, timeout: float | None = None) -> np.ndarray | None:
+        out = np.empty(frames, dtype=np.int16)
+        if not self.read_into(out, timeout):
+            return None
+        return out
+
+    def read_into(self, out: np.ndarray, timeout: float | None = None) -> bool:
+        if not self.ring.wait_for(self.position + out.size, timeout):
+            return False
+        start = self.ring.copy_into(self.position, out)
+        if start != self.position:
+            self.overruns += 1
+        self.position = start + out.size
+        return True
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import wave
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+
+_SAMPLE_SCALE = {1: 128.0, 2: 32768.0, 4: 2147483648.0}
+_SAMPLE_DTYPE = {1: np.uint8, 2: np.int16, 4: np.int32}
+
+
+def read_wav(path: Path) -> tuple[np.ndarray, int]:
+    with wave.open(str(path), "rb") as handle:
+        width = handle.getsampwidth()
+        channels = handle.getnchannels()
+        sample_rate = handle.getframerate()
+        raw = handle.readframes(handle.getnframes())
+    if width not in _SAMPLE_DTYPE:
+        raise ValueError(f"Unsupported WAV sample width {width * 8} bits: {path}")
+    samples = np.frombuffer(raw, dtype=_SAMPLE_DTYPE[width]).astype(np.float32)
+    if width == 1:
+        samples -= 128.0
+    samples /= _SAMPLE_SCALE[width]
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples.astype(np.float32, copy=False), sample_rate
+
+
+def read_wav_int16(path: Path) -> tuple[np.ndarray, int]:
+    audio, sample_rate = read_wav(path)
+    return to_int16(audio), sample_rate
+
+
+def write_wav(path: Path, audio: np.ndarray, sample_rate: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pcm = audio if audio.dtype == np.int16 else to_int16(audio)
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(sample_rate)
+        handle.writeframes(pcm.tobytes())
+
+
+def to_int16(audio: np.ndarray) -> np.ndarray:
+    return np.clip(np.round(audio * 32767.0), -32768, 32767).astype(np.int16)
+
+
+def resample(audio: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    if source_rate == target_rate or audio.size == 0:
+        return audio.astype(np.float32, copy=False)
+    duration = audio.size / source_rate
+    target_size = max(1, int(round(duration * target_rate)))
+    source_times = np.arange(audio.size, dtype=np.float64) / source_rate
+    target_times = np.arange(target_size, dtype=np.float64) / target_rate
+    return cast(np.ndarray, np.interp(target_times, source_times, audio).astype(np.float32))
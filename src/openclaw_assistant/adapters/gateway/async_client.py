@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+
+from openclaw_assistant.adapters.gateway.openclaw_http import OpenClawHttpExecutor
+
+_END = object()
+
+
+class AsyncOpenClawClient:
+    # asyncio front for the pooled OpenClawHttpExecutor. requests stays the
+    # transport; calls run on a pool sized like the connection pool, so
+    # prompts and pre-connects never block the event loop.
+    def __init__(self, executor: OpenClawHttpExecutor) -> None:
+        self.executor = executor
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, executor.settings.openclaw_pool_size),
+            thread_name_prefix="gateway",
+        )
+
+    async def execute(self, prompt: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self.executor.execute, prompt)
+
+    async def preconnect(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._pool, self.executor.preconnect)
+
+    async def execute_stream(self, prompt: str) -> AsyncIterator[str]:
+        # One pool thread drains the blocking stream into an asyncio queue.
+        # Closing this generator stops that thread at the next delta, which
+        # closes the response and returns its connection to the pool.
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue[object] = asyncio.Queue()
+        stopped = threading.Event()
+
+        def _put(item: object) -> None:
+            try:
+                loop.call_soon_threadsafe(items.put_nowait, item)
+            except RuntimeError:
+                stopped.set()
+
+        def _pump() -> None:
+            try:
+                for delta in self.executor.execute_stream(prompt):
+                    if stopped.is_set():
+                        break
+                    _put(delta)
+            except Exception as error:
+                _put(error)
+            finally:
+                _put(_END)
+
+        pump = loop.run_in_executor(self._pool, _pump)
+        try:
+            while (item := await items.get()) is not _END:
+                if isinstance(item, Exception):
+                    raise item
+                yield str(item)
+            await pump
+        finally:
+            stopped.set()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
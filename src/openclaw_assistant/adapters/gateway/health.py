@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class LatencyTracker:
+    # Sliding window of recent time-to-headers samples for one endpoint.
+    def __init__(self, window: int = 64, min_samples: int = 5) -> None:
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float) -> None:
+        with self._lock:
+            self._samples.append(value_ms)
+
+    def percentile(self, percent: float) -> float | None:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        rank = math.ceil(percent / 100.0 * len(ordered))
+        return ordered[min(len(ordered), max(1, rank)) - 1]
+
+
+class CircuitBreaker:
+    # Opens after `failure_threshold` consecutive failures and skips the
+    # endpoint for `cooldown_seconds`. After that it is half-open: requests go
+    # through again, one failure re-opens it and one success closes it.
+    def __init__(
+        self,
+        failure_threshold: int,
+        cooldown_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return CLOSED
+            if self._clock() - self._opened_at < self.cooldown_seconds:
+                return OPEN
+            return HALF_OPEN
+
+    @property
+    def available(self) -> bool:
+        return self.state != OPEN
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
@@ -1,15 +1,173 @@
 from __future__ import annotations
 
+import codecs
+import json
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from openclaw_assistant.adapters.gateway.health import CircuitBreaker, LatencyTracker
 from openclaw_assistant.config.settings import Settings
+from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.events import ListenStarted
+from openclaw_assistant.observability.metrics import METRICS
+
+_PRECONNECT_TIMEOUT_SECONDS = 2.0
+_STREAM_HEADERS = {"Accept": "text/event-stream, application/json;q=0.9, text/plain;q=0.8"}
+_SSE_DONE = "[DONE]"
+
+
+def _delta_text(payload: Any) -> str:
+    # Deltas keep their whitespace; only whole responses are stripped.
+    if isinstance(payload, str):
+        return payload
+    if not isinstance(payload, dict):
+        return ""
+    for key in ("delta", "text", "content", "token", "response", "reply", "message", "output"):
+        value = payload.get(key)
+        if isinstance(value, str):
+            return value
+        if isinstance(value, dict):
+            return _delta_text(value)
+    choices = payload.get("choices")
+    if isinstance(choices, list) and choices:
+        return _delta_text(choices[0])
+    return ""
+
+
+def iter_sse_deltas(lines: Iterable[str]) -> Iterator[str]:
+    # `data:` lines accumulate until a blank line ends the event; JSON events
+    # are reduced to their text delta and `[DONE]` ends the stream.
+    data: list[str] = []
+    for line in _terminated(lines):
+        if line.startswith("data:"):
+            data.append(line[5:].removeprefix(" "))
+            continue
+        if line or not data:
+            continue
+        event, data = "\n".join(data), []
+        if event.strip() == _SSE_DONE:
+            return
+        try:
+            delta = _delta_text(json.loads(event))
+        except ValueError:
+            delta = event
+        if delta:
+            yield delta
+
+
+def _iter_text(response: requests.Response) -> Iterator[str]:
+    # chunk_size=None yields each chunk as it arrives instead of filling a
+    # fixed-size read first. requests assumes latin-1 for text/* without a
+    # charset; streaming gateways send UTF-8.
+    declared = "charset=" in response.headers.get("content-type", "").lower()
+    encoding = response.encoding if declared and response.encoding else "utf-8"
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for chunk in response.iter_content(chunk_size=None):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+def _terminated(lines: Iterable[str]) -> Iterator[str]:
+    # A stream that ends without a blank line still completes its last event.
+    yield from lines
+    yield ""
+
+
+class _CountingAdapter(HTTPAdapter):
+    # Remembers the connection pool requests are sent through, whose
+    # `num_connections` counts every socket it has opened.
+    pool: Any = None
+
+    def get_connection_with_tls_context(self, *args: Any, **kwargs: Any) -> Any:
+        self.pool = super().get_connection_with_tls_context(*args, **kwargs)
+        return self.pool
+
+
+class GatewayEndpoint:
+    # One gateway replica: its own pooled keep-alive session, latency window
+    # and circuit breaker.
+    def __init__(self, url: str, settings: Settings) -> None:
+        self.url = url
+        self.session = requests.Session()
+        self.adapter = _CountingAdapter(
+            pool_connections=1,
+            pool_maxsize=max(1, settings.openclaw_pool_size),
+            max_retries=Retry(
+                total=settings.openclaw_retries,
+                connect=settings.openclaw_retries,
+                read=settings.openclaw_retries,
+                status=0,
+                other=0,
+                backoff_factor=settings.openclaw_retry_backoff_seconds,
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            ),
+        )
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        self.latency = LatencyTracker()
+        self.breaker = CircuitBreaker(
+            settings.openclaw_breaker_failures,
+            settings.openclaw_breaker_cooldown_seconds,
+        )
+
+    def connections_opened(self) -> int:
+        pool = self.adapter.pool
+        return 0 if pool is None else int(pool.num_connections)
+
+
+def _close_response(future: Future[requests.Response]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
 
 
 class OpenClawHttpExecutor:
+    # Keeps a pooled keep-alive session per gateway endpoint. Connect failures
+    # are retried with backoff for every method (nothing was sent yet); read
+    # failures only for idempotent methods, so a prompt is never posted twice
+    # to one endpoint. With several endpoints a prompt that has no response
+    # headers after the primary's latency percentile is also sent to the next
+    # endpoint; the first response wins and the other is closed unread.
+    # Endpoints whose circuit breaker is open are skipped. `on_event`
+    # pre-opens connections when listening starts.
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        urls = dict.fromkeys(
+            url.strip() for url in (settings.openclaw_rest_url, *settings.openclaw_fallback_urls)
+        )
+        self.endpoints = [GatewayEndpoint(url, settings) for url in urls if url]
+        self._hedge_pool: ThreadPoolExecutor | None = None
+        if len(self.endpoints) > 1:
+            self._hedge_pool = ThreadPoolExecutor(
+                max_workers=max(2, settings.openclaw_pool_size) * len(self.endpoints),
+                thread_name_prefix="gateway-hedge",
+            )
+        self._stats_lock = threading.Lock()
+        self._opened = 0
+        self._reused = 0
 
     @staticmethod
     def extract_response(payload: dict[str, Any], fallback_text: str = "") -> str:
@@ -19,16 +177,191 @@ class OpenClawHttpExecutor:
                 return value.strip()
         return fallback_text.strip()
 
+    @property
+    def reuse_rate(self) -> float:
+        with self._stats_lock:
+            total = self._opened + self._reused
+            return self._reused / total if total else 0.0
+
+    def _candidates(self) -> list[GatewayEndpoint]:
+        # When every breaker is open the endpoints are tried anyway, in order,
+        # so the caller sees the real error instead of an empty list.
+        available = [endpoint for endpoint in self.endpoints if endpoint.breaker.available]
+        if len(available) < len(self.endpoints):
+            METRICS.increment("gateway.endpoint_skips", len(self.endpoints) - len(available))
+        return available or list(self.endpoints)
+
+    def _hedge_delay(self, endpoint: GatewayEndpoint) -> float | None:
+        percentile = self.settings.openclaw_hedge_percentile
+        if percentile <= 0:
+            return None
+        delay_ms = endpoint.latency.percentile(percentile)
+        if delay_ms is None:
+            delay_ms = self.settings.openclaw_hedge_delay_ms
+        return delay_ms / 1000.0
+
+    def preconnect(self) -> None:
+        # HEAD opens (or revalidates) a pooled connection; the status does not
+        # matter, only that the socket is left idle in the pool. The hedge
+        # target is warmed too.
+        for endpoint in self._candidates()[:2]:
+            started = time.monotonic()
+            try:
+                endpoint.session.head(
+                    endpoint.url,
+                    timeout=min(
+                        self.settings.openclaw_timeout_seconds, _PRECONNECT_TIMEOUT_SECONDS
+                    ),
+                    allow_redirects=False,
+                ).close()
+            except requests.RequestException as error:
+                METRICS.increment("gateway.preconnect_failures")
+                logging.debug("Gateway pre-connect to %s failed: %s", endpoint.url, error)
+                continue
+            METRICS.observe_ms("gateway.preconnect_ms", (time.monotonic() - started) * 1000)
+
+    def on_event(self, event: object, _context: RuntimeContext) -> None:
+        if isinstance(event, ListenStarted) and self.settings.openclaw_preconnect:
+            threading.Thread(target=self.preconnect, name="gateway-preconnect", daemon=True).start()
+
+    def _open(
+        self,
+        endpoint: GatewayEndpoint,
+        body: dict[str, Any],
+        headers: dict[str, str] | None,
+    ) -> requests.Response:
+        # Returns once the response headers are in; the body is left unread.
+        opened_before = endpoint.connections_opened()
+        try:
+            response = endpoint.session.post(
+                endpoint.url,
+                json=body,
+                headers=headers,
+                timeout=self.settings.openclaw_timeout_seconds,
+                stream=True,
+            )
+        except requests.RequestException:
+            endpoint.breaker.record_failure()
+            raise
+        self._record(endpoint, opened_before, response)
+        if response.status_code >= 500:
+            endpoint.breaker.record_failure()
+        else:
+            endpoint.breaker.record_success()
+            endpoint.latency.observe(response.elapsed.total_seconds() * 1000)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        return response
+
+    def _request(
+        self,
+        body: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
+        candidates = self._candidates()
+        if self._hedge_pool is None or len(candidates) == 1:
+            return self._open(candidates[0], body, headers)
+        remaining = deque(candidates)
+        pending: dict[Future[requests.Response], GatewayEndpoint] = {}
+        errors: list[BaseException] = []
+        hedged = False
+
+        def _launch() -> None:
+            assert self._hedge_pool is not None
+            endpoint = remaining.popleft()
+            pending[self._hedge_pool.submit(self._open, endpoint, body, headers)] = endpoint
+
+        _launch()
+        delay = self._hedge_delay(candidates[0])
+        while pending:
+            timeout = delay if remaining and not hedged else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                hedged = True
+                METRICS.increment("gateway.hedges")
+                _launch()
+                continue
+            for future in done:
+                endpoint = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                    loser.add_done_callback(_close_response)
+                if endpoint is not candidates[0]:
+                    METRICS.increment("gateway.hedge_wins" if hedged else "gateway.failovers")
+                return future.result()
+            if not pending and remaining:
+                _launch()
+        raise errors[-1]
+
     def execute(self, prompt: str) -> str:
-        response = requests.post(
-            self.settings.openclaw_rest_url,
-            json={"text": prompt},
-            timeout=self.settings.openclaw_timeout_seconds,
-        )
-        response.raise_for_status()
-        content_type = response.headers.get("content-type", "")
-        if "application/json" in content_type.lower():
-            payload = response.json()
-            if isinstance(payload, dict):
-                return self.extract_response(payload)
-        return response.text.strip()
+        started = time.monotonic()
+        with self._request({"text": prompt}) as response:
+            content_type = response.headers.get("content-type", "")
+            if "application/json" in content_type.lower():
+                payload = response.json()
+                if isinstance(payload, dict):
+                    text = self.extract_response(payload)
+                else:
+                    text = response.text.strip()
+            else:
+                text = response.text.strip()
+        METRICS.observe_ms("gateway.request_ms", (time.monotonic() - started) * 1000)
+        return text
+
+    def execute_stream(self, prompt: str) -> Iterator[str]:
+        # Accepts SSE, chunked plain text, or a plain JSON reply from gateways
+        # that ignore `stream`.
+        started = time.monotonic()
+        with self._request({"text": prompt, "stream": True}, _STREAM_HEADERS) as response:
+            content_type = response.headers.get("content-type", "").lower()
+            deltas: Iterable[str]
+            if "text/event-stream" in content_type:
+                deltas = iter_sse_deltas(_iter_lines(_iter_text(response)))
+            elif "application/json" in content_type:
+                payload = response.json()
+                if isinstance(payload, dict):
+                    deltas = [self.extract_response(payload)]
+                else:
+                    deltas = [response.text.strip()]
+            else:
+                deltas = _iter_text(response)
+            first = True
+            for delta in deltas:
+                if not delta:
+                    continue
+                if first:
+                    elapsed_ms = (time.monotonic() - started) * 1000
+                    METRICS.observe_ms("gateway.first_delta_ms", elapsed_ms)
+                    first = False
+                yield delta
+        METRICS.observe_ms("gateway.request_ms", (time.monotonic() - started) * 1000)
+
+    def _record(
+        self,
+        endpoint: GatewayEndpoint,
+        opened_before: int,
+        response: requests.Response,
+    ) -> None:
+        reused = endpoint.connections_opened() == opened_before
+        with self._stats_lock:
+            if reused:
+                self._reused += 1
+            else:
+                self._opened += 1
+        METRICS.increment("gateway.connections_reused" if reused else "gateway.connections_opened")
+        METRICS.set_gauge("gateway.connection_reuse_rate", self.reuse_rate)
+        # `elapsed` stops when the response headers have been parsed.
+        METRICS.observe_ms("gateway.ttfb_ms", response.elapsed.total_seconds() * 1000)
+
+    def close(self) -> None:
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+        for endpoint in self.endpoints:
+            endpoint.session.close()
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import time
+
+
+class StubActionExecutor:
+    # Stands in for the OpenClaw gateway in offline runs: echoes the prompt
+    # through `template` after an optional fixed latency.
+    def __init__(
+        self, *, template: str = "You said: {prompt}", latency_seconds: float = 0.0
+    ) -> None:
+        self.template = template
+        self.latency_seconds = latency_seconds
+
+    def execute(self, prompt: str) -> str:
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        return self.template.format(prompt=prompt)
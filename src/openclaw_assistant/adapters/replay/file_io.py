@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.endpointer import EndpointerConfig, StreamingEndpointer
+from openclaw_assistant.adapters.audio.wav_io import read_wav, resample, to_int16, write_wav
+from openclaw_assistant.core.contracts import SpeechMap
+
+Synthesize = Callable[[str], tuple[np.ndarray, int]]
+
+
+class ReplayCursor:
+    # Shared position in the corpus: the wake detector advances it, the
+    # listener and speaker read the current clip.
+    def __init__(self, clips: Sequence[Path], root: Path) -> None:
+        self.clips = list(clips)
+        self.root = root
+        self.index = -1
+
+    @property
+    def current(self) -> Path:
+        if not 0 <= self.index < len(self.clips):
+            raise RuntimeError("Replay cursor is not positioned on a clip.")
+        return self.clips[self.index]
+
+    @property
+    def relative(self) -> Path:
+        return self.current.relative_to(self.root)
+
+    def advance(self) -> bool:
+        if self.index + 1 >= len(self.clips):
+            return False
+        self.index += 1
+        return True
+
+
+class FileWakewordDetector:
+    # Every clip counts as one wake; the stop event ends the wake loop once
+    # the corpus is exhausted.
+    def __init__(
+        self,
+        cursor: ReplayCursor,
+        stop_event: threading.Event,
+        *,
+        sample_rate: int = 16000,
+        frame_length: int = 512,
+    ) -> None:
+        self.cursor = cursor
+        self.stop_event = stop_event
+        self.sample_rate = sample_rate
+        self.frame_length = frame_length
+
+    def audio_params(self) -> tuple[int, int]:
+        return self.sample_rate, self.frame_length
+
+    def wait_for_wakeword(self, timeout_seconds: float | None = None) -> bool:
+        if self.cursor.advance():
+            return True
+        self.stop_event.set()
+        return False
+
+    def pause(self) -> None:
+        return None
+
+    def resume(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class FileListener:
+    # With an endpointer config the clip is also run through the live
+    # endpointer so the transcribe stage sees the same speech map.
+    def __init__(
+        self,
+        cursor: ReplayCursor,
+        *,
+        sample_rate: int,
+        endpointer: EndpointerConfig | None = None,
+        speech_pad_ms: float | None = None,
+    ) -> None:
+        self.cursor = cursor
+        self.sample_rate = sample_rate
+        self.endpointer = endpointer
+        self.speech_pad_ms = speech_pad_ms
+        self._speech_map: SpeechMap | None = None
+
+    def last_speech_map(self) -> SpeechMap | None:
+        return self._speech_map
+
+    def record_command_audio(self) -> np.ndarray:
+        audio, source_rate = read_wav(self.cursor.current)
+        audio = resample(audio, source_rate, self.sample_rate)
+        self._speech_map = None
+        if self.endpointer is not None and self.speech_pad_ms is not None:
+            endpointer = StreamingEndpointer(self.endpointer)
+            endpointer.process(to_int16(audio))
+            self._speech_map = endpointer.speech_map(audio.size, self.speech_pad_ms)
+        return audio
+
+
+class FileSpeaker:
+    # Mirrors the corpus layout under `output_dir`, one file per spoken
+    # response; without a synthesizer only the text is written.
+    def __init__(
+        self,
+        cursor: ReplayCursor,
+        output_dir: Path,
+        synthesize: Synthesize | None = None,
+    ) -> None:
+        self.cursor = cursor
+        self.output_dir = output_dir
+        self.synthesize = synthesize
+        self._spoken: dict[int, int] = {}
+
+    def _target(self, suffix: str) -> Path:
+        count = self._spoken.get(self.cursor.index, 0)
+        self._spoken[self.cursor.index] = count + 1
+        relative = self.cursor.relative
+        stem = f"{relative.stem}-{count}" if count else relative.stem
+        return self.output_dir / relative.parent / f"{stem}{suffix}"
+
+    def speak(self, text: str) -> None:
+        if not text:
+            return
+        if self.synthesize is None:
+            target = self._target(".txt")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(text + "\n")
+            return
+        audio, sample_rate = self.synthesize(text)
+        write_wav(self._target(".wav"), audio, sample_rate)
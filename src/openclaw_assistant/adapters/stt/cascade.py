@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+import numpy as np
+
+from openclaw_assistant.config.settings import Settings
+from openclaw_assistant.observability.metrics import METRICS
+
+FAST_TIER = "fast"
+FULL_TIER = "full"
+
+TierCallback = Callable[[str, str], None]
+
+
+@dataclass(frozen=True)
+class EscalationPolicy:
+    min_avg_logprob: float
+    max_no_speech_prob: float
+    max_fast_seconds: float
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> EscalationPolicy:
+        return cls(
+            min_avg_logprob=settings.stt_escalate_avg_logprob,
+            max_no_speech_prob=settings.stt_escalate_no_speech_prob,
+            max_fast_seconds=settings.stt_escalate_seconds,
+        )
+
+    def skip_fast(self, audio_seconds: float) -> bool:
+        return audio_seconds > self.max_fast_seconds
+
+    def reason(self, segments: Sequence[Any]) -> str:
+        # Empty string means the fast tier's transcript is kept.
+        if not any(segment.text.strip() for segment in segments):
+            return "empty"
+        if min(segment.avg_logprob for segment in segments) < self.min_avg_logprob:
+            return "avg_logprob"
+        if max(segment.no_speech_prob for segment in segments) > self.max_no_speech_prob:
+            return "no_speech"
+        return ""
+
+
+def _join(segments: Sequence[Any]) -> str:
+    return " ".join(segment.text.strip() for segment in segments if segment.text.strip()).strip()
+
+
+class CascadedWhisperTranscriber:
+    # Holds a small and a large Whisper model. Short utterances are decoded
+    # on the fast tier and re-decoded on the full tier only when the policy
+    # rejects the result; long ones go straight to the full tier.
+    # `on_tier(tier, reason)` runs once per utterance on the caller's thread.
+    def __init__(
+        self,
+        fast_model: Any,
+        full_model: Any,
+        *,
+        options: dict[str, Any],
+        policy: EscalationPolicy,
+        sample_rate: int = 16000,
+    ) -> None:
+        self.fast_model = fast_model
+        self.full_model = full_model
+        self.options = options
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self.on_tier: TierCallback | None = None
+        self.utterances = 0
+        self.escalations = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> CascadedWhisperTranscriber:
+        from openclaw_assistant.adapters.stt.faster_whisper import (
+            decode_options,
+            load_whisper_model,
+        )
+
+        return cls(
+            load_whisper_model(replace(settings, whisper_model=settings.whisper_fast_model)),
+            load_whisper_model(settings),
+            options=decode_options(settings),
+            policy=EscalationPolicy.from_settings(settings),
+            sample_rate=settings.command_sample_rate,
+        )
+
+    @property
+    def escalation_rate(self) -> float:
+        return self.escalations / self.utterances if self.utterances else 0.0
+
+    def warm_up(self) -> None:
+        from openclaw_assistant.adapters.stt.faster_whisper import warm_up_model
+
+        warm_up_model(self.fast_model, self.options)
+        warm_up_model(self.full_model, self.options)
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        return self._transcribe(audio, self.options)
+
+    def transcribe_speech(self, audio: np.ndarray) -> str:
+        return self._transcribe(audio, {**self.options, "vad_filter": False})
+
+    def _decode(
+        self, model: Any, tier: str, audio: np.ndarray, options: dict[str, Any]
+    ) -> list[Any]:
+        started = time.monotonic()
+        segments, _ = model.transcribe(audio, **options)
+        segments = list(segments)
+        METRICS.observe_ms(f"stt.{tier}_decode_ms", (time.monotonic() - started) * 1000)
+        return segments
+
+    def _transcribe(self, audio: np.ndarray, options: dict[str, Any]) -> str:
+        if audio.size == 0:
+            return ""
+        if self.policy.skip_fast(audio.size / self.sample_rate):
+            reason = "long"
+        else:
+            segments = self._decode(self.fast_model, FAST_TIER, audio, options)
+            reason = self.policy.reason(segments)
+        if reason:
+            segments = self._decode(self.full_model, FULL_TIER, audio, options)
+        tier = FULL_TIER if reason else FAST_TIER
+        self.utterances += 1
+        self.escalations += bool(reason)
+        METRICS.increment(f"stt.tier.{tier}")
+        METRICS.set_gauge("stt.escalation_rate", self.escalation_rate)
+        logging.debug("Transcribed on the %s tier (%s).", tier, reason or "accepted")
+        if self.on_tier is not None:
+            self.on_tier(tier, reason)
+        return _join(segments)
@@ -1,32 +1,86 @@
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 from openclaw_assistant.config.settings import Settings
 
+_WHISPER_SAMPLE_RATE = 16000
+
+
+def load_whisper_model(settings: Settings, *, cpu_threads: int = 0) -> WhisperModel:
+    return WhisperModel(
+        settings.whisper_model,
+        device=settings.whisper_device,
+        compute_type=settings.whisper_compute_type,
+        download_root=str(settings.whisper_download_root),
+        cpu_threads=cpu_threads,
+    )
+
+
+def decode_options(settings: Settings) -> dict[str, Any]:
+    return {
+        "language": settings.whisper_language,
+        "beam_size": 1,
+        "best_of": 1,
+        "temperature": 0.0,
+        "condition_on_previous_text": False,
+        "vad_filter": True,
+    }
+
+
+def warm_up_model(model: WhisperModel, options: dict[str, Any]) -> None:
+    # One second of faint noise: once as configured so the VAD session loads,
+    # then with VAD off so the encoder and decoder run. Segments are lazy.
+    audio = np.random.default_rng(0).normal(0.0, 0.01, _WHISPER_SAMPLE_RATE).astype(np.float32)
+    if options.get("vad_filter"):
+        list(model.transcribe(audio, **options)[0])
+    segments, _ = model.transcribe(audio, **{**options, "vad_filter": False})
+    list(segments)
+
 
 class FasterWhisperTranscriber:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self.model = WhisperModel(
-            settings.whisper_model,
-            device=settings.whisper_device,
-            compute_type=settings.whisper_compute_type,
-            download_root=str(settings.whisper_download_root),
-        )
+        self.model = load_whisper_model(settings)
+
+    def warm_up(self) -> None:
+        warm_up_model(self.model, decode_options(self.settings))
 
     def transcribe(self, audio: np.ndarray) -> str:
+        return self._transcribe(audio, decode_options(self.settings))
+
+    def transcribe_speech(self, audio: np.ndarray) -> str:
+        return self._transcribe(audio, {**decode_options(self.settings), "vad_filter": False})
+
+    def _transcribe(self, audio: np.ndarray, options: dict[str, Any]) -> str:
         if audio.size == 0:
             return ""
-        segments, _ = self.model.transcribe(
-            audio,
-            language=self.settings.whisper_language,
-            beam_size=1,
-            best_of=1,
-            temperature=0.0,
-            condition_on_previous_text=False,
-            vad_filter=True,
-        )
+        segments, _ = self.model.transcribe(audio, **options)
         text_parts = [segment.text.strip() for segment in segments if segment.text.strip()]
         return " ".join(text_parts).strip()
+
+
+class BatchedWhisperDecoder:
+    # faster-whisper's batched pipeline: each entry of `clip_timestamps`
+    # (seconds) is decoded as one batch element; without them the audio is
+    # split by VAD and its chunks are batched.
+    def __init__(self, settings: Settings, *, batch_size: int, cpu_threads: int = 0) -> None:
+        self.settings = settings
+        self.batch_size = batch_size
+        self.pipeline = BatchedInferencePipeline(
+            load_whisper_model(settings, cpu_threads=cpu_threads)
+        )
+
+    def decode(
+        self,
+        audio: np.ndarray,
+        clip_timestamps: list[dict[str, float]] | None = None,
+    ) -> list[Any]:
+        options: dict[str, Any] = {**decode_options(self.settings), "batch_size": self.batch_size}
+        if clip_timestamps is not None:
+            options["clip_timestamps"] = clip_timestamps
+        segments, _ = self.pipeline.transcribe(audio, **options)
+        return list(segments)
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from openclaw_assistant.config.settings import Settings
+from openclaw_assistant.observability.metrics import METRICS
+
+PartialCallback = Callable[[str, str], None]
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+_NORMALIZE = re.compile(r"[^\w']+")
+
+
+@dataclass(frozen=True)
+class TimedWord:
+    start: float
+    end: float
+    text: str
+
+
+def _norm(word: str) -> str:
+    return _NORMALIZE.sub("", word.lower())
+
+
+def _join(words: list[TimedWord]) -> str:
+    return " ".join(word.text for word in words).strip()
+
+
+class LocalAgreement:
+    # A word is committed once two consecutive hypotheses agree on it (and on
+    # everything before it). Later decodes start at the last committed word's
+    # end, so only the uncommitted tail is ever re-decoded.
+    def __init__(self) -> None:
+        self.committed: list[TimedWord] = []
+        self.tentative: list[TimedWord] = []
+
+    def reset(self) -> None:
+        self.committed = []
+        self.tentative = []
+
+    @property
+    def committed_end(self) -> float:
+        return self.committed[-1].end if self.committed else 0.0
+
+    @property
+    def committed_text(self) -> str:
+        return _join(self.committed)
+
+    @property
+    def tentative_text(self) -> str:
+        return _join(self.tentative)
+
+    def update(self, hypothesis: list[TimedWord]) -> None:
+        agreed = 0
+        limit = min(len(self.tentative), len(hypothesis))
+        while agreed < limit and _norm(self.tentative[agreed].text) == _norm(
+            hypothesis[agreed].text
+        ):
+            agreed += 1
+        self.committed.extend(hypothesis[:agreed])
+        self.tentative = hypothesis[agreed:]
+
+
+class StreamingWhisperTranscriber:
+    # Observes command capture (see SilenceBoundedListener) and re-decodes the
+    # uncommitted tail every `step_seconds` of new audio on a worker thread.
+    # `transcribe()` then only decodes audio after the last committed word.
+    # `on_partial(committed, tentative)` runs on the decode thread.
+    def __init__(
+        self,
+        model: Any,
+        *,
+        options: dict[str, Any],
+        step_seconds: float,
+        sample_rate: int = 16000,
+    ) -> None:
+        self.model = model
+        self.options = {**options, "word_timestamps": True}
+        self.step_seconds = step_seconds
+        self.sample_rate = sample_rate
+        self.on_partial: PartialCallback | None = None
+        self.agreement = LocalAgreement()
+        self._cond = threading.Condition()
+        self._decode_lock = threading.Lock()
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._length = 0
+        self._decoded_length = 0
+        self._session = 0
+        self._active = False
+        self._fed = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> StreamingWhisperTranscriber:
+        from openclaw_assistant.adapters.stt.faster_whisper import (
+            decode_options,
+            load_whisper_model,
+        )
+
+        return cls(
+            load_whisper_model(settings),
+            options=decode_options(settings),
+            step_seconds=settings.stt_stream_step_seconds,
+            sample_rate=settings.command_sample_rate,
+        )
+
+    def warm_up(self) -> None:
+        from openclaw_assistant.adapters.stt.faster_whisper import warm_up_model
+
+        with self._decode_lock:
+            warm_up_model(self.model, self.options)
+
+    @property
+    def _step_samples(self) -> int:
+        return max(1, int(self.step_seconds * self.sample_rate))
+
+    def capture_started(self, sample_rate: int, max_samples: int) -> None:
+        with self._cond:
+            self.sample_rate = sample_rate
+            if self._audio.size < max_samples:
+                self._audio = np.zeros(max_samples, dtype=np.float32)
+            self._length = 0
+            self._decoded_length = 0
+            self._session += 1
+            self.agreement.reset()
+            self._active = True
+            self._fed = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="stt-stream", daemon=True)
+                self._thread.start()
+
+    def capture_block(self, pcm: np.ndarray) -> None:
+        with self._cond:
+            if not self._active:
+                return
+            count = min(pcm.size, self._audio.size - self._length)
+            target = self._audio[self._length : self._length + count]
+            np.multiply(pcm[:count], _INT16_SCALE, out=target, casting="unsafe")
+            self._length += count
+            if self._length - self._decoded_length >= self._step_samples:
+                self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._active = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _decode(self, audio: np.ndarray, offset_samples: int, prompt: str) -> list[TimedWord]:
+        if audio.size == 0:
+            return []
+        offset = offset_samples / self.sample_rate
+        segments, _ = self.model.transcribe(audio, initial_prompt=prompt or None, **self.options)
+        words = []
+        for segment in segments:
+            for word in segment.words or []:
+                text = word.word.strip()
+                if text:
+                    words.append(TimedWord(word.start + offset, word.end + offset, text))
+        return words
+
+    def _committed_sample(self) -> int:
+        return int(self.agreement.committed_end * self.sample_rate)
+
+    def _ready(self) -> bool:
+        return self._active and self._length - self._decoded_length >= self._step_samples
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and not self._ready():
+                    self._cond.wait()
+                if self._closed:
+                    return
+                session = self._session
+                self._decoded_length = self._length
+            with self._decode_lock:
+                with self._cond:
+                    if session != self._session or not self._active:
+                        continue
+                    start = self._committed_sample()
+                    # Copied so the next capture can reuse the buffer mid-decode.
+                    window = self._audio[start : self._length].copy()
+                    prompt = self.agreement.committed_text
+                started = time.monotonic()
+                try:
+                    hypothesis = self._decode(window, start, prompt)
+                except Exception:
+                    logging.debug("Partial decode failed.", exc_info=True)
+                    continue
+                METRICS.observe_ms("stt.partial_decode_ms", (time.monotonic() - started) * 1000)
+                with self._cond:
+                    if session != self._session or not self._active:
+                        continue
+                    self.agreement.update(hypothesis)
+                    committed = self.agreement.committed_text
+                    tentative = self.agreement.tentative_text
+            if self.on_partial is not None:
+                self.on_partial(committed, tentative)
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        with self._cond:
+            self._active = False
+        with self._decode_lock:
+            with self._cond:
+                start = self._committed_sample()
+                committed = list(self.agreement.committed)
+                fed, self._fed = self._fed, False
+            # Audio that did not come through capture_started() is decoded whole.
+            if not fed or start > audio.size:
+                start, committed = 0, []
+            started = time.monotonic()
+            tail = self._decode(audio[start:], start, _join(committed))
+        METRICS.observe_ms("stt.final_decode_ms", (time.monotonic() - started) * 1000)
+        METRICS.observe_ms("stt.final_tail_ms", (audio.size - start) * 1000.0 / self.sample_rate)
+        return _join(committed + tail)
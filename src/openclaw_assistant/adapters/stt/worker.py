@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import queue
+import threading
+import time
+from collections.abc import Callable
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+
+from openclaw_assistant.adapters.stt.cascade import CascadedWhisperTranscriber, TierCallback
+from openclaw_assistant.config.settings import Settings
+from openclaw_assistant.observability.metrics import METRICS
+
+TranscriberFactory = Callable[[Settings], Any]
+
+# Request ids start at 1; id 0 carries the worker's startup status.
+_READY_ID = 0
+_SLOTS = 2
+_POLL_SECONDS = 0.05
+_JOIN_SECONDS = 2.0
+
+
+def load_transcriber(settings: Settings) -> Any:
+    if settings.whisper_fast_model:
+        return CascadedWhisperTranscriber.from_settings(settings)
+    from openclaw_assistant.adapters.stt.faster_whisper import FasterWhisperTranscriber
+
+    return FasterWhisperTranscriber(settings)
+
+
+def _serve(
+    factory: TranscriberFactory,
+    settings: Settings,
+    shm_name: str,
+    slot_samples: int,
+    requests: Any,
+    responses: Any,
+    cancelled: Any,
+) -> None:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = np.ndarray((_SLOTS, slot_samples), dtype=np.float32, buffer=shm.buf)
+    try:
+        try:
+            transcriber = factory(settings)
+            if hasattr(transcriber, "warm_up"):
+                transcriber.warm_up()
+        except Exception as error:
+            responses.put((_READY_ID, "", str(error), "", ""))
+            return
+        tier = ["", ""]
+
+        def _on_tier(name: str, reason: str) -> None:
+            tier[:] = [name, reason]
+
+        if hasattr(transcriber, "on_tier"):
+            transcriber.on_tier = _on_tier
+        responses.put((_READY_ID, "", None, "", ""))
+        while (request := requests.get()) is not None:
+            request_id, slot, length, speech_only = request
+            if request_id <= cancelled.value:
+                continue
+            # Copied out so the parent can refill the slot while this decodes.
+            audio = ring[slot, :length].copy()
+            tier[:] = ["", ""]
+            try:
+                if speech_only:
+                    text = transcriber.transcribe_speech(audio)
+                else:
+                    text = transcriber.transcribe(audio)
+                responses.put((request_id, text, None, *tier))
+            except Exception as error:
+                responses.put((request_id, "", str(error), "", ""))
+    finally:
+        del ring
+        shm.close()
+
+
+class _WorkerDied(Exception):
+    pass
+
+
+class ProcessTranscriber:
+    # Runs the Whisper transcriber in a spawned worker process so decoding
+    # never competes with capture and the wake loop for the GIL. Audio goes
+    # through a shared-memory ring of float32 slots; only ids and lengths are
+    # pickled. A worker that dies is restarted and the request retried once;
+    # one that exceeds `timeout_seconds` is killed and restarted lazily.
+    # `cancel()` makes a pending `transcribe()` return "" and drops queued
+    # work; a decode already running finishes and its result is discarded.
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        factory: TranscriberFactory = load_transcriber,
+        timeout_seconds: float | None = None,
+    ) -> None:
+        self.settings = settings
+        self.factory = factory
+        self.timeout_seconds = (
+            settings.stt_worker_timeout_seconds if timeout_seconds is None else timeout_seconds
+        )
+        self.on_tier: TierCallback | None = None
+        self._ctx = mp.get_context("spawn")
+        self._lock = threading.Lock()
+        self._cancelled = self._ctx.Value("q", 0, lock=False)
+        self._next_id = 0
+        self._slot_samples = max(1, int(settings.record_max_seconds * settings.command_sample_rate))
+        self._shm: shared_memory.SharedMemory | None = None
+        self._ring: np.ndarray | None = None
+        self._process: Any = None
+        self._requests: Any = None
+        self._responses: Any = None
+
+    def warm_up(self) -> None:
+        with self._lock:
+            self._ensure_worker(0)
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        return self._request(audio, speech_only=False)
+
+    def transcribe_speech(self, audio: np.ndarray) -> str:
+        return self._request(audio, speech_only=True)
+
+    def cancel(self) -> None:
+        self._cancelled.value = self._next_id
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop_worker()
+            self._release_ring()
+
+    def _request(self, audio: np.ndarray, *, speech_only: bool) -> str:
+        if audio.size == 0:
+            return ""
+        with self._lock:
+            for _attempt in range(2):
+                self._ensure_worker(audio.size)
+                assert self._ring is not None
+                self._next_id += 1
+                request_id = self._next_id
+                slot = request_id % _SLOTS
+                self._ring[slot, : audio.size] = audio
+                self._requests.put((request_id, slot, audio.size, speech_only))
+                try:
+                    return self._await(request_id)
+                except _WorkerDied:
+                    logging.warning("STT worker died; restarting it.")
+                    METRICS.increment("stt.worker_restarts")
+                    self._stop_worker(graceful=False)
+            raise RuntimeError("STT worker died twice while decoding.")
+
+    def _await(self, request_id: int) -> str:
+        started = time.monotonic()
+        deadline = started + self.timeout_seconds
+        while True:
+            if self._cancelled.value >= request_id:
+                METRICS.increment("stt.worker_cancels")
+                return ""
+            try:
+                response_id, text, error, tier, reason = self._responses.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                if not self._process.is_alive():
+                    raise _WorkerDied from None
+                if time.monotonic() > deadline:
+                    METRICS.increment("stt.worker_timeouts")
+                    self._stop_worker(graceful=False)
+                    raise RuntimeError(
+                        f"STT worker timed out after {self.timeout_seconds:.1f} s."
+                    ) from None
+                continue
+            if response_id != request_id:
+                continue
+            METRICS.observe_ms("stt.worker_roundtrip_ms", (time.monotonic() - started) * 1000)
+            if error is not None:
+                raise RuntimeError(f"STT worker failed: {error}")
+            if tier and self.on_tier is not None:
+                self.on_tier(tier, reason)
+            return str(text)
+
+    def _ensure_worker(self, samples: int) -> None:
+        if samples > self._slot_samples:
+            self._stop_worker()
+            self._release_ring()
+            self._slot_samples = samples
+        if self._process is not None and self._process.is_alive():
+            return
+        self._stop_worker()
+        if self._shm is None:
+            size = _SLOTS * self._slot_samples * np.dtype(np.float32).itemsize
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._ring = np.ndarray(
+                (_SLOTS, self._slot_samples), dtype=np.float32, buffer=self._shm.buf
+            )
+        # Fresh queues: a killed worker can leave the old ones mid-message.
+        self._requests = self._ctx.Queue()
+        self._responses = self._ctx.Queue()
+        self._process = self._ctx.Process(
+            target=_serve,
+            args=(
+                self.factory,
+                self.settings,
+                self._shm.name,
+                self._slot_samples,
+                self._requests,
+                self._responses,
+                self._cancelled,
+            ),
+            name="stt-worker",
+            daemon=True,
+        )
+        self._process.start()
+        while True:
+            try:
+                response_id, _, error, _, _ = self._responses.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                if not self._process.is_alive():
+                    raise RuntimeError("STT worker exited during startup.") from None
+                continue
+            if response_id != _READY_ID:
+                continue
+            if error is not None:
+                self._stop_worker()
+                raise RuntimeError(f"STT worker failed to start: {error}")
+            return
+
+    def _stop_worker(self, *, graceful: bool = True) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if graceful and process.is_alive():
+            try:
+                self._requests.put(None)
+            except (OSError, ValueError):
+                pass
+            process.join(_JOIN_SECONDS)
+        if process.is_alive():
+            process.kill()
+            process.join(_JOIN_SECONDS)
+        for channel in (self._requests, self._responses):
+            channel.close()
+            channel.cancel_join_thread()
+
+    def _release_ring(self) -> None:
+        self._ring = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
@@ -1,14 +1,39 @@
 from __future__ import annotations
 
+import logging
 import threading
-from dataclasses import dataclass
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 from kokoro_onnx import Kokoro
 
 from openclaw_assistant.adapters.audio.output_stream import AudioOutput
-from openclaw_assistant.config.settings import Settings
+from openclaw_assistant.adapters.audio.playback import (
+    PlaybackEngine,
+    PlaybackHandle,
+    StreamCallback,
+)
+from openclaw_assistant.adapters.audio.wav_io import resample
+from openclaw_assistant.adapters.tts.onnx_session import create_session
+from openclaw_assistant.adapters.tts.phoneme_cache import PhonemeCache
+from openclaw_assistant.adapters.tts.pipelined import iter_synthesized
+from openclaw_assistant.adapters.tts.prompt_cache import PromptAudioCache, file_fingerprint
+from openclaw_assistant.adapters.tts.synthesis_cache import SynthesisCache
+from openclaw_assistant.config.settings import KokoroSessionConfig, Settings
+from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.events import ResponseSpoken, TextTranscribed
+from openclaw_assistant.core.sentences import split_units
+from openclaw_assistant.observability.metrics import METRICS
+
+KOKORO_SAMPLE_RATE = 24000
+_WARMUP_TEXT = "Ready."
+_MIN_GAIN = 0.1
+_MAX_GAIN = 4.0
 
 
 @dataclass(frozen=True)
@@ -33,25 +58,39 @@ def _shape_audio(
     sample_rate: int,
     fade_ms: float,
     padding_ms: float,
+    *,
+    head: bool = True,
+    tail: bool = True,
 ) -> np.ndarray:
-    audio = np.asarray(samples, dtype=np.float32)
+    # `head`/`tail` select which edges get the fade and padding, so units of
+    # one pipelined utterance join without a dip or gap between them.
+    # Copied: the samples may be shared with the synthesis cache.
+    audio = np.array(samples, dtype=np.float32)
     fade_len = int(sample_rate * (max(0.0, fade_ms) / 1000.0))
     pad_len = int(sample_rate * (max(0.0, padding_ms) / 1000.0))
 
     if fade_len > 0 and audio.size > fade_len * 2:
-        fade_in = np.linspace(0.0, 1.0, fade_len, dtype=np.float32)
-        fade_out = np.linspace(1.0, 0.0, fade_len, dtype=np.float32)
-        audio[:fade_len] *= fade_in
-        audio[-fade_len:] *= fade_out
-    if pad_len > 0:
+        if head:
+            audio[:fade_len] *= np.linspace(0.0, 1.0, fade_len, dtype=np.float32)
+        if tail:
+            audio[-fade_len:] *= np.linspace(1.0, 0.0, fade_len, dtype=np.float32)
+    if pad_len > 0 and (head or tail):
         pad = np.zeros(pad_len, dtype=np.float32)
-        audio = np.concatenate([pad, audio, pad])
+        audio = np.concatenate([*([pad] if head else []), audio, *([pad] if tail else [])])
     return audio
 
 
+def load_kokoro(model_path: str, voices_path: str, session: KokoroSessionConfig) -> Kokoro:
+    # The ONNX session is built here rather than by Kokoro so its thread
+    # pools, graph optimizations and memory arena follow the settings.
+    return Kokoro.from_session(create_session(model_path, session), voices_path)
+
+
 class KokoroSpeaker:
     def __init__(self, settings: Settings, *, reuse_output_stream: bool = True) -> None:
         self.reuse_output_stream = reuse_output_stream
+        self.pipelined = settings.tts_pipelined
+        self.first_unit_chars = settings.tts_first_unit_chars
         self.voice = KokoroVoiceConfig(
             model_path=str(settings.kokoro.model_path),
             voices_path=str(settings.kokoro.voices_path),
@@ -59,19 +98,59 @@ class KokoroSpeaker:
             speed=settings.kokoro.speed,
             language=settings.kokoro.language,
         )
+        self.session = settings.kokoro_session
         self.playback = PlaybackConfig(
             output_device=settings.tts_playback.output_device,
             fade_ms=settings.tts_playback.fade_ms,
             padding_ms=settings.tts_playback.padding_ms,
             prewarm_ms=settings.tts_playback.prewarm_ms,
         )
+        self.prompts = PromptAudioCache(
+            settings.prompt_cache_dir,
+            settings_key={
+                **asdict(self.voice),
+                "model": file_fingerprint(settings.kokoro.model_path),
+                "voices": file_fingerprint(settings.kokoro.voices_path),
+                "fade_ms": self.playback.fade_ms,
+                "padding_ms": self.playback.padding_ms,
+            },
+        )
+        self.synthesis_cache = SynthesisCache(
+            settings.tts_cache_dir,
+            settings_key={
+                **asdict(self.voice),
+                "model": file_fingerprint(settings.kokoro.model_path),
+                "voices": file_fingerprint(settings.kokoro.voices_path),
+            },
+            max_memory_bytes=int(settings.tts_cache_memory_mb * 1024 * 1024),
+            max_disk_bytes=int(settings.tts_cache_disk_mb * 1024 * 1024),
+        )
+        self.phoneme_cache = PhonemeCache(
+            self._phonemize,
+            max_entries=settings.tts_phoneme_cache_entries,
+            word_level=settings.tts_phoneme_word_level,
+        )
+        # Synthesis and playback are locked separately so the next sentence can
+        # be rendered while the current one plays.
         self._lock = threading.Lock()
+        self._play_lock = threading.Lock()
         self._kokoro: Kokoro | None = None
         self._output_stream = None
+        self.gain = 1.0
+        # Clips played since the last transcript; kept as the last response
+        # once it is fully spoken, so "repeat" replays it without synthesis.
+        self._response_clips: list[tuple[np.ndarray, int]] | None = None
+        self._last_response: list[tuple[np.ndarray, int]] = []
+        # Callback playback: audio is queued on the engine and speak_async()
+        # synthesizes on one worker thread, so callers need not block.
+        self.engine: PlaybackEngine | None = None
+        if settings.tts_callback_playback:
+            self.engine = PlaybackEngine(KOKORO_SAMPLE_RATE, self._open_callback_stream)
+        self._speak_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-speak")
 
     def _init_kokoro(self) -> Kokoro:
         if self._kokoro is None:
-            self._kokoro = Kokoro(self.voice.model_path, self.voice.voices_path)
+            self._kokoro = load_kokoro(self.voice.model_path, self.voice.voices_path, self.session)
         return self._kokoro
 
     def _get_stream(self, sample_rate: int) -> Any:
@@ -84,7 +163,17 @@ class KokoroSpeaker:
             )
         return self._output_stream
 
+    def _open_callback_stream(self, callback: StreamCallback) -> Any:
+        return AudioOutput.create_callback_stream(
+            KOKORO_SAMPLE_RATE,
+            self.playback.output_device,
+            callback,
+        )
+
     def close(self) -> None:
+        self._speak_pool.shutdown(wait=False, cancel_futures=True)
+        if self.engine is not None:
+            self.engine.close()
         if self._output_stream is None:
             return
         try:
@@ -93,28 +182,271 @@ class KokoroSpeaker:
         finally:
             self._output_stream = None
 
+    def _phonemize(self, text: str) -> str:
+        phonemes: str = self._init_kokoro().tokenizer.phonemize(text, self.voice.language)
+        return phonemes
+
+    def _synthesize(self, text: str) -> tuple[np.ndarray, int]:
+        # Phonemization goes through the cache; only the acoustic model runs
+        # for text it has seen, timed apart as tts.inference_ms.
+        kokoro = self._init_kokoro()
+        phonemes = self.phoneme_cache.phonemes(text)
+        started = time.perf_counter()
+        samples, sample_rate = kokoro.create(
+            phonemes,
+            voice=self.voice.voice,
+            speed=self.voice.speed,
+            lang=self.voice.language,
+            is_phonemes=True,
+        )
+        METRICS.observe_ms("tts.inference_ms", (time.perf_counter() - started) * 1000)
+        return samples, sample_rate
+
+    def _synthesize_cached(self, text: str) -> tuple[np.ndarray, int]:
+        # Cache hits never touch the ONNX session or wait for its lock.
+        cached = self.synthesis_cache.get(text)
+        if cached is not None:
+            return cached
+        with self._lock:
+            samples, sample_rate = self._synthesize(text)
+        self.synthesis_cache.put(text, samples, sample_rate)
+        return samples, sample_rate
+
+    def _shape(
+        self,
+        samples: np.ndarray,
+        sample_rate: int,
+        *,
+        head: bool = True,
+        tail: bool = True,
+    ) -> np.ndarray:
+        return _shape_audio(
+            samples,
+            sample_rate,
+            self.playback.fade_ms,
+            self.playback.padding_ms,
+            head=head,
+            tail=tail,
+        )
+
+    def _start_stream(self, sample_rate: int) -> Any:
+        stream = self._get_stream(sample_rate)
+        prewarm_len = int(sample_rate * (max(0.0, self.playback.prewarm_ms) / 1000.0))
+        if prewarm_len > 0:
+            stream.write(np.zeros(prewarm_len, dtype=np.float32))
+        return stream
+
+    def _gained(self, audio: np.ndarray) -> np.ndarray:
+        if self.gain != 1.0:
+            audio = np.clip(audio * np.float32(self.gain), -1.0, 1.0)
+        return audio
+
+    def _write(self, stream: Any, audio: np.ndarray) -> None:
+        stream.write(self._gained(audio))
+
+    def _open_handle(self) -> PlaybackHandle:
+        assert self.engine is not None
+        handle = self.engine.open()
+        prewarm_len = int(KOKORO_SAMPLE_RATE * (max(0.0, self.playback.prewarm_ms) / 1000.0))
+        if not self.engine.running and prewarm_len > 0:
+            handle.append(np.zeros(prewarm_len, dtype=np.float32))
+        return handle
+
+    def _enqueue(self, handle: PlaybackHandle, audio: np.ndarray, sample_rate: int) -> None:
+        if sample_rate != KOKORO_SAMPLE_RATE:
+            audio = resample(audio, sample_rate, KOKORO_SAMPLE_RATE)
+        handle.append(self._gained(audio))
+
+    def _finish_stream(self, stream: Any) -> None:
+        if not self.reuse_output_stream:
+            stream.stop()
+            stream.close()
+
+    def _play(self, audio: np.ndarray, sample_rate: int) -> None:
+        stream = self._start_stream(sample_rate)
+        try:
+            self._write(stream, audio)
+        finally:
+            self._finish_stream(stream)
+
+    def warm_up(self) -> None:
+        # Builds the ONNX session, runs one synthesis so kernels and arenas are
+        # allocated, and opens the reused output stream ahead of the first wake.
+        with self._lock:
+            self._synthesize(_WARMUP_TEXT)
+        if self.engine is not None:
+            self.engine.start()
+        elif self.reuse_output_stream:
+            with self._play_lock:
+                self._get_stream(KOKORO_SAMPLE_RATE)
+
+    def prerender_prompts(
+        self,
+        texts: Iterable[str],
+        earcons: Mapping[str, Path | None] | None = None,
+    ) -> None:
+        earcons = earcons or {}
+        with self._lock:
+            for text in texts:
+                if not text:
+                    continue
+                earcon = earcons.get(text)
+                if earcon is not None:
+                    self.prompts.add_earcon(text, earcon, KOKORO_SAMPLE_RATE)
+                else:
+                    self.prompts.load_or_render(text, self._synthesize, self._shape)
+            self.prompts.prune()
+        logging.info("Prepared %d prompt audio buffers.", len(self.prompts))
+
+    def render(self, text: str) -> tuple[np.ndarray, int]:
+        prompt = self.prompts.get(text)
+        if prompt is not None:
+            return prompt.audio, prompt.sample_rate
+        samples, sample_rate = self._synthesize_cached(text)
+        return self._shape(samples, sample_rate), sample_rate
+
+    def play(self, audio: np.ndarray, sample_rate: int) -> None:
+        with self._play_lock:
+            if self._response_clips is not None:
+                self._response_clips.append((audio, sample_rate))
+            if self.engine is None:
+                self._play(audio, sample_rate)
+                return
+            handle = self._open_handle()
+            self._enqueue(handle, audio, sample_rate)
+            handle.close()
+        handle.wait()
+
+    def on_event(self, event: object, _context: RuntimeContext) -> None:
+        if isinstance(event, TextTranscribed):
+            with self._play_lock:
+                self._response_clips = []
+        elif isinstance(event, ResponseSpoken):
+            with self._play_lock:
+                if self._response_clips:
+                    self._last_response = self._response_clips
+                self._response_clips = None
+
+    def replay_last(self) -> bool:
+        with self._play_lock:
+            clips = list(self._last_response)
+            if self.engine is None:
+                for audio, sample_rate in clips:
+                    self._play(audio, sample_rate)
+                return bool(clips)
+            handle = self._open_handle()
+            for audio, sample_rate in clips:
+                self._enqueue(handle, audio, sample_rate)
+            handle.close()
+        handle.wait()
+        return bool(clips)
+
+    def adjust_volume(self, factor: float) -> float:
+        self.gain = min(_MAX_GAIN, max(_MIN_GAIN, self.gain * factor))
+        return self.gain
+
     def speak(self, text: str) -> None:
         if not text:
             return
-        with self._lock:
-            kokoro = self._init_kokoro()
-            samples, sample_rate = kokoro.create(
-                text,
-                voice=self.voice.voice,
-                speed=self.voice.speed,
-                lang=self.voice.language,
-            )
-            audio = _shape_audio(
-                samples,
-                sample_rate,
-                self.playback.fade_ms,
-                self.playback.padding_ms,
-            )
-            stream = self._get_stream(sample_rate)
-            prewarm_len = int(sample_rate * (max(0.0, self.playback.prewarm_ms) / 1000.0))
-            if prewarm_len > 0:
-                stream.write(np.zeros(prewarm_len, dtype=np.float32))
-            stream.write(audio)
-            if not self.reuse_output_stream:
-                stream.stop()
-                stream.close()
+        started = time.monotonic()
+        if self.engine is not None:
+            self.speak_async(text).wait()
+        elif units := self._pipelined_units(text):
+            self._speak_units(units, started)
+        else:
+            audio, sample_rate = self.render(text)
+            self.play(audio, sample_rate)
+        METRICS.observe_ms("tts.speak_ms", (time.monotonic() - started) * 1000)
+
+    def speak_async(self, text: str) -> PlaybackHandle:
+        # Returns once the utterance holds its place in the playback queue;
+        # synthesis runs on the speak worker and playback on the stream callback.
+        if self.engine is None or not text:
+            self.speak(text)
+            return PlaybackHandle.completed(KOKORO_SAMPLE_RATE)
+        handle = self._open_handle()
+        self._speak_pool.submit(self._speak_into, handle, text, time.monotonic())
+        return handle
+
+    def drain(self, timeout: float | None = None) -> bool:
+        return self.engine.drain(timeout) if self.engine is not None else True
+
+    def cancel(self) -> None:
+        if self.engine is not None:
+            self.engine.cancel()
+
+    @property
+    def underruns(self) -> int:
+        return self.engine.underruns if self.engine is not None else 0
+
+    def _pipelined_units(self, text: str) -> list[str]:
+        # Empty when the text is spoken whole: a cached prompt or one unit.
+        if not self.pipelined or self.prompts.get(text) is not None:
+            return []
+        units = split_units(text, first_max_chars=self.first_unit_chars)
+        return units if len(units) > 1 else []
+
+    def _speak_into(self, handle: PlaybackHandle, text: str, started: float) -> None:
+        try:
+            if units := self._pipelined_units(text):
+                self._speak_units(units, started, handle)
+                return
+            audio, sample_rate = self.render(text)
+            with self._play_lock:
+                if self._response_clips is not None:
+                    self._response_clips.append((audio, sample_rate))
+                self._enqueue(handle, audio, sample_rate)
+        except Exception as error:
+            handle.fail(error)
+        finally:
+            handle.close()
+
+    def _speak_units(
+        self,
+        units: list[str],
+        started: float,
+        handle: PlaybackHandle | None = None,
+    ) -> None:
+        # Unit N+1 is synthesized while unit N plays; fades and padding only
+        # at the utterance edges. With a handle, units are queued on the
+        # playback engine instead of written to a blocking stream.
+        last = len(units) - 1
+        with self._play_lock:
+            stream = None
+            try:
+                for unit in iter_synthesized(units, self._synthesize_cached):
+                    METRICS.observe_ms("tts.unit_synth_ms", unit.synth_seconds * 1000)
+                    METRICS.set_gauge("tts.unit_rtf", unit.realtime_factor)
+                    logging.debug(
+                        "TTS unit %d (%d chars): %.0f ms audio at RTF %.2f",
+                        unit.index,
+                        len(unit.text),
+                        unit.audio_seconds * 1000,
+                        unit.realtime_factor,
+                    )
+                    audio = self._shape(
+                        unit.samples,
+                        unit.sample_rate,
+                        head=unit.index == 0,
+                        tail=unit.index == last,
+                    )
+                    if handle is not None and handle.cancelled:
+                        break
+                    if self._response_clips is not None:
+                        self._response_clips.append((audio, unit.sample_rate))
+                    if handle is not None:
+                        self._enqueue(handle, audio, unit.sample_rate)
+                        if unit.index == 0:
+                            METRICS.observe_ms(
+                                "tts.first_audio_ms", (time.monotonic() - started) * 1000
+                            )
+                        continue
+                    if stream is None:
+                        stream = self._start_stream(unit.sample_rate)
+                        METRICS.observe_ms(
+                            "tts.first_audio_ms", (time.monotonic() - started) * 1000
+                        )
+                    self._write(stream, audio)
+            finally:
+                if stream is not None:
+                    self._finish_stream(stream)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import onnxruntime as ort
+
+from openclaw_assistant.config.settings import KokoroSessionConfig
+
+_GRAPH_OPTIMIZATION = {
+    "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+_EXECUTION_MODE = {
+    "sequential": ort.ExecutionMode.ORT_SEQUENTIAL,
+    "parallel": ort.ExecutionMode.ORT_PARALLEL,
+}
+
+
+def session_options(config: KokoroSessionConfig) -> ort.SessionOptions:
+    if config.graph_optimization not in _GRAPH_OPTIMIZATION:
+        raise ValueError(
+            f"Unknown graph optimization '{config.graph_optimization}'. "
+            "Use disable, basic, extended or all."
+        )
+    if config.execution_mode not in _EXECUTION_MODE:
+        raise ValueError(
+            f"Unknown execution mode '{config.execution_mode}'. Use sequential or parallel."
+        )
+    options = ort.SessionOptions()
+    # 0 leaves the thread pool sizes to ONNX Runtime.
+    options.intra_op_num_threads = max(0, config.intra_op_threads)
+    options.inter_op_num_threads = max(0, config.inter_op_threads)
+    options.graph_optimization_level = _GRAPH_OPTIMIZATION[config.graph_optimization]
+    options.execution_mode = _EXECUTION_MODE[config.execution_mode]
+    options.enable_cpu_mem_arena = config.cpu_mem_arena
+    return options
+
+
+def create_session(model_path: str, config: KokoroSessionConfig) -> ort.InferenceSession:
+    return ort.InferenceSession(
+        model_path,
+        sess_options=session_options(config),
+        providers=["CPUExecutionProvider"],
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from openclaw_assistant.adapters.tts.synthesis_cache import normalize_text
+from openclaw_assistant.core.sentences import split_units
+from openclaw_assistant.observability.metrics import METRICS
+
+Phonemize = Callable[[str], str]
+
+_TOKEN = re.compile(r"\w+(?:['’]\w+)*|[^\w\s]")
+
+
+class PhonemeCache:
+    # espeak-ng output per sentence, so repeated sentences skip the phonemizer
+    # and only the acoustic model runs. With `word_level`, a sentence that
+    # misses is assembled from per-word phonemes instead, so new sentences
+    # made of known words skip espeak too; words phonemized alone lose
+    # cross-word stress and linking, so it is off by default.
+    def __init__(
+        self,
+        phonemize: Phonemize,
+        *,
+        max_entries: int,
+        word_level: bool = False,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._phonemize = phonemize
+        self.max_entries = max_entries
+        self.word_level = word_level
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sentences: OrderedDict[str, str] = OrderedDict()
+        self._words: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def phonemes(self, text: str) -> str:
+        started = self._clock()
+        parts = [self._sentence(sentence) for sentence in split_units(normalize_text(text))]
+        METRICS.observe_ms("tts.phonemize_ms", (self._clock() - started) * 1000)
+        METRICS.set_gauge("tts.phoneme_cache.hit_rate", self.hit_rate)
+        return " ".join(part for part in parts if part)
+
+    def _sentence(self, sentence: str) -> str:
+        phonemes = self._lookup(self._sentences, sentence)
+        if phonemes is None:
+            if self.word_level:
+                phonemes = self._from_words(sentence)
+            else:
+                phonemes = self._phonemize(sentence)
+            self._store(self._sentences, sentence, phonemes)
+        return phonemes
+
+    def _from_words(self, sentence: str) -> str:
+        # Punctuation passes through and attaches to the preceding word, as
+        # espeak's own output has it.
+        out = ""
+        for token in _TOKEN.findall(sentence):
+            if not token[0].isalnum():
+                out += token
+                continue
+            key = token.lower()
+            phonemes = self._lookup(self._words, key)
+            if phonemes is None:
+                phonemes = self._phonemize(token).strip()
+                self._store(self._words, key, phonemes)
+            out += f" {phonemes}" if out else phonemes
+        return out
+
+    def _lookup(self, entries: OrderedDict[str, str], key: str) -> str | None:
+        with self._lock:
+            phonemes = entries.get(key)
+            if phonemes is None:
+                self.misses += 1
+                METRICS.increment("tts.phoneme_cache.misses")
+                return None
+            entries.move_to_end(key)
+            self.hits += 1
+            METRICS.increment("tts.phoneme_cache.hits")
+            return phonemes
+
+    def _store(self, entries: OrderedDict[str, str], key: str, phonemes: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            entries[key] = phonemes
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
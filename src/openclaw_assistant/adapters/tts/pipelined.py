@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+Synthesize = Callable[[str], tuple[np.ndarray, int]]
+
+_PUT_POLL_SECONDS = 0.1
+
+
+@dataclass(frozen=True)
+class SynthesizedUnit:
+    index: int
+    text: str
+    samples: np.ndarray
+    sample_rate: int
+    synth_seconds: float
+
+    @property
+    def audio_seconds(self) -> float:
+        return self.samples.size / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def realtime_factor(self) -> float:
+        # Synthesis time per second of audio; below 1.0 keeps ahead of playback.
+        return self.synth_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+
+def iter_synthesized(
+    units: Sequence[str],
+    synthesize: Synthesize,
+    *,
+    ahead: int = 1,
+) -> Iterator[SynthesizedUnit]:
+    # A producer thread synthesizes up to `ahead` units past the one the caller
+    # is playing, so unit N+1 is synthesized while unit N plays. Closing the
+    # iterator stops the producer after its current unit.
+    items: queue.Queue[SynthesizedUnit | Exception | None] = queue.Queue(maxsize=max(1, ahead))
+    stopped = threading.Event()
+
+    def _put(item: SynthesizedUnit | Exception | None) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for index, text in enumerate(units):
+                if stopped.is_set():
+                    return
+                started = time.monotonic()
+                samples, sample_rate = synthesize(text)
+                unit = SynthesizedUnit(
+                    index, text, samples, sample_rate, time.monotonic() - started
+                )
+                if not _put(unit):
+                    return
+        except Exception as error:
+            _put(error)
+            return
+        _put(None)
+
+    threading.Thread(target=_produce, name="tts-producer", daemon=True).start()
+    try:
+        while (item := items.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.wav_io import read_wav, resample
+
+Renderer = Callable[[str], tuple[np.ndarray, int]]
+
+# Entries carry this prefix so prune() only ever removes files the cache wrote;
+# the directory is user-configured and may hold other .npz files.
+_PREFIX = "prompt-"
+
+
+@dataclass(frozen=True)
+class PromptAudio:
+    audio: np.ndarray
+    sample_rate: int
+
+
+def file_fingerprint(path: Path) -> str:
+    try:
+        stat = path.stat()
+    except OSError:
+        return f"{path}:missing"
+    return f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class PromptAudioCache:
+    def __init__(self, cache_dir: Path, *, settings_key: dict[str, object]) -> None:
+        self.cache_dir = cache_dir
+        self.settings_key = settings_key
+        self._entries: dict[str, PromptAudio] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, text: str) -> str:
+        payload = json.dumps({"text": text, **self.settings_key}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{_PREFIX}{key}.npz"
+
+    def get(self, text: str) -> PromptAudio | None:
+        return self._entries.get(text)
+
+    def _load(self, key: str) -> PromptAudio | None:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                return PromptAudio(
+                    audio=np.ascontiguousarray(data["audio"], dtype=np.float32),
+                    sample_rate=int(data["sample_rate"]),
+                )
+        except (OSError, ValueError, KeyError):
+            logging.warning("Discarding unreadable prompt cache entry: %s", path)
+            path.unlink(missing_ok=True)
+            return None
+
+    def _store(self, key: str, prompt: PromptAudio) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{_PREFIX}{key}.tmp.npz"
+            np.savez(tmp_path, audio=prompt.audio, sample_rate=prompt.sample_rate)
+            tmp_path.replace(self._path(key))
+        except OSError as error:
+            logging.warning("Could not persist prompt audio cache entry: %s", error)
+
+    def load_or_render(
+        self,
+        text: str,
+        render: Renderer,
+        shape: Callable[[np.ndarray, int], np.ndarray],
+    ) -> PromptAudio:
+        key = self.key(text)
+        prompt = self._load(key)
+        if prompt is None:
+            samples, sample_rate = render(text)
+            prompt = PromptAudio(audio=shape(samples, sample_rate), sample_rate=sample_rate)
+            self._store(key, prompt)
+        self._entries[text] = prompt
+        return prompt
+
+    def add_earcon(self, text: str, path: Path, sample_rate: int) -> PromptAudio:
+        audio, source_rate = read_wav(path)
+        prompt = PromptAudio(
+            audio=resample(audio, source_rate, sample_rate),
+            sample_rate=sample_rate,
+        )
+        self._entries[text] = prompt
+        return prompt
+
+    def prune(self) -> None:
+        keep = {self._path(self.key(text)).name for text in self._entries}
+        if not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.glob(f"{_PREFIX}*.npz"):
+            if path.name not in keep:
+                path.unlink(missing_ok=True)
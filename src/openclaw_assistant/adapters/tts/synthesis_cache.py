@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from openclaw_assistant.observability.metrics import METRICS
+
+_MAGIC = b"OCS1"
+_HEADER = struct.Struct("<4sI")
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+# Only files with this prefix and suffix are read, counted or evicted; the
+# directory is user-configured and may hold other files.
+_PREFIX = "tts-"
+_SUFFIX = ".i16"
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class SynthesisCache:
+    # Raw synthesized speech keyed by normalized text plus the voice settings
+    # and model fingerprints. A byte-bounded LRU holds float32 audio in
+    # memory; the disk tier keeps int16 files (header + samples) that are read
+    # whole on a hit and evicted least-recently-used first. Hits only note
+    # their recency in memory; eviction scans write it to the files' mtimes.
+    # Audio is cached before fades and padding, so whole replies and
+    # pipelined units share entries.
+    def __init__(
+        self,
+        cache_dir: Path | None,
+        *,
+        settings_key: dict[str, object],
+        max_memory_bytes: int,
+        max_disk_bytes: int,
+    ) -> None:
+        self.cache_dir = cache_dir if max_disk_bytes > 0 else None
+        self.settings_key = settings_key
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[np.ndarray, int]] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._disk_used: dict[str, int] = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.cache_dir is not None and self.cache_dir.exists():
+            self._disk_bytes = sum(path.stat().st_size for path in self._disk_files())
+
+    def key(self, text: str) -> str:
+        payload = json.dumps(
+            {"text": normalize_text(text), **self.settings_key}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _path(self, key: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / f"{_PREFIX}{key}{_SUFFIX}"
+
+    def _disk_files(self) -> list[Path]:
+        if self.cache_dir is None:
+            return []
+        return list(self.cache_dir.glob(f"{_PREFIX}*{_SUFFIX}"))
+
+    def get(self, text: str) -> tuple[np.ndarray, int] | None:
+        key = self.key(text)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._disk_used[key] = time.time_ns()
+                self.hits += 1
+                METRICS.increment("tts.cache.memory_hits")
+                return entry
+        entry = self._load(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                METRICS.increment("tts.cache.misses")
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._disk_used[key] = time.time_ns()
+            METRICS.increment("tts.cache.disk_hits")
+            self._remember(key, entry)
+        return entry
+
+    def put(self, text: str, samples: np.ndarray, sample_rate: int) -> None:
+        audio = np.asarray(samples, dtype=np.float32)
+        key = self.key(text)
+        with self._lock:
+            self._remember(key, (audio, sample_rate))
+        self._store(key, audio, sample_rate)
+
+    def _remember(self, key: str, entry: tuple[np.ndarray, int]) -> None:
+        size = entry[0].nbytes
+        if size > self.max_memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous[0].nbytes
+        self._memory[key] = entry
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes:
+            _, (evicted, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+            self.evictions += 1
+            METRICS.increment("tts.cache.evictions")
+        METRICS.set_gauge("tts.cache.memory_bytes", self._memory_bytes)
+
+    def _load(self, key: str) -> tuple[np.ndarray, int] | None:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with path.open("rb") as handle:
+                magic, sample_rate = _HEADER.unpack(handle.read(_HEADER.size))
+                if magic != _MAGIC:
+                    raise ValueError("bad header")
+                pcm = np.fromfile(handle, dtype="<i2")
+            audio = np.multiply(pcm, _INT16_SCALE, dtype=np.float32)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, struct.error):
+            logging.warning("Discarding unreadable synthesis cache entry: %s", path)
+            path.unlink(missing_ok=True)
+            return None
+        return audio, int(sample_rate)
+
+    def _store(self, key: str, audio: np.ndarray, sample_rate: int) -> None:
+        if self.cache_dir is None:
+            return
+        pcm = np.clip(audio * 32767.0, -32768, 32767).astype("<i2")
+        path = self._path(key)
+        # One temporary file per writer: concurrent misses may store the same key.
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as handle:
+                handle.write(_HEADER.pack(_MAGIC, sample_rate))
+                handle.write(pcm.tobytes())
+            with self._lock:
+                # An overwritten entry's bytes are no longer on disk.
+                try:
+                    replaced = path.stat().st_size
+                except FileNotFoundError:
+                    replaced = 0
+                tmp_path.replace(path)
+                self._disk_bytes += _HEADER.size + pcm.nbytes - replaced
+                over = self._disk_bytes > self.max_disk_bytes
+        except OSError as error:
+            logging.warning("Could not persist synthesis cache entry: %s", error)
+            tmp_path.unlink(missing_ok=True)
+            return
+        if over:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        with self._lock:
+            used, self._disk_used = self._disk_used, {}
+        files = []
+        for path in self._disk_files():
+            try:
+                stat = path.stat()
+                accessed = used.get(path.name[len(_PREFIX) : -len(_SUFFIX)])
+                if accessed is not None and accessed > stat.st_mtime_ns:
+                    # Persist recency so the order survives a restart.
+                    os.utime(path, ns=(accessed, accessed))
+                    files.append((accessed, stat.st_size, path))
+                    continue
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            METRICS.increment("tts.cache.disk_evictions")
+        with self._lock:
+            self._disk_bytes = total
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+
+_NOISE_FLOOR_ALPHA = 0.05
+_MIN_NOISE_FLOOR = 30.0
+
+
+class EnergyWakewordDetector:
+    # Offline stand-in for Porcupine: fires when a loud burst of keyword-like
+    # length ends. Higher sensitivity lowers the energy ratio needed to count
+    # a frame as part of a burst.
+    def __init__(
+        self,
+        *,
+        sensitivity: float = 0.5,
+        sample_rate: int = 16000,
+        frame_length: int = 512,
+        min_burst_seconds: float = 0.25,
+        max_burst_seconds: float = 1.5,
+    ) -> None:
+        self._sample_rate = sample_rate
+        self._frame_length = frame_length
+        self.ratio = 2.0 + (1.0 - min(max(sensitivity, 0.0), 1.0)) * 8.0
+        frame_seconds = frame_length / sample_rate
+        self.min_burst_frames = max(1, int(min_burst_seconds / frame_seconds))
+        self.max_burst_frames = max(self.min_burst_frames, int(max_burst_seconds / frame_seconds))
+        self.noise_floor = _MIN_NOISE_FLOOR
+        self._burst_frames = 0
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @property
+    def frame_length(self) -> int:
+        return self._frame_length
+
+    def process(self, pcm: np.ndarray) -> bool:
+        samples = pcm.astype(np.float32)
+        rms = float(np.sqrt(np.dot(samples, samples) / max(1, samples.size)))
+        if rms >= self.noise_floor * self.ratio:
+            self._burst_frames += 1
+            return False
+        burst, self._burst_frames = self._burst_frames, 0
+        self.noise_floor = max(
+            _MIN_NOISE_FLOOR,
+            (1.0 - _NOISE_FLOOR_ALPHA) * self.noise_floor + _NOISE_FLOOR_ALPHA * rms,
+        )
+        return self.min_burst_frames <= burst <= self.max_burst_frames
+
+    def close(self) -> None:
+        return None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import threading
 import time
 from typing import Any
@@ -8,46 +9,182 @@ import numpy as np
 import pvporcupine
 import sounddevice as sd
 
+from openclaw_assistant.adapters.audio.capture_bus import AudioCaptureBus
+from openclaw_assistant.adapters.wakeword.worker import WakewordDetectionWorker
 from openclaw_assistant.config.settings import Settings
+from openclaw_assistant.observability.metrics import METRICS
+
+_REBUILD_BACKOFF_SECONDS = 0.5
+_POLL_SECONDS = 0.1
+_STALL_SECONDS = 2.0
+
+
+class _CaptureStalled(RuntimeError):
+    pass
+
+
+class PorcupineFrameDetector:
+    def __init__(self, handle: Any) -> None:
+        self._handle = handle
+
+    @classmethod
+    def create(cls, settings: Settings, sensitivity: float | None = None) -> PorcupineFrameDetector:
+        return cls(
+            pvporcupine.create(
+                access_key=settings.porcupine_access_key,
+                keyword_paths=[str(settings.porcupine_keyword_path)],
+                sensitivities=[
+                    settings.porcupine_sensitivity if sensitivity is None else sensitivity
+                ],
+            )
+        )
+
+    @property
+    def sample_rate(self) -> int:
+        return int(self._handle.sample_rate)
+
+    @property
+    def frame_length(self) -> int:
+        return int(self._handle.frame_length)
+
+    def process(self, pcm: np.ndarray) -> bool:
+        return bool(self._handle.process(pcm) >= 0)
+
+    def close(self) -> None:
+        self._handle.delete()
 
 
 class PorcupineWakewordDetector:
-    def __init__(self, settings: Settings, stop_event: threading.Event) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        stop_event: threading.Event,
+        capture_bus: AudioCaptureBus | None = None,
+    ) -> None:
         self.settings = settings
         self.stop_event = stop_event
+        self.capture_bus = capture_bus
+        self._owns_bus = capture_bus is None
+        self._handle: PorcupineFrameDetector | None = None
+        self._params: tuple[int, int] | None = None
+        self._worker: WakewordDetectionWorker | None = None
+        self._paused = False
+        self._resumed_at: float | None = None
 
-    def _create(self) -> Any:
-        return pvporcupine.create(
-            access_key=self.settings.porcupine_access_key,
-            keyword_paths=[str(self.settings.porcupine_keyword_path)],
-            sensitivities=[self.settings.porcupine_sensitivity],
-        )
+    def _ensure_handle(self) -> PorcupineFrameDetector:
+        if self._handle is None:
+            self._handle = PorcupineFrameDetector.create(self.settings)
+            self._params = (self._handle.sample_rate, self._handle.frame_length)
+        return self._handle
+
+    def _ensure_bus(self) -> AudioCaptureBus:
+        handle = self._ensure_handle()
+        if self.capture_bus is None:
+            self.capture_bus = AudioCaptureBus(
+                sample_rate=handle.sample_rate,
+                device=self.settings.audio_input_device,
+                ring_seconds=self.settings.capture_ring_seconds,
+            )
+        if self.capture_bus.sample_rate != handle.sample_rate:
+            raise RuntimeError(
+                f"Capture bus runs at {self.capture_bus.sample_rate} Hz but Porcupine expects "
+                f"{handle.sample_rate} Hz. Set OPENCLAW_COMMAND_SAMPLE_RATE={handle.sample_rate}."
+            )
+        return self.capture_bus
+
+    def _ensure_worker(self) -> WakewordDetectionWorker:
+        if self._worker is None:
+            bus = self._ensure_bus()
+            worker = WakewordDetectionWorker(
+                self._ensure_handle(),
+                queue_blocks=self.settings.wakeword_queue_blocks,
+            )
+            worker.start()
+            bus.subscribe(worker.on_audio)
+            self._worker = worker
+            bus.start()
+        return self._worker
+
+    def _stop_worker(self) -> None:
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        if self.capture_bus is not None:
+            self.capture_bus.unsubscribe(worker.on_audio)
+        worker.stop()
 
     def audio_params(self) -> tuple[int, int]:
-        detector = self._create()
+        if self._params is None:
+            self._ensure_handle()
+        assert self._params is not None
+        return self._params
+
+    def pause(self) -> None:
+        self._paused = True
+        if self._worker is not None:
+            self._worker.disarm()
+
+    def resume(self) -> None:
+        if not self._paused:
+            return
+        self._paused = False
+        self._resumed_at = time.monotonic()
+
+    def close(self) -> None:
+        self._stop_worker()
+        handle, self._handle = self._handle, None
         try:
-            return detector.sample_rate, detector.frame_length
+            if self._owns_bus and self.capture_bus is not None:
+                self.capture_bus.close()
+                self.capture_bus = None
         finally:
-            detector.delete()
+            if handle is not None:
+                handle.close()
+
+    def _rebuild(self, error: Exception) -> None:
+        logging.warning("Wake-word session failed (%s); rebuilding.", error)
+        METRICS.increment("wakeword.session_rebuilds")
+        self._stop_worker()
+        handle, self._handle = self._handle, None
+        try:
+            if handle is not None:
+                handle.close()
+            if self.capture_bus is not None:
+                self.capture_bus.restart()
+        except Exception:
+            logging.debug("Ignoring error while rebuilding wake-word session.", exc_info=True)
+        self.stop_event.wait(_REBUILD_BACKOFF_SECONDS)
+
+    def _capture_stalled(self, waiting_since: float, now: float) -> bool:
+        last_audio = None if self.capture_bus is None else self.capture_bus.last_audio_at
+        return now - max(last_audio or 0.0, waiting_since) >= _STALL_SECONDS
 
     def wait_for_wakeword(self, timeout_seconds: float | None = None) -> bool:
-        detector = self._create()
+        self.resume()
         deadline = None if timeout_seconds is None else (time.monotonic() + timeout_seconds)
-        try:
-            with sd.RawInputStream(
-                samplerate=detector.sample_rate,
-                blocksize=detector.frame_length,
-                dtype="int16",
-                channels=1,
-                device=self.settings.audio_input_device,
-            ) as stream:
-                while not self.stop_event.is_set():
-                    if deadline is not None and time.monotonic() >= deadline:
-                        return False
-                    pcm_bytes, _ = stream.read(detector.frame_length)
-                    pcm = np.frombuffer(pcm_bytes, dtype=np.int16)
-                    if detector.process(pcm) >= 0:
-                        return True
+        waiting_since = time.monotonic()
+        while not self.stop_event.is_set():
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
                 return False
-        finally:
-            detector.delete()
+            try:
+                worker = self._ensure_worker()
+            except (sd.PortAudioError, pvporcupine.PorcupineError) as error:
+                self._rebuild(error)
+                continue
+            if not worker.armed:
+                worker.arm(since=self._resumed_at)
+                self._resumed_at = None
+            poll = _POLL_SECONDS if deadline is None else min(_POLL_SECONDS, deadline - now)
+            result = worker.next_result(timeout=max(0.0, poll))
+            if result is None:
+                if self._capture_stalled(waiting_since, time.monotonic()):
+                    self._rebuild(_CaptureStalled("no audio from capture bus"))
+                    waiting_since = time.monotonic()
+                continue
+            if isinstance(result, Exception):
+                self._rebuild(result)
+                continue
+            self._ensure_bus().mark_wake(result)
+            return True
+        return False
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.frame_queue import BoundedFrameQueue
+from openclaw_assistant.core.contracts import WakewordFrameDetector
+from openclaw_assistant.observability.metrics import METRICS
+
+_QUEUE_POLL_SECONDS = 0.1
+
+WakeResult = int | Exception
+
+
+class WakewordDetectionWorker:
+    # Runs frame detection off the audio thread. The capture callback only
+    # copies blocks into a bounded queue; detections (ring positions) and
+    # detector failures come back through `results`.
+    def __init__(self, detector: WakewordFrameDetector, *, queue_blocks: int) -> None:
+        self.detector = detector
+        self.frames = BoundedFrameQueue(queue_blocks)
+        self.results: queue.Queue[WakeResult] = queue.Queue()
+        self._armed = threading.Event()
+        self._stopped = threading.Event()
+        self._reset_frame = False
+        self._armed_since: float | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def armed(self) -> bool:
+        return self._armed.is_set()
+
+    def on_audio(self, end_position: int, block: np.ndarray) -> None:
+        if self._armed.is_set():
+            self.frames.put(end_position, block.copy())
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="wakeword-detector", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._armed.clear()
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def arm(self, since: float | None = None) -> None:
+        self.frames.clear()
+        while not self.results.empty():
+            self.results.get_nowait()
+        self._reset_frame = True
+        self._armed_since = since
+        self._armed.set()
+
+    def disarm(self) -> None:
+        self._armed.clear()
+        self.frames.clear()
+
+    def next_result(self, timeout: float) -> WakeResult | None:
+        try:
+            return self.results.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _run(self) -> None:
+        frame_length = self.detector.frame_length
+        frame = np.empty(frame_length, dtype=np.int16)
+        filled = 0
+        while not self._stopped.is_set():
+            item = self.frames.get(timeout=_QUEUE_POLL_SECONDS)
+            if item is None:
+                continue
+            if self._reset_frame:
+                self._reset_frame = False
+                filled = 0
+            METRICS.set_gauge("wakeword.queue_depth", self.frames.depth)
+            METRICS.set_gauge("wakeword.queue_high_water", self.frames.high_water)
+            METRICS.set_gauge("wakeword.dropped_blocks", self.frames.dropped)
+            end_position, block = item
+            offset = 0
+            while offset < block.size and self._armed.is_set():
+                take = min(frame_length - filled, block.size - offset)
+                frame[filled : filled + take] = block[offset : offset + take]
+                filled += take
+                offset += take
+                if filled < frame_length:
+                    break
+                filled = 0
+                try:
+                    detected = self.detector.process(frame)
+                except Exception as error:
+                    logging.debug("Wake-word frame detector failed.", exc_info=True)
+                    self._armed.clear()
+                    self.results.put(error)
+                    break
+                if self._armed_since is not None:
+                    rearm_ms = (time.monotonic() - self._armed_since) * 1000
+                    METRICS.observe_ms("wakeword.rearm_ms", rearm_ms)
+                    self._armed_since = None
+                if detected:
+                    self._armed.clear()
+                    self.results.put(end_position - (block.size - offset))
+                    break
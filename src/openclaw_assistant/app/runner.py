@@ -1,17 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 
+from openclaw_assistant.adapters.audio.capture_bus import AudioCaptureBus
 from openclaw_assistant.adapters.audio.input_stream import SilenceBoundedListener
+from openclaw_assistant.adapters.gateway.async_client import AsyncOpenClawClient
 from openclaw_assistant.adapters.gateway.openclaw_http import OpenClawHttpExecutor
+from openclaw_assistant.adapters.stt.cascade import CascadedWhisperTranscriber
 from openclaw_assistant.adapters.stt.faster_whisper import FasterWhisperTranscriber
+from openclaw_assistant.adapters.stt.streaming import StreamingWhisperTranscriber
+from openclaw_assistant.adapters.stt.worker import ProcessTranscriber
 from openclaw_assistant.adapters.tts.kokoro import KokoroSpeaker
 from openclaw_assistant.adapters.wakeword.porcupine import PorcupineWakewordDetector
+from openclaw_assistant.app.speculation import (
+    SpeculativeActionStage,
+    SpeculativeDispatcher,
+    SpeculativeTranscribeStage,
+)
+from openclaw_assistant.app.warmup import run_warmup
 from openclaw_assistant.config.settings import Settings
+from openclaw_assistant.core.async_pipeline import AsyncPipelineOrchestrator
 from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.events import TranscriptPartial, TranscriptTier
 from openclaw_assistant.core.pipeline import PipelineOrchestrator
-from openclaw_assistant.plugins.registry import PluginRegistry
+from openclaw_assistant.core.readiness import Readiness
+from openclaw_assistant.observability.metrics import METRICS
+from openclaw_assistant.plugins.builtin.async_stages import GatewayActionStage, StageExecutors
+from openclaw_assistant.plugins.builtin.intent_stage import LocalIntentStagePlugin
+from openclaw_assistant.plugins.registry import AsyncPluginRegistry, PluginRegistry
 
 
 class AppRunner:
@@ -20,32 +38,165 @@ class AppRunner:
         self.stop_event = threading.Event()
 
         speaker = KokoroSpeaker(settings, reuse_output_stream=True)
+        self.capture_bus = AudioCaptureBus(
+            sample_rate=settings.command_sample_rate,
+            device=settings.audio_input_device,
+            ring_seconds=settings.capture_ring_seconds,
+        )
+        self.streaming_transcriber: StreamingWhisperTranscriber | None = None
+        self.stt_worker: ProcessTranscriber | None = None
+        self.tiered_transcriber: CascadedWhisperTranscriber | ProcessTranscriber | None = None
+        transcriber: (
+            FasterWhisperTranscriber
+            | StreamingWhisperTranscriber
+            | CascadedWhisperTranscriber
+            | ProcessTranscriber
+        )
+        if settings.stt_streaming:
+            self.streaming_transcriber = StreamingWhisperTranscriber.from_settings(settings)
+            transcriber = self.streaming_transcriber
+        elif settings.stt_worker_process:
+            self.stt_worker = ProcessTranscriber(settings)
+            self.tiered_transcriber = transcriber = self.stt_worker
+        elif settings.whisper_fast_model:
+            self.tiered_transcriber = transcriber = CascadedWhisperTranscriber.from_settings(
+                settings
+            )
+        else:
+            transcriber = FasterWhisperTranscriber(settings)
+        self.executor = OpenClawHttpExecutor(settings)
+        self.listener = SilenceBoundedListener(
+            sample_rate=settings.command_sample_rate,
+            device=settings.audio_input_device,
+            record_max_seconds=settings.record_max_seconds,
+            record_min_seconds=settings.record_min_seconds,
+            silence_seconds=settings.silence_seconds,
+            silence_threshold=settings.silence_threshold,
+            capture_bus=self.capture_bus,
+            capture_from_wake=settings.capture_from_wake,
+            preroll_seconds=settings.capture_preroll_seconds,
+            endpoint_hop_ms=settings.endpoint_hop_ms,
+            endpoint_noise_ratio=settings.endpoint_noise_ratio,
+            endpoint_hysteresis=settings.endpoint_hysteresis,
+            endpoint_noise_alpha=settings.endpoint_noise_alpha,
+            observer=self.streaming_transcriber,
+            speech_pad_ms=settings.stt_speech_pad_ms if settings.stt_trim_silence else None,
+            speculation_pause_ms=settings.speculation_pause_ms,
+        )
         self.context = RuntimeContext(
             settings=settings,
             stop_event=self.stop_event,
-            wakeword=PorcupineWakewordDetector(settings, stop_event=self.stop_event),
-            listener=SilenceBoundedListener(
-                sample_rate=settings.command_sample_rate,
-                device=settings.audio_input_device,
-                record_max_seconds=settings.record_max_seconds,
-                record_min_seconds=settings.record_min_seconds,
-                silence_seconds=settings.silence_seconds,
-                silence_threshold=settings.silence_threshold,
+            wakeword=PorcupineWakewordDetector(
+                settings,
+                stop_event=self.stop_event,
+                capture_bus=self.capture_bus,
             ),
-            transcriber=FasterWhisperTranscriber(settings),
-            executor=OpenClawHttpExecutor(settings),
+            listener=self.listener,
+            transcriber=transcriber,
+            executor=self.executor,
             speaker=speaker,
+            readiness=Readiness(),
         )
+        self.transcriber = transcriber
         self.speaker = speaker
-        self.registry = PluginRegistry()
+        self.intents = LocalIntentStagePlugin()
+        self.registry = PluginRegistry(intent_stage=self.intents)
+        self.registry.register_event_handler(speaker.on_event)
+        self.speculation: SpeculativeDispatcher | None = None
+        if settings.speculative_dispatch and settings.stt_streaming:
+            # A speculative decode would end the streaming session mid-capture.
+            logging.warning("Speculative dispatch is disabled with streaming STT.")
+        elif settings.speculative_dispatch:
+            self._install_speculation()
         self.registry.validate()
         self.pipeline = PipelineOrchestrator(self.context, self.registry)
+        if self.streaming_transcriber is not None:
+            self.streaming_transcriber.on_partial = self._emit_partial
+        if self.tiered_transcriber is not None:
+            self.tiered_transcriber.on_tier = self._emit_tier
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._main_task: asyncio.Task[None] | None = None
+
+    def _install_speculation(self) -> None:
+        transcribe_stage = self.registry.transcribe_stage
+        action_stage = self.registry.action_stage
+        self.speculation = SpeculativeDispatcher(
+            lambda audio: transcribe_stage.transcribe(audio, self.context),
+            lambda prompt: action_stage.execute(prompt, self.context),
+            dispatch_filter=lambda text: self.intents.match(text, self.context) is None,
+        )
+        self.registry.transcribe_stage = SpeculativeTranscribeStage(
+            transcribe_stage, self.speculation
+        )
+        self.registry.action_stage = SpeculativeActionStage(action_stage, self.speculation)
+        self.listener.speculation = self.speculation
+
+    def _emit_partial(self, committed: str, tentative: str) -> None:
+        self.registry.emit(
+            TranscriptPartial(committed=committed, tentative=tentative), self.context
+        )
+
+    def _emit_tier(self, tier: str, reason: str) -> None:
+        self.registry.emit(TranscriptTier(tier=tier, escalation_reason=reason), self.context)
 
     def stop(self) -> None:
         self.stop_event.set()
+        if self._loop is not None and self._main_task is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._main_task.cancel)
+            except RuntimeError:
+                pass
         self.speaker.close()
+        self.capture_bus.close()
+        self.executor.close()
+        if self.streaming_transcriber is not None:
+            self.streaming_transcriber.close()
+        if self.stt_worker is not None:
+            self.stt_worker.cancel()
+            self.stt_worker.close()
 
-    def run(self) -> None:
+    def run(self, *, async_mode: bool = False) -> None:
         self.settings.validate_runtime_assets(include_tts_assets=True)
         logging.info("Starting OpenClaw Assistant runtime.")
-        self.pipeline.run_forever()
+        warmup = threading.Thread(
+            target=run_warmup,
+            args=({"stt": self.transcriber, "tts": self.speaker}, self.context.readiness),
+            name="warmup",
+            daemon=True,
+        )
+        warmup.start()
+        self.speaker.prerender_prompts(
+            [self.settings.wake_hello_prompt, self.settings.listen_start_prompt],
+            earcons={
+                self.settings.wake_hello_prompt: self.settings.wake_earcon_path,
+                self.settings.listen_start_prompt: self.settings.listen_earcon_path,
+            },
+        )
+        try:
+            if async_mode:
+                asyncio.run(self._serve_async())
+            else:
+                # The async action stage pre-connects itself; only the sync
+                # loop relies on the executor's ListenStarted handler.
+                self.registry.register_event_handler(self.executor.on_event)
+                self.pipeline.run_forever()
+        finally:
+            logging.info("Runtime metrics: %s", METRICS.snapshot())
+
+    async def _serve_async(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._main_task = asyncio.current_task()
+        executors = StageExecutors()
+        client = AsyncOpenClawClient(self.executor)
+        # Speculative replies come from the sync action stage it wraps.
+        action_stage = None if self.speculation is not None else GatewayActionStage(client)
+        registry = AsyncPluginRegistry.from_sync(
+            self.registry, executors, action_stage=action_stage
+        )
+        try:
+            await AsyncPipelineOrchestrator(self.context, registry).run_forever()
+        except asyncio.CancelledError:
+            logging.info("Async runtime cancelled.")
+        finally:
+            executors.shutdown()
+            client.close()
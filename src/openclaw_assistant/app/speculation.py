@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.observability.metrics import METRICS
+from openclaw_assistant.plugins.registry import ActionStage, StreamingActionStage, TranscribeStage
+
+
+@dataclass
+class _Speculation:
+    started: float
+    discarded: bool = False
+    transcript: str | None = None
+    response: str | None = None
+    dispatched: bool = False
+    transcribed_at: float = 0.0
+    finished_at: float = 0.0
+    consumed_at: float = 0.0
+    transcribed: threading.Event = field(default_factory=threading.Event)
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class SpeculativeDispatcher:
+    # When speech pauses, the capture so far is transcribed and sent to the
+    # gateway on a background thread. If speech resumes the speculation is
+    # discarded: its transcript is dropped and its reply, if one arrives, is
+    # ignored (a prompt already sent cannot be recalled). If the endpoint
+    # confirms, the speculative transcript and reply stand in for the final
+    # ones. `dispatch_filter` keeps transcripts such as local intents off the
+    # gateway.
+    def __init__(
+        self,
+        transcribe: Callable[[np.ndarray], str],
+        execute: Callable[[str], str],
+        *,
+        dispatch_filter: Callable[[str], bool] = lambda _text: True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._transcribe = transcribe
+        self._execute = execute
+        self._dispatch_filter = dispatch_filter
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Speculative and final transcriptions never share the model at once.
+        self.stt_lock = threading.Lock()
+        self._current: _Speculation | None = None
+        self._pending: _Speculation | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        resolved = self.hits + self.misses
+        return self.hits / resolved if resolved else 0.0
+
+    def _resolve(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+            METRICS.increment("speculation.hits")
+        else:
+            self.misses += 1
+            METRICS.increment("speculation.misses")
+        METRICS.set_gauge("speculation.hit_rate", self.hit_rate)
+
+    def speech_paused(self, audio: np.ndarray) -> None:
+        speculation = _Speculation(started=self._clock())
+        with self._lock:
+            if self._current is not None:
+                self._current.discarded = True
+            self._current = speculation
+        METRICS.increment("speculation.started")
+        threading.Thread(
+            target=self._run,
+            args=(speculation, audio),
+            name="speculation",
+            daemon=True,
+        ).start()
+
+    def speech_resumed(self) -> None:
+        with self._lock:
+            speculation, self._current = self._current, None
+            if speculation is None:
+                return
+            speculation.discarded = True
+            self._resolve(hit=False)
+
+    def _run(self, speculation: _Speculation, audio: np.ndarray) -> None:
+        try:
+            with self.stt_lock:
+                if speculation.discarded:
+                    return
+                speculation.transcript = self._transcribe(audio).strip()
+                speculation.transcribed_at = self._clock()
+            speculation.transcribed.set()
+            text = speculation.transcript
+            if speculation.discarded or not text or not self._dispatch_filter(text):
+                return
+            speculation.dispatched = True
+            speculation.response = self._execute(text)
+        except Exception as error:
+            logging.debug("Speculative dispatch failed: %s", error)
+        finally:
+            speculation.finished_at = self._clock()
+            speculation.transcribed.set()
+            speculation.done.set()
+
+    def transcript(self) -> str | None:
+        # Claims the live speculation once the endpoint is confirmed.
+        with self._lock:
+            speculation, self._current = self._current, None
+            self._pending = None
+        if speculation is None:
+            return None
+        speculation.consumed_at = self._clock()
+        speculation.transcribed.wait()
+        if speculation.transcript is None:
+            self._resolve(hit=False)
+            return None
+        self._resolve(hit=True)
+        if not speculation.dispatched:
+            self._saved(speculation, speculation.transcribed_at)
+        with self._lock:
+            self._pending = speculation
+        return speculation.transcript
+
+    def response(self, prompt: str) -> str | None:
+        with self._lock:
+            speculation, self._pending = self._pending, None
+        if speculation is None or not speculation.dispatched or speculation.transcript != prompt:
+            return None
+        speculation.done.wait()
+        if speculation.response is None:
+            return None
+        self._saved(speculation, speculation.finished_at)
+        return speculation.response
+
+    def _saved(self, speculation: _Speculation, ready_at: float) -> None:
+        # Work finished before the endpoint saved all of it; otherwise only the
+        # head start between the pause and the endpoint was saved.
+        saved = min(speculation.consumed_at, ready_at) - speculation.started
+        METRICS.observe_ms("speculation.saved_ms", max(0.0, saved) * 1000)
+
+
+class SpeculativeTranscribeStage:
+    def __init__(self, stage: TranscribeStage, dispatcher: SpeculativeDispatcher) -> None:
+        self.stage = stage
+        self.dispatcher = dispatcher
+
+    def transcribe(self, audio: np.ndarray, context: RuntimeContext) -> str:
+        text = self.dispatcher.transcript()
+        if text is not None:
+            return text
+        with self.dispatcher.stt_lock:
+            return self.stage.transcribe(audio, context)
+
+
+class SpeculativeActionStage:
+    def __init__(self, stage: ActionStage, dispatcher: SpeculativeDispatcher) -> None:
+        self.stage = stage
+        self.dispatcher = dispatcher
+
+    def execute(self, prompt: str, context: RuntimeContext) -> str:
+        response = self.dispatcher.response(prompt)
+        if response is not None:
+            return response
+        return self.stage.execute(prompt, context)
+
+    def execute_stream(self, prompt: str, context: RuntimeContext) -> Iterator[str]:
+        # A speculative reply was requested whole, so it arrives as one delta.
+        response = self.dispatcher.response(prompt)
+        if response is not None:
+            yield response
+        elif isinstance(self.stage, StreamingActionStage):
+            yield from self.stage.execute_stream(prompt, context)
+        else:
+            yield self.stage.execute(prompt, context)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+from openclaw_assistant.core.contracts import WarmUp
+from openclaw_assistant.core.readiness import Readiness
+from openclaw_assistant.observability.metrics import METRICS
+
+
+def _warm_one(name: str, component: WarmUp, readiness: Readiness) -> None:
+    started = time.monotonic()
+    try:
+        component.warm_up()
+    except Exception:
+        # The first real request will surface the error; do not block startup.
+        logging.exception("Warm-up failed for %s.", name)
+        METRICS.increment(f"warmup.{name}.failures")
+    elapsed_ms = (time.monotonic() - started) * 1000
+    METRICS.observe_ms(f"warmup.{name}_ms", elapsed_ms)
+    readiness.record(name, elapsed_ms)
+    logging.info("Warmed up %s in %.0f ms.", name, elapsed_ms)
+
+
+def run_warmup(components: Mapping[str, WarmUp], readiness: Readiness) -> None:
+    # Components are independent (separate models and devices), so they warm
+    # up concurrently; readiness is set even if one of them fails.
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(components))) as pool:
+            for name, component in components.items():
+                pool.submit(_warm_one, name, component, readiness)
+    finally:
+        readiness.set()
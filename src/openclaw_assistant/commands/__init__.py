@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import argparse
 
-from openclaw_assistant.commands import diagnostics
+from openclaw_assistant.commands import bench, diagnostics, replay, transcribe
 from openclaw_assistant.commands.run import run_command
 from openclaw_assistant.commands.setup import setup_command
 from openclaw_assistant.commands.update import update_command
@@ -13,7 +13,13 @@ def build_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     run = subparsers.add_parser("run", help="Run assistant")
-    run.set_defaults(handler=lambda _args: run_command())
+    run.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help="Run stages on the asyncio orchestrator",
+    )
+    run.set_defaults(handler=lambda args: run_command(async_mode=args.async_mode))
 
     setup = subparsers.add_parser("setup", help="Run onboarding setup")
     setup.set_defaults(handler=lambda _args: setup_command())
@@ -23,6 +29,9 @@ def build_parser() -> argparse.ArgumentParser:
     update.set_defaults(handler=lambda args: update_command(dev=args.dev))
 
     diagnostics.add_subparser(subparsers)
+    bench.add_subparser(subparsers)
+    replay.add_subparser(subparsers)
+    transcribe.add_subparser(subparsers)
     return parser
 
 
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+
+def _parse_floats(value: str) -> list[float]:
+    return [float(part) for part in value.split(",") if part.strip()]
+
+
+def bench_command(args: argparse.Namespace) -> None:
+    if args.bench_cmd == "capture":
+        from openclaw_assistant.offline import capture_bench
+
+        capture_results = capture_bench.run_capture_bench(
+            record_max_seconds=args.max_seconds,
+            speech_seconds=args.speech_seconds,
+            iterations=args.iterations,
+        )
+        if args.json:
+            print(json.dumps([result.summary() for result in capture_results], indent=2))
+            return
+        print("Command capture (synthetic command replayed from the ring buffer):")
+        print(capture_bench.format_report(capture_results))
+        return
+
+    from openclaw_assistant.config.loader import load_settings
+
+    settings = load_settings()
+
+    if args.bench_cmd == "wakeword":
+        from openclaw_assistant.offline.wakeword_bench import format_report, run_sweep
+
+        if not args.corpus.is_dir():
+            raise SystemExit(f"Corpus directory not found: {args.corpus}")
+        results = run_sweep(
+            args.corpus,
+            _parse_floats(args.sensitivities),
+            detector_spec=args.detector,
+            settings=settings,
+            workers=args.workers,
+        )
+        if args.json:
+            print(json.dumps([result.summary() for result in results], indent=2))
+            return
+        print(f"Wakeword replay ({results[0].detector if results else args.detector}):")
+        print(format_report(results))
+        return
+
+
+def add_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
+    parser = subparsers.add_parser("bench", help="Run offline benchmarks")
+    child = parser.add_subparsers(dest="bench_cmd", required=True)
+
+    wake = child.add_parser("wakeword", help="Replay a labelled WAV corpus through the detector")
+    wake.add_argument("--corpus", type=Path, required=True)
+    wake.add_argument("--sensitivities", default="0.3,0.45,0.55,0.7,0.85")
+    wake.add_argument(
+        "--detector",
+        default="auto",
+        help="auto, porcupine, energy or module:factory(sensitivity, settings)",
+    )
+    wake.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    wake.add_argument("--json", action="store_true")
+
+    capture = child.add_parser("capture", help="Compare command capture buffer strategies")
+    capture.add_argument("--max-seconds", type=float, default=8.0)
+    capture.add_argument("--speech-seconds", type=float, default=3.0)
+    capture.add_argument("--iterations", type=int, default=200)
+    capture.add_argument("--json", action="store_true")
+
+    parser.set_defaults(handler=bench_command)
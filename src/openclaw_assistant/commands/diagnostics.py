@@ -46,6 +46,22 @@ def diagnostics_command(args: argparse.Namespace) -> None:
         print(json.dumps(AudioInput.list_devices(), indent=2))
         return
 
+    if args.diag_cmd == "tts" and args.bench:
+        from openclaw_assistant.offline import tts_bench
+
+        configs = tts_bench.bench_configs(
+            settings,
+            variants=[part.strip() for part in args.variants.split(",") if part.strip()],
+            intra_op_threads=[int(part) for part in args.threads.split(",") if part.strip()],
+        )
+        results = tts_bench.run_tts_bench(configs, repeats=args.repeats)
+        if args.json:
+            print(json.dumps([result.summary() for result in results], indent=2))
+            return
+        print("Kokoro synthesis (RTF = synthesis seconds per audio second):")
+        print(tts_bench.format_report(results))
+        return
+
     if args.diag_cmd == "tts":
         speaker = KokoroSpeaker(settings, reuse_output_stream=False)
         try:
@@ -54,6 +70,7 @@ def diagnostics_command(args: argparse.Namespace) -> None:
             print(f"  padding_ms={settings.tts_padding_ms}")
             print(f"  prewarm_ms={settings.tts_prewarm_ms}")
             print(f"  output_device={settings.audio_output_device}")
+            print(f"  model={settings.kokoro.model_path}")
             speaker.speak(args.text)
         finally:
             speaker.close()
@@ -92,7 +109,10 @@ def diagnostics_command(args: argparse.Namespace) -> None:
             f"Listening for wakeword for up to {args.timeout:.1f}s... "
             f"say '{settings.wakeword_label}'."
         )
-        detected = detector.wait_for_wakeword(timeout_seconds=args.timeout)
+        try:
+            detected = detector.wait_for_wakeword(timeout_seconds=args.timeout)
+        finally:
+            detector.close()
         if detected:
             print("Wakeword detected.")
         else:
@@ -139,6 +159,7 @@ def diagnostics_command(args: argparse.Namespace) -> None:
                 print("Pipeline OpenClaw response:")
                 print(state["response"] or "<empty>")
         finally:
+            runner.context.wakeword.close()
             runner.stop()
 
 
@@ -150,6 +171,15 @@ def add_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentParser
 
     tts = child.add_parser("tts", help="Test TTS")
     tts.add_argument("--text", default="Testing text to speech.")
+    tts.add_argument(
+        "--bench",
+        action="store_true",
+        help="Report RTF and peak RSS per model variant and thread count",
+    )
+    tts.add_argument("--variants", default="", help="e.g. fp32,fp16,int8 (default: configured)")
+    tts.add_argument("--threads", default="", help="e.g. 1,2,4 intra-op threads (0 = auto)")
+    tts.add_argument("--repeats", type=int, default=3)
+    tts.add_argument("--json", action="store_true")
 
     stt = child.add_parser("stt", help="Test STT")
     stt.add_argument("--seconds", type=float, default=3.0)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+
+def replay_command(args: argparse.Namespace) -> None:
+    from openclaw_assistant.config.loader import load_settings
+    from openclaw_assistant.offline.replay import format_report, run_replay
+
+    if not args.corpus.is_dir():
+        raise SystemExit(f"Corpus directory not found: {args.corpus}")
+    settings = load_settings()
+    report = run_replay(
+        args.corpus,
+        settings,
+        output_dir=args.output,
+        workers=args.workers,
+        use_gateway=args.openclaw,
+        stub_latency_seconds=args.stub_latency_ms / 1000.0,
+        tts=not args.no_tts,
+    )
+    if args.json:
+        print(json.dumps(report.summary(), indent=2))
+        return
+    print(format_report(report))
+
+
+def add_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
+    parser = subparsers.add_parser(
+        "replay", help="Drive the pipeline from a directory of command WAVs"
+    )
+    parser.add_argument("--corpus", type=Path, required=True)
+    parser.add_argument("--output", type=Path, default=Path("replay-output"))
+    parser.add_argument("--workers", type=int, default=1, help=f"up to {os.cpu_count() or 1}")
+    parser.add_argument("--openclaw", action="store_true", help="Send prompts to the gateway")
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0)
+    parser.add_argument("--no-tts", action="store_true", help="Write response text, not audio")
+    parser.add_argument("--json", action="store_true")
+    parser.set_defaults(handler=replay_command)
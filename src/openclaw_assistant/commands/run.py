@@ -6,12 +6,12 @@ from openclaw_assistant.config.loader import load_settings
 from openclaw_assistant.observability.logging import configure_logging
 
 
-def run_command() -> None:
+def run_command(*, async_mode: bool = False) -> None:
     configure_logging()
     settings = load_settings()
     runner = AppRunner(settings)
     SignalLifecycle(runner.stop).install()
     try:
-        runner.run()
+        runner.run(async_mode=async_mode)
     finally:
         runner.stop()
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+
+def transcribe_batch_command(args: argparse.Namespace) -> None:
+    from openclaw_assistant.config.loader import load_settings
+    from openclaw_assistant.offline.batch_transcribe import run_batch
+
+    if not args.directory.is_dir():
+        raise SystemExit(f"Directory not found: {args.directory}")
+    report = run_batch(
+        args.directory,
+        load_settings(),
+        output=args.output,
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
+    summary = report.summary()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(
+        f"Transcribed {summary['files']} files ({summary['errors']} errors), "
+        f"{summary['audio_seconds']} s of audio in {summary['wall_seconds']} s "
+        f"with {summary['workers']} worker(s)."
+    )
+    print(f"  throughput: {summary['audio_seconds_per_wall_second']} audio-s per wall-s")
+    print(f"  decode only: {summary['audio_seconds_per_decode_second']} audio-s per second")
+    print(f"  results: {args.output}")
+
+
+def add_subparser(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
+    parser = subparsers.add_parser(
+        "transcribe-batch", help="Transcribe a directory of WAV files to JSONL"
+    )
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--output", type=Path, default=Path("transcripts.jsonl"))
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None, help="Defaults to the CPU count")
+    parser.add_argument("--json", action="store_true")
+    parser.set_defaults(handler=transcribe_batch_command)
@@ -3,8 +3,17 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+from openclaw_assistant.core.intents import IntentMatcher, parse_local_commands
+
 from .settings import Settings
 
+_DEFAULT_LOCAL_INTENTS = (
+    "stop=stop|cancel|never mind|nevermind;"
+    "repeat=repeat|repeat that|say that again|come again;"
+    "louder=louder|volume up|speak up;"
+    "quieter=quieter|softer|volume down"
+)
+
 
 def _maybe_int(value: str | None) -> str | int | None:
     if value is None or value == "":
@@ -29,6 +38,13 @@ def _env_int(name: str, default: int) -> int:
     return int(value)
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _env_str(name: str, default: str) -> str:
     value = os.getenv(name)
     if value is None or value == "":
@@ -36,10 +52,30 @@ def _env_str(name: str, default: str) -> str:
     return value
 
 
+def _env_csv(name: str) -> tuple[str, ...]:
+    return tuple(part.strip() for part in _env_str(name, "").split(",") if part.strip())
+
+
+def _env_local_intents(name: str, default: str) -> str:
+    # Compiled once here so a bad table fails at startup, not on the first
+    # utterance.
+    spec = _env_str(name, default)
+    try:
+        IntentMatcher(parse_local_commands(spec))
+    except ValueError as error:
+        raise ValueError(f"{name}: {error}") from error
+    return spec
+
+
 def _env_path(name: str, default: Path) -> Path:
     return Path(_env_str(name, str(default))).expanduser()
 
 
+def _env_optional_path(name: str) -> Path | None:
+    value = _env_str(name, "").strip()
+    return Path(value).expanduser() if value else None
+
+
 def _load_env_file(path: Path) -> None:
     if not path.exists():
         return
@@ -65,6 +101,7 @@ def load_settings(project_root: Path | None = None) -> Settings:
             root / "models" / "porcupine" / "openclaw_mac.ppn",
         ),
         porcupine_sensitivity=_env_float("PORCUPINE_SENSITIVITY", 0.55),
+        wakeword_queue_blocks=_env_int("OPENCLAW_WAKEWORD_QUEUE_BLOCKS", 64),
         audio_input_device=_maybe_int(_env_str("OPENCLAW_AUDIO_INPUT_DEVICE", "")),
         audio_output_device=_maybe_int(_env_str("OPENCLAW_AUDIO_OUTPUT_DEVICE", "")),
         command_sample_rate=_env_int("OPENCLAW_COMMAND_SAMPLE_RATE", 16000),
@@ -72,9 +109,22 @@ def load_settings(project_root: Path | None = None) -> Settings:
         record_min_seconds=_env_float("OPENCLAW_RECORD_MIN_SECONDS", 1.0),
         silence_seconds=_env_float("OPENCLAW_SILENCE_SECONDS", 0.9),
         silence_threshold=_env_float("OPENCLAW_SILENCE_THRESHOLD", 180.0),
+        endpoint_hop_ms=_env_float("OPENCLAW_ENDPOINT_HOP_MS", 10.0),
+        endpoint_noise_ratio=_env_float("OPENCLAW_ENDPOINT_NOISE_RATIO", 2.0),
+        endpoint_hysteresis=_env_float("OPENCLAW_ENDPOINT_HYSTERESIS", 1.5),
+        endpoint_noise_alpha=_env_float("OPENCLAW_ENDPOINT_NOISE_ALPHA", 0.05),
+        capture_ring_seconds=_env_float("OPENCLAW_CAPTURE_RING_SECONDS", 12.0),
+        capture_preroll_seconds=_env_float("OPENCLAW_CAPTURE_PREROLL_SECONDS", 0.0),
+        capture_from_wake=_env_bool("OPENCLAW_CAPTURE_FROM_WAKE", False),
         wakeword_start_delay=_env_float("OPENCLAW_WAKEWORD_START_DELAY", 0.4),
         listen_start_prompt=_env_str("OPENCLAW_LISTEN_START_PROMPT", "Listening").strip(),
         wake_hello_prompt=_env_str("OPENCLAW_WAKE_HELLO_PROMPT", "Hi").strip(),
+        wake_earcon_path=_env_optional_path("OPENCLAW_WAKE_EARCON_PATH"),
+        listen_earcon_path=_env_optional_path("OPENCLAW_LISTEN_EARCON_PATH"),
+        prompt_cache_dir=_env_path(
+            "OPENCLAW_PROMPT_CACHE_DIR",
+            root / "models" / "cache" / "prompts",
+        ),
         whisper_model=_env_str("OPENCLAW_WHISPER_MODEL", "small.en"),
         whisper_device=_env_str("OPENCLAW_WHISPER_DEVICE", "cpu"),
         whisper_compute_type=_env_str("OPENCLAW_WHISPER_COMPUTE_TYPE", "int8").strip(),
@@ -83,6 +133,16 @@ def load_settings(project_root: Path | None = None) -> Settings:
             "OPENCLAW_WHISPER_DOWNLOAD_ROOT",
             root / "models" / "whisper",
         ),
+        stt_streaming=_env_bool("OPENCLAW_STT_STREAMING", False),
+        stt_stream_step_seconds=_env_float("OPENCLAW_STT_STREAM_STEP_SECONDS", 1.0),
+        stt_trim_silence=_env_bool("OPENCLAW_STT_TRIM_SILENCE", True),
+        stt_speech_pad_ms=_env_float("OPENCLAW_STT_SPEECH_PAD_MS", 200.0),
+        whisper_fast_model=_env_str("OPENCLAW_WHISPER_FAST_MODEL", "").strip(),
+        stt_escalate_avg_logprob=_env_float("OPENCLAW_STT_ESCALATE_AVG_LOGPROB", -0.6),
+        stt_escalate_no_speech_prob=_env_float("OPENCLAW_STT_ESCALATE_NO_SPEECH_PROB", 0.5),
+        stt_escalate_seconds=_env_float("OPENCLAW_STT_ESCALATE_SECONDS", 3.0),
+        stt_worker_process=_env_bool("OPENCLAW_STT_WORKER_PROCESS", False),
+        stt_worker_timeout_seconds=_env_float("OPENCLAW_STT_WORKER_TIMEOUT_SECONDS", 30.0),
         kokoro_model_path=_env_path(
             "KOKORO_MODEL_PATH",
             root / "models" / "kokoro" / "kokoro-v1.0.onnx",
@@ -94,10 +154,40 @@ def load_settings(project_root: Path | None = None) -> Settings:
         kokoro_voice=_env_str("KOKORO_VOICE", "af_heart"),
         kokoro_speed=_env_float("KOKORO_SPEED", 1.0),
         kokoro_language=_env_str("KOKORO_LANGUAGE", "en-us"),
+        kokoro_model_variant=_env_str("KOKORO_MODEL_VARIANT", "").strip().lower(),
+        kokoro_intra_op_threads=_env_int("KOKORO_INTRA_OP_THREADS", 0),
+        kokoro_inter_op_threads=_env_int("KOKORO_INTER_OP_THREADS", 0),
+        kokoro_graph_optimization=_env_str("KOKORO_GRAPH_OPTIMIZATION", "all").strip().lower(),
+        kokoro_execution_mode=_env_str("KOKORO_EXECUTION_MODE", "sequential").strip().lower(),
+        kokoro_cpu_mem_arena=_env_bool("KOKORO_CPU_MEM_ARENA", True),
         openclaw_rest_url=_env_str("OPENCLAW_REST_URL", "http://127.0.0.1:3000/v1/assistant").strip(),
+        openclaw_fallback_urls=_env_csv("OPENCLAW_FALLBACK_URLS"),
+        openclaw_hedge_percentile=_env_float("OPENCLAW_HEDGE_PERCENTILE", 95.0),
+        openclaw_hedge_delay_ms=_env_float("OPENCLAW_HEDGE_DELAY_MS", 1500.0),
+        openclaw_breaker_failures=_env_int("OPENCLAW_BREAKER_FAILURES", 3),
+        openclaw_breaker_cooldown_seconds=_env_float("OPENCLAW_BREAKER_COOLDOWN_SECONDS", 30.0),
         openclaw_timeout_seconds=_env_float("OPENCLAW_TIMEOUT_SECONDS", 10.0),
+        openclaw_pool_size=_env_int("OPENCLAW_POOL_SIZE", 4),
+        openclaw_retries=_env_int("OPENCLAW_RETRIES", 2),
+        openclaw_retry_backoff_seconds=_env_float("OPENCLAW_RETRY_BACKOFF_SECONDS", 0.1),
+        openclaw_preconnect=_env_bool("OPENCLAW_PRECONNECT", True),
+        stream_responses=_env_bool("OPENCLAW_STREAM_RESPONSES", False),
+        local_intents=_env_bool("OPENCLAW_LOCAL_INTENTS", True),
+        local_intent_phrases=_env_local_intents(
+            "OPENCLAW_LOCAL_INTENT_PHRASES", _DEFAULT_LOCAL_INTENTS
+        ),
+        speculative_dispatch=_env_bool("OPENCLAW_SPECULATIVE_DISPATCH", False),
+        speculation_pause_ms=_env_float("OPENCLAW_SPECULATION_PAUSE_MS", 250.0),
         wakeword_label=_env_str("WAKEWORD_LABEL", "wake word").strip(),
         tts_fade_ms=_env_float("OPENCLAW_TTS_FADE_MS", 20.0),
         tts_padding_ms=_env_float("OPENCLAW_TTS_PADDING_MS", 40.0),
         tts_prewarm_ms=_env_float("OPENCLAW_TTS_PREWARM_MS", 50.0),
+        tts_pipelined=_env_bool("OPENCLAW_TTS_PIPELINED", True),
+        tts_first_unit_chars=_env_int("OPENCLAW_TTS_FIRST_UNIT_CHARS", 60),
+        tts_callback_playback=_env_bool("OPENCLAW_TTS_CALLBACK_PLAYBACK", True),
+        tts_cache_dir=_env_path("OPENCLAW_TTS_CACHE_DIR", root / "models" / "cache" / "tts"),
+        tts_cache_memory_mb=_env_float("OPENCLAW_TTS_CACHE_MEMORY_MB", 32.0),
+        tts_cache_disk_mb=_env_float("OPENCLAW_TTS_CACHE_DISK_MB", 256.0),
+        tts_phoneme_cache_entries=_env_int("OPENCLAW_TTS_PHONEME_CACHE_ENTRIES", 1024),
+        tts_phoneme_word_level=_env_bool("OPENCLAW_TTS_PHONEME_WORD_LEVEL", False),
     )
@@ -13,6 +13,23 @@ class KokoroConfig:
     language: str
 
 
+@dataclass(frozen=True)
+class KokoroSessionConfig:
+    intra_op_threads: int
+    inter_op_threads: int
+    graph_optimization: str
+    execution_mode: str
+    cpu_mem_arena: bool
+
+
+def model_variant_path(model_path: Path, variant: str) -> Path:
+    # "int8" turns kokoro-v1.0.onnx into kokoro-v1.0.int8.onnx; "" and "fp32"
+    # keep the configured file.
+    if variant in {"", "fp32"}:
+        return model_path
+    return model_path.with_name(f"{model_path.stem}.{variant}{model_path.suffix}")
+
+
 @dataclass(frozen=True)
 class TTSPlaybackConfig:
     output_device: str | int | None
@@ -27,6 +44,7 @@ class Settings:
     porcupine_access_key: str
     porcupine_keyword_path: Path
     porcupine_sensitivity: float
+    wakeword_queue_blocks: int
     audio_input_device: str | int | None
     audio_output_device: str | int | None
     command_sample_rate: int
@@ -34,36 +52,94 @@ class Settings:
     record_min_seconds: float
     silence_seconds: float
     silence_threshold: float
+    endpoint_hop_ms: float
+    endpoint_noise_ratio: float
+    endpoint_hysteresis: float
+    endpoint_noise_alpha: float
+    capture_ring_seconds: float
+    capture_preroll_seconds: float
+    capture_from_wake: bool
     wakeword_start_delay: float
     listen_start_prompt: str
     wake_hello_prompt: str
+    wake_earcon_path: Path | None
+    listen_earcon_path: Path | None
+    prompt_cache_dir: Path
     whisper_model: str
     whisper_device: str
     whisper_compute_type: str
     whisper_language: str
     whisper_download_root: Path
+    stt_streaming: bool
+    stt_stream_step_seconds: float
+    stt_trim_silence: bool
+    stt_speech_pad_ms: float
+    whisper_fast_model: str
+    stt_escalate_avg_logprob: float
+    stt_escalate_no_speech_prob: float
+    stt_escalate_seconds: float
+    stt_worker_process: bool
+    stt_worker_timeout_seconds: float
     kokoro_model_path: Path
     kokoro_voices_path: Path
     kokoro_voice: str
     kokoro_speed: float
     kokoro_language: str
+    kokoro_model_variant: str
+    kokoro_intra_op_threads: int
+    kokoro_inter_op_threads: int
+    kokoro_graph_optimization: str
+    kokoro_execution_mode: str
+    kokoro_cpu_mem_arena: bool
     openclaw_rest_url: str
+    openclaw_fallback_urls: tuple[str, ...]
+    openclaw_hedge_percentile: float
+    openclaw_hedge_delay_ms: float
+    openclaw_breaker_failures: int
+    openclaw_breaker_cooldown_seconds: float
     openclaw_timeout_seconds: float
+    openclaw_pool_size: int
+    openclaw_retries: int
+    openclaw_retry_backoff_seconds: float
+    openclaw_preconnect: bool
+    stream_responses: bool
+    local_intents: bool
+    local_intent_phrases: str
+    speculative_dispatch: bool
+    speculation_pause_ms: float
     wakeword_label: str
     tts_fade_ms: float
     tts_padding_ms: float
     tts_prewarm_ms: float
+    tts_pipelined: bool
+    tts_first_unit_chars: int
+    tts_callback_playback: bool
+    tts_cache_dir: Path
+    tts_cache_memory_mb: float
+    tts_cache_disk_mb: float
+    tts_phoneme_cache_entries: int
+    tts_phoneme_word_level: bool
 
     @property
     def kokoro(self) -> KokoroConfig:
         return KokoroConfig(
-            model_path=self.kokoro_model_path,
+            model_path=model_variant_path(self.kokoro_model_path, self.kokoro_model_variant),
             voices_path=self.kokoro_voices_path,
             voice=self.kokoro_voice,
             speed=self.kokoro_speed,
             language=self.kokoro_language,
         )
 
+    @property
+    def kokoro_session(self) -> KokoroSessionConfig:
+        return KokoroSessionConfig(
+            intra_op_threads=self.kokoro_intra_op_threads,
+            inter_op_threads=self.kokoro_inter_op_threads,
+            graph_optimization=self.kokoro_graph_optimization,
+            execution_mode=self.kokoro_execution_mode,
+            cpu_mem_arena=self.kokoro_cpu_mem_arena,
+        )
+
     @property
     def tts_playback(self) -> TTSPlaybackConfig:
         return TTSPlaybackConfig(
@@ -78,7 +154,10 @@ class Settings:
             raise RuntimeError("Missing PORCUPINE_ACCESS_KEY. Set it in your environment.")
         if not self.porcupine_keyword_path.exists():
             raise RuntimeError(f"Missing wake-word model: {self.porcupine_keyword_path}")
-        if include_tts_assets and not self.kokoro_model_path.exists():
-            raise RuntimeError(f"Missing Kokoro model: {self.kokoro_model_path}")
+        if include_tts_assets and not self.kokoro.model_path.exists():
+            raise RuntimeError(f"Missing Kokoro model: {self.kokoro.model_path}")
         if include_tts_assets and not self.kokoro_voices_path.exists():
             raise RuntimeError(f"Missing Kokoro voices: {self.kokoro_voices_path}")
+        for earcon in (self.wake_earcon_path, self.listen_earcon_path):
+            if include_tts_assets and earcon is not None and not earcon.exists():
+                raise RuntimeError(f"Missing earcon WAV: {earcon}")
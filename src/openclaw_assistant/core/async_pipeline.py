@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.events import (
+    ActionCompleted,
+    AudioCaptured,
+    ListenStarted,
+    LocalIntentHandled,
+    PipelineError,
+    ResponseSentence,
+    ResponseSpoken,
+    RuntimeReady,
+    TextTranscribed,
+    WakeDetected,
+)
+from openclaw_assistant.core.sentences import SentenceChunker
+from openclaw_assistant.plugins.registry import AsyncPluginRegistry
+
+_READY_POLL_SECONDS = 0.1
+# Rendered sentences waiting for playback; one keeps synthesis a step ahead.
+_RENDER_AHEAD = 1
+
+
+class AsyncPipelineOrchestrator:
+    # Same cycle and events as PipelineOrchestrator, but stages are awaited,
+    # so independent work overlaps: the action stage prepares (pre-connects)
+    # while the command is recorded, and streamed sentences are synthesized
+    # while the previous one plays. Cancelling `run_forever()` stops the loop.
+    def __init__(self, context: RuntimeContext, registry: AsyncPluginRegistry) -> None:
+        self.context = context
+        self.registry = registry
+
+    def _emit(self, event: object) -> None:
+        self.registry.emit(event, self.context)
+
+    async def _prepare(self) -> None:
+        try:
+            await self.registry.action_stage.prepare(self.context)
+        except Exception as error:
+            logging.debug("Action stage prepare failed: %s", error)
+
+    async def run_once_after_wake(self) -> str:
+        self._emit(WakeDetected(label=self.context.settings.wakeword_label))
+        self._emit(ListenStarted(prompt=self.context.settings.listen_start_prompt))
+        prepare = asyncio.create_task(self._prepare())
+        try:
+            audio = await self.registry.listen_stage.capture_audio(self.context)
+            self._emit(AudioCaptured(sample_count=audio.size, audio=audio))
+
+            text = (await self.registry.transcribe_stage.transcribe(audio, self.context)).strip()
+            self._emit(TextTranscribed(text=text))
+            if not text:
+                return ""
+
+            intent = await self.registry.intent_stage.handle(text, self.context)
+            if intent is not None:
+                self._emit(LocalIntentHandled(intent=intent, text=text))
+                return text
+
+            if self.context.settings.stream_responses:
+                await self._act_streaming(text)
+                return text
+
+            response = await self.registry.action_stage.execute(text, self.context)
+            self._emit(ActionCompleted(prompt=text, response=response))
+            if response:
+                await self.registry.speak_stage.speak(response, self.context)
+                self._emit(ResponseSpoken(response=response))
+            return text
+        finally:
+            prepare.cancel()
+
+    async def _act_streaming(self, text: str) -> None:
+        sentences: asyncio.Queue[str | None] = asyncio.Queue()
+        speaking = asyncio.create_task(self._speak_sentences(sentences))
+        try:
+            chunker = SentenceChunker()
+            deltas: list[str] = []
+            async for delta in self.registry.action_stage.execute_stream(text, self.context):
+                deltas.append(delta)
+                for sentence in chunker.feed(delta):
+                    sentences.put_nowait(sentence)
+            response = "".join(deltas).strip()
+            self._emit(ActionCompleted(prompt=text, response=response))
+            tail = chunker.flush()
+            if tail:
+                sentences.put_nowait(tail)
+            sentences.put_nowait(None)
+            await speaking
+        finally:
+            speaking.cancel()
+        if response:
+            self._emit(ResponseSpoken(response=response))
+
+    async def _speak_sentences(self, sentences: asyncio.Queue[str | None]) -> None:
+        speak_stage = self.registry.speak_stage
+        rendered: asyncio.Queue[tuple[str, object] | None] = asyncio.Queue(_RENDER_AHEAD)
+
+        async def _render() -> None:
+            while (sentence := await sentences.get()) is not None:
+                await rendered.put((sentence, await speak_stage.render(sentence, self.context)))
+            await rendered.put(None)
+
+        rendering = asyncio.create_task(_render())
+        try:
+            while (item := await rendered.get()) is not None:
+                sentence, clip = item
+                self._emit(ResponseSentence(text=sentence))
+                await speak_stage.play(clip, self.context)
+            await rendering
+        finally:
+            rendering.cancel()
+
+    async def run_forever(self) -> None:
+        wakeword = self.context.wakeword
+        stop_event = self.context.stop_event
+        try:
+            while not self.context.readiness.is_ready:
+                if stop_event.is_set():
+                    return
+                await asyncio.sleep(_READY_POLL_SECONDS)
+            self._emit(RuntimeReady(warmup_ms=self.context.readiness.timings_ms))
+            sample_rate, frame_length = wakeword.audio_params()
+            logging.info(
+                "Async wake loop started for '%s' at %d Hz with frame length %d",
+                self.context.settings.wakeword_label,
+                sample_rate,
+                frame_length,
+            )
+            while not stop_event.is_set():
+                detected = await self.registry.wakeword_listener.wait_for_wakeword(
+                    self.context,
+                    timeout_seconds=None,
+                )
+                if not detected:
+                    continue
+                logging.info("Wake word detected.")
+                wakeword.pause()
+                try:
+                    text = await self.run_once_after_wake()
+                    if not text:
+                        logging.info("No speech detected after wake word.")
+                except Exception as error:
+                    self._emit(PipelineError(stage="run_once_after_wake", error=str(error)))
+                    logging.exception("Pipeline cycle failed: %s", error)
+                finally:
+                    wakeword.resume()
+        finally:
+            wakeword.close()
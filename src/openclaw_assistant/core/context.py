@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from openclaw_assistant.config.settings import Settings
 from openclaw_assistant.core.contracts import (
@@ -11,6 +11,7 @@ from openclaw_assistant.core.contracts import (
     Transcriber,
     WakewordDetector,
 )
+from openclaw_assistant.core.readiness import Readiness
 
 
 @dataclass
@@ -22,3 +23,4 @@ class RuntimeContext:
     transcriber: Transcriber
     executor: ActionExecutor
     speaker: Speaker
+    readiness: Readiness = field(default_factory=lambda: Readiness(ready=True))
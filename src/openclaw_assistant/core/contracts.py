@@ -1,33 +1,153 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 import numpy as np
 
 
+class WakewordFrameDetector(Protocol):
+    @property
+    def sample_rate(self) -> int: ...
+
+    @property
+    def frame_length(self) -> int: ...
+
+    def process(self, pcm: np.ndarray) -> bool: ...
+
+    def close(self) -> None: ...
+
+
 class WakewordDetector(Protocol):
     def audio_params(self) -> tuple[int, int]: ...
 
     def wait_for_wakeword(self, timeout_seconds: float | None = None) -> bool: ...
 
+    def pause(self) -> None: ...
+
+    def resume(self) -> None: ...
+
+    def close(self) -> None: ...
+
 
 class Listener(Protocol):
     def record_command_audio(self) -> np.ndarray: ...
 
 
+@dataclass(frozen=True)
+class SpeechMap:
+    # Speech regions of one captured command as [start, end) sample ranges,
+    # padded and merged by the listener; empty when no speech was detected.
+    sample_rate: int
+    length: int
+    regions: tuple[tuple[int, int], ...]
+
+    @property
+    def speech_samples(self) -> int:
+        return sum(end - start for start, end in self.regions)
+
+    def extract(self, audio: np.ndarray) -> np.ndarray:
+        if len(self.regions) == 1:
+            start, end = self.regions[0]
+            return audio[start:end]
+        return np.concatenate([audio[start:end] for start, end in self.regions])
+
+
+@runtime_checkable
+class SpeechMapProvider(Protocol):
+    def last_speech_map(self) -> SpeechMap | None: ...
+
+
+class CaptureObserver(Protocol):
+    def capture_started(self, sample_rate: int, max_samples: int) -> None: ...
+
+    def capture_block(self, pcm: np.ndarray) -> None: ...
+
+
+class SpeculationObserver(Protocol):
+    # Told when speech pauses long enough to speculate on the capture so far
+    # (`audio` is a copy) and when speech resumes before the endpoint.
+    def speech_paused(self, audio: np.ndarray) -> None: ...
+
+    def speech_resumed(self) -> None: ...
+
+
 class Transcriber(Protocol):
     def transcribe(self, audio: np.ndarray) -> str: ...
 
 
+@runtime_checkable
+class SpeechTranscriber(Protocol):
+    # Audio is already trimmed to speech, so no internal VAD pass is needed.
+    def transcribe_speech(self, audio: np.ndarray) -> str: ...
+
+
 class ActionExecutor(Protocol):
     def execute(self, prompt: str) -> str: ...
 
 
+@runtime_checkable
+class StreamingActionExecutor(Protocol):
+    # Yields response text deltas as they arrive from the gateway.
+    def execute_stream(self, prompt: str) -> Iterator[str]: ...
+
+
+@runtime_checkable
+class AsyncActionExecutor(Protocol):
+    async def execute(self, prompt: str) -> str: ...
+
+    def execute_stream(self, prompt: str) -> AsyncIterator[str]: ...
+
+    async def preconnect(self) -> None: ...
+
+
 class Speaker(Protocol):
     def speak(self, text: str) -> None: ...
 
 
+@runtime_checkable
+class RenderingSpeaker(Protocol):
+    # Synthesis and playback as separate steps, so they can overlap.
+    def render(self, text: str) -> tuple[np.ndarray, int]: ...
+
+    def play(self, audio: np.ndarray, sample_rate: int) -> None: ...
+
+
+class PendingPlayback(Protocol):
+    def done(self) -> bool: ...
+
+    # True once played or cancelled; raises if synthesis failed.
+    def wait(self, timeout: float | None = None) -> bool: ...
+
+    def cancel(self) -> None: ...
+
+
+@runtime_checkable
+class QueueingSpeaker(Protocol):
+    # Queues speech and returns at once; audio plays in the background.
+    def speak_async(self, text: str) -> PendingPlayback: ...
+
+    def drain(self, timeout: float | None = None) -> bool: ...
+
+    def cancel(self) -> None: ...
+
+
+@runtime_checkable
+class ReplayingSpeaker(Protocol):
+    # Replays the audio of the last spoken response without re-synthesizing.
+    def replay_last(self) -> bool: ...
+
+
+@runtime_checkable
+class VolumeSpeaker(Protocol):
+    def adjust_volume(self, factor: float) -> float: ...
+
+
+class WarmUp(Protocol):
+    def warm_up(self) -> None: ...
+
+
 @dataclass(frozen=True)
 class ActionResult:
     prompt: str
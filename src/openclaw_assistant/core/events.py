@@ -5,6 +5,11 @@ from dataclasses import dataclass
 import numpy as np
 
 
+@dataclass(frozen=True)
+class RuntimeReady:
+    warmup_ms: dict[str, float]
+
+
 @dataclass(frozen=True)
 class WakeDetected:
     label: str
@@ -21,17 +26,40 @@ class AudioCaptured:
     audio: np.ndarray
 
 
+@dataclass(frozen=True)
+class TranscriptPartial:
+    committed: str
+    tentative: str
+
+
+@dataclass(frozen=True)
+class TranscriptTier:
+    tier: str
+    escalation_reason: str
+
+
 @dataclass(frozen=True)
 class TextTranscribed:
     text: str
 
 
+@dataclass(frozen=True)
+class LocalIntentHandled:
+    intent: str
+    text: str
+
+
 @dataclass(frozen=True)
 class ActionCompleted:
     prompt: str
     response: str
 
 
+@dataclass(frozen=True)
+class ResponseSentence:
+    text: str
+
+
 @dataclass(frozen=True)
 class ResponseSpoken:
     response: str
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+_NORMALIZE = re.compile(r"[^\w'\s]+")
+_FILLER_BEFORE = r"(?:(?:ok|okay|hey|please)\s+)*"
+_FILLER_AFTER = r"(?:\s+(?:please|now|thanks|thank you))*"
+
+
+@dataclass(frozen=True)
+class LocalCommand:
+    name: str
+    phrases: tuple[str, ...]
+
+
+def normalize_utterance(text: str) -> str:
+    return " ".join(_NORMALIZE.sub(" ", text.lower()).split())
+
+
+def parse_local_commands(spec: str) -> tuple[LocalCommand, ...]:
+    # "stop=stop|cancel;repeat=repeat that|say that again". Entries that
+    # repeat a name add their phrases to the first one.
+    commands: dict[str, tuple[str, ...]] = {}
+    for entry in spec.split(";"):
+        if not entry.strip():
+            continue
+        name, separator, phrases = entry.partition("=")
+        name = name.strip()
+        if not separator or not name.isidentifier():
+            raise ValueError(f"Invalid local intent entry: {entry!r}")
+        normalized = tuple(
+            phrase for phrase in map(normalize_utterance, phrases.split("|")) if phrase
+        )
+        if not normalized:
+            raise ValueError(f"Local intent '{name}' has no phrases")
+        commands[name] = commands.get(name, ()) + normalized
+    return tuple(LocalCommand(name, phrases) for name, phrases in commands.items())
+
+
+class IntentMatcher:
+    # One precompiled alternation over every phrase. Only whole utterances
+    # match (plus a little politeness filler), so "stop the timer in ten
+    # minutes" still goes to the gateway.
+    def __init__(self, commands: tuple[LocalCommand, ...]) -> None:
+        self.commands = commands
+        alternatives = [
+            f"(?P<{command.name}>"
+            + "|".join(
+                re.escape(phrase).replace(r"\ ", r"\s+")
+                for phrase in sorted(command.phrases, key=len, reverse=True)
+            )
+            + ")"
+            for command in commands
+        ]
+        self._pattern = (
+            re.compile(f"^{_FILLER_BEFORE}(?:{'|'.join(alternatives)}){_FILLER_AFTER}$")
+            if alternatives
+            else None
+        )
+
+    def match(self, text: str) -> str | None:
+        if self._pattern is None:
+            return None
+        found = self._pattern.match(normalize_utterance(text))
+        return found.lastgroup if found else None
@@ -4,16 +4,25 @@ import logging
 from collections.abc import Iterable
 
 from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.contracts import PendingPlayback
 from openclaw_assistant.core.events import (
     ActionCompleted,
     AudioCaptured,
     ListenStarted,
+    LocalIntentHandled,
     PipelineError,
+    ResponseSentence,
     ResponseSpoken,
+    RuntimeReady,
     TextTranscribed,
     WakeDetected,
 )
-from openclaw_assistant.plugins.registry import PluginRegistry
+from openclaw_assistant.core.sentences import SentenceChunker
+from openclaw_assistant.plugins.registry import (
+    PluginRegistry,
+    QueueingSpeakStage,
+    StreamingActionStage,
+)
 
 
 class PipelineOrchestrator:
@@ -36,7 +45,19 @@ class PipelineOrchestrator:
         if not text:
             return ""
 
-        response = self.registry.action_stage.execute(text, self.context)
+        intent = self.registry.intent_stage.handle(text, self.context)
+        if intent is not None:
+            self._emit(LocalIntentHandled(intent=intent, text=text))
+            return text
+
+        action_stage = self.registry.action_stage
+        if self.context.settings.stream_responses and isinstance(
+            action_stage, StreamingActionStage
+        ):
+            self._act_streaming(action_stage, text)
+            return text
+
+        response = action_stage.execute(text, self.context)
         self._emit(ActionCompleted(prompt=text, response=response))
 
         if response:
@@ -44,29 +65,77 @@ class PipelineOrchestrator:
             self._emit(ResponseSpoken(response=response))
         return text
 
+    def _speak_sentence(self, sentence: str, pending: list[PendingPlayback]) -> None:
+        self._emit(ResponseSentence(text=sentence))
+        stage = self.registry.speak_stage
+        if isinstance(stage, QueueingSpeakStage):
+            playback = stage.enqueue(sentence, self.context)
+            if playback is not None:
+                pending.append(playback)
+            return
+        stage.speak(sentence, self.context)
+
+    def _act_streaming(self, action_stage: StreamingActionStage, text: str) -> None:
+        # Each sentence is spoken as soon as it is complete, so the first audio
+        # no longer waits for the whole reply. Queued sentences play while the
+        # reply keeps streaming; the cycle ends once they have all played, or
+        # at once with them cancelled if the reply fails.
+        chunker = SentenceChunker()
+        deltas: list[str] = []
+        pending: list[PendingPlayback] = []
+        try:
+            for delta in action_stage.execute_stream(text, self.context):
+                deltas.append(delta)
+                for sentence in chunker.feed(delta):
+                    self._speak_sentence(sentence, pending)
+            response = "".join(deltas).strip()
+            self._emit(ActionCompleted(prompt=text, response=response))
+
+            tail = chunker.flush()
+            if tail:
+                self._speak_sentence(tail, pending)
+        except BaseException:
+            for playback in pending:
+                playback.cancel()
+            raise
+        for playback in pending:
+            playback.wait()
+        if response:
+            self._emit(ResponseSpoken(response=response))
+
     def run_forever(self) -> None:
-        sample_rate, frame_length = self.context.wakeword.audio_params()
-        logging.info(
-            "Wake loop started for '%s' at %d Hz with frame length %d",
-            self.context.settings.wakeword_label,
-            sample_rate,
-            frame_length,
-        )
-        while not self.context.stop_event.is_set():
-            detected = self.registry.wakeword_listener.wait_for_wakeword(
-                self.context,
-                timeout_seconds=None,
+        wakeword = self.context.wakeword
+        try:
+            if not self.context.readiness.wait(self.context.stop_event):
+                return
+            self._emit(RuntimeReady(warmup_ms=self.context.readiness.timings_ms))
+            sample_rate, frame_length = wakeword.audio_params()
+            logging.info(
+                "Wake loop started for '%s' at %d Hz with frame length %d",
+                self.context.settings.wakeword_label,
+                sample_rate,
+                frame_length,
             )
-            if not detected:
-                continue
-            logging.info("Wake word detected.")
-            try:
-                text = self.run_once_after_wake()
-                if not text:
-                    logging.info("No speech detected after wake word.")
-            except Exception as error:
-                self._emit(PipelineError(stage="run_once_after_wake", error=str(error)))
-                logging.exception("Pipeline cycle failed: %s", error)
+            while not self.context.stop_event.is_set():
+                detected = self.registry.wakeword_listener.wait_for_wakeword(
+                    self.context,
+                    timeout_seconds=None,
+                )
+                if not detected:
+                    continue
+                logging.info("Wake word detected.")
+                wakeword.pause()
+                try:
+                    text = self.run_once_after_wake()
+                    if not text:
+                        logging.info("No speech detected after wake word.")
+                except Exception as error:
+                    self._emit(PipelineError(stage="run_once_after_wake", error=str(error)))
+                    logging.exception("Pipeline cycle failed: %s", error)
+                finally:
+                    wakeword.resume()
+        finally:
+            wakeword.close()
 
     def run_events(self) -> Iterable[object]:
         events: list[object] = []
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import threading
+
+_WAIT_POLL_SECONDS = 0.1
+
+
+class Readiness:
+    # Startup gate: the wake loop does not start listening until every warm-up
+    # has finished (successfully or not) and `set()` is called.
+    def __init__(self, ready: bool = False) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._timings: dict[str, float] = {}
+        if ready:
+            self._event.set()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def timings_ms(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._timings)
+
+    def record(self, component: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self._timings[component] = elapsed_ms
+
+    def set(self) -> None:
+        self._event.set()
+
+    def wait(self, stop_event: threading.Event) -> bool:
+        while not self._event.wait(_WAIT_POLL_SECONDS):
+            if stop_event.is_set():
+                return False
+        return True
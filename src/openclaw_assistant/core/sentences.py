@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import re
+
+# Terminal punctuation (plus closing quotes/brackets) followed by whitespace,
+# or a paragraph break.
+_BOUNDARY = re.compile(r"[.!?…]+[\"'”’)\]]*(?=\s)|\n\s*\n")
+_LAST_WORD = re.compile(r"(\S+)[.]+$")
+_ABBREVIATIONS = frozenset(
+    {"mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e", "approx"}
+)
+_CLAUSE_BREAK = re.compile(r"[,;:]\s")
+_WORD_BREAK = re.compile(r"\s")
+
+
+class SentenceChunker:
+    # Accumulates streamed text deltas and releases whole sentences as soon as
+    # the whitespace after their terminal punctuation has arrived. Runs longer
+    # than `max_chars` without a boundary are cut at the last comma or space.
+    def __init__(self, *, min_chars: int = 2, max_chars: int = 240) -> None:
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self._buffer = ""
+        self._scan = 0
+
+    def _is_abbreviation(self, sentence: str) -> bool:
+        match = _LAST_WORD.search(sentence)
+        if match is None:
+            return False
+        word = match.group(1).lower()
+        return word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+    def feed(self, delta: str) -> list[str]:
+        self._buffer += delta
+        sentences: list[str] = []
+        start = 0
+        for match in _BOUNDARY.finditer(self._buffer, self._scan):
+            candidate = self._buffer[start : match.end()].strip()
+            if len(candidate) < self.min_chars or self._is_abbreviation(candidate):
+                continue
+            sentences.append(candidate)
+            start = match.end()
+        while len(self._buffer) - start > self.max_chars:
+            window = self._buffer[start : start + self.max_chars]
+            cuts = [match.end() for match in _CLAUSE_BREAK.finditer(window)] or [
+                match.end() for match in _WORD_BREAK.finditer(window)
+            ]
+            cut = start + (cuts[-1] if cuts else self.max_chars)
+            sentences.append(self._buffer[start:cut].strip())
+            start = cut
+        self._buffer = self._buffer[start:]
+        # Rescan from a little before the end: a boundary can straddle deltas.
+        self._scan = max(0, len(self._buffer) - 4)
+        return [sentence for sentence in sentences if sentence]
+
+    def flush(self) -> str:
+        rest, self._buffer, self._scan = self._buffer.strip(), "", 0
+        return rest
+
+
+def split_units(text: str, *, first_max_chars: int = 60, max_chars: int = 240) -> list[str]:
+    # Synthesis units for a whole reply: its sentences, with an over-long
+    # first sentence cut at its last clause break within `first_max_chars` so
+    # the first audio is ready sooner.
+    chunker = SentenceChunker(max_chars=max_chars)
+    units = chunker.feed(text + " ")
+    tail = chunker.flush()
+    if tail:
+        units.append(tail)
+    if units and len(units[0]) > first_max_chars:
+        cuts = [match.end() for match in _CLAUSE_BREAK.finditer(units[0][:first_max_chars])]
+        if cuts:
+            head = units[0]
+            units[:1] = [head[: cuts[-1]].strip(), head[cuts[-1] :].strip()]
+    return units
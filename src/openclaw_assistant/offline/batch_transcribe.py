@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.wav_io import read_wav, resample
+from openclaw_assistant.config.settings import Settings
+
+WHISPER_SAMPLE_RATE = 16000
+# Whisper decodes at most 30 s per window; longer files are VAD-chunked alone.
+MAX_PACKED_SECONDS = 30.0
+
+Decode = Callable[[np.ndarray, list[dict[str, float]] | None], Sequence[Any]]
+
+
+@dataclass
+class ClipResult:
+    path: str
+    audio_seconds: float
+    text: str = ""
+    error: str | None = None
+
+    def record(self) -> dict[str, object]:
+        record: dict[str, object] = {
+            "path": self.path,
+            "audio_seconds": round(self.audio_seconds, 3),
+            "text": self.text,
+        }
+        if self.error is not None:
+            record["error"] = self.error
+        return record
+
+
+@dataclass
+class ShardResult:
+    results: list[ClipResult]
+    setup_seconds: float
+    decode_seconds: float
+
+
+@dataclass
+class BatchReport:
+    results: list[ClipResult] = field(default_factory=list)
+    workers: int = 1
+    wall_seconds: float = 0.0
+    decode_seconds: float = 0.0
+
+    @property
+    def audio_seconds(self) -> float:
+        return sum(result.audio_seconds for result in self.results)
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "files": len(self.results),
+            "errors": sum(result.error is not None for result in self.results),
+            "workers": self.workers,
+            "audio_seconds": round(self.audio_seconds, 2),
+            "wall_seconds": round(self.wall_seconds, 2),
+            "audio_seconds_per_wall_second": round(
+                self.audio_seconds / self.wall_seconds if self.wall_seconds else 0.0, 2
+            ),
+            # Shards run concurrently, so the slowest one bounds decode throughput.
+            "audio_seconds_per_decode_second": round(
+                self.audio_seconds / self.decode_seconds if self.decode_seconds else 0.0, 2
+            ),
+        }
+
+
+def find_audio(corpus_dir: Path) -> list[Path]:
+    return sorted(corpus_dir.rglob("*.wav"))
+
+
+def iter_audio(
+    paths: Sequence[Path],
+    *,
+    sample_rate: int = WHISPER_SAMPLE_RATE,
+    prefetch: int = 16,
+) -> Iterator[tuple[Path, np.ndarray | Exception]]:
+    # WAV decoding and resampling run on a reader thread so they overlap with
+    # inference; the bounded queue keeps at most `prefetch` clips in memory.
+    items: queue.Queue[tuple[Path, np.ndarray | Exception] | None] = queue.Queue(
+        maxsize=max(1, prefetch)
+    )
+
+    def _read() -> None:
+        try:
+            for path in paths:
+                try:
+                    audio, source_rate = read_wav(path)
+                    items.put((path, resample(audio, source_rate, sample_rate)))
+                except Exception as error:
+                    items.put((path, error))
+        finally:
+            items.put(None)
+
+    threading.Thread(target=_read, name="batch-reader", daemon=True).start()
+    while (item := items.get()) is not None:
+        yield item
+
+
+def _join(segments: Sequence[Any]) -> str:
+    return " ".join(segment.text.strip() for segment in segments if segment.text.strip())
+
+
+def decode_batch(
+    batch: Sequence[tuple[str, np.ndarray]],
+    decode: Decode,
+    *,
+    sample_rate: int = WHISPER_SAMPLE_RATE,
+) -> list[ClipResult]:
+    results = [ClipResult(name, audio.size / sample_rate) for name, audio in batch]
+    try:
+        if len(batch) == 1 and batch[0][1].size > MAX_PACKED_SECONDS * sample_rate:
+            results[0].text = _join(decode(batch[0][1], None))
+            return results
+        # Pack short clips back to back; each clip timestamp becomes one batch
+        # element and segments are mapped back by their start time.
+        starts: list[float] = []
+        clips: list[dict[str, float]] = []
+        offset = 0
+        for _, audio in batch:
+            starts.append(offset / sample_rate)
+            clips.append(
+                {"start": offset / sample_rate, "end": (offset + audio.size) / sample_rate}
+            )
+            offset += audio.size
+        packed = np.concatenate([audio for _, audio in batch])
+        texts: list[list[str]] = [[] for _ in batch]
+        for segment in decode(packed, clips):
+            index = max(0, bisect.bisect_right(starts, segment.start + 1e-3) - 1)
+            if segment.text.strip():
+                texts[index].append(segment.text.strip())
+        for result, parts in zip(results, texts, strict=True):
+            result.text = " ".join(parts)
+    except Exception as error:
+        for result in results:
+            result.error = str(error)
+    return results
+
+
+def transcribe_files(
+    paths: Sequence[Path],
+    root: Path,
+    decode: Decode,
+    *,
+    batch_size: int,
+) -> list[ClipResult]:
+    results: list[ClipResult] = []
+    batch: list[tuple[str, np.ndarray]] = []
+
+    def _flush() -> None:
+        if batch:
+            results.extend(decode_batch(batch, decode))
+            batch.clear()
+
+    for path, audio in iter_audio(paths, prefetch=batch_size * 2):
+        name = path.relative_to(root).as_posix()
+        if isinstance(audio, Exception):
+            results.append(ClipResult(name, 0.0, error=str(audio)))
+            continue
+        if audio.size == 0:
+            results.append(ClipResult(name, 0.0))
+            continue
+        if audio.size > MAX_PACKED_SECONDS * WHISPER_SAMPLE_RATE:
+            _flush()
+            batch.append((name, audio))
+            _flush()
+            continue
+        batch.append((name, audio))
+        if len(batch) >= batch_size:
+            _flush()
+    _flush()
+    return results
+
+
+def _transcribe_shard(
+    paths: Sequence[Path],
+    root: Path,
+    settings: Settings,
+    batch_size: int,
+    cpu_threads: int,
+) -> ShardResult:
+    from openclaw_assistant.adapters.stt.faster_whisper import BatchedWhisperDecoder
+
+    started = time.perf_counter()
+    decoder = BatchedWhisperDecoder(settings, batch_size=batch_size, cpu_threads=cpu_threads)
+    setup_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    results = transcribe_files(paths, root, decoder.decode, batch_size=batch_size)
+    return ShardResult(results, setup_seconds, time.perf_counter() - started)
+
+
+def run_batch(
+    corpus_dir: Path,
+    settings: Settings,
+    *,
+    output: Path,
+    batch_size: int = 8,
+    workers: int | None = None,
+) -> BatchReport:
+    paths = find_audio(corpus_dir)
+    cores = os.cpu_count() or 1
+    workers = max(1, min(workers or cores, len(paths) or 1))
+    cpu_threads = max(1, cores // workers)
+    shards = [paths[index::workers] for index in range(workers)]
+    report = BatchReport(workers=workers)
+
+    started = time.perf_counter()
+    args = (corpus_dir, settings, batch_size, cpu_threads)
+    if workers == 1:
+        shard_results = [_transcribe_shard(paths, *args)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_transcribe_shard, shard, *args) for shard in shards]
+            shard_results = [future.result() for future in as_completed(futures)]
+    for shard_result in shard_results:
+        report.results.extend(shard_result.results)
+        report.decode_seconds = max(report.decode_seconds, shard_result.decode_seconds)
+    report.results.sort(key=lambda result: result.path)
+    write_results(output, report.results)
+    report.wall_seconds = time.perf_counter() - started
+    return report
+
+
+def write_results(path: Path, results: Sequence[ClipResult]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as handle:
+        for result in results:
+            handle.write(json.dumps(result.record()) + "\n")
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.command_buffer import (
+    CommandCaptureBuffer,
+    capture_until_endpoint,
+)
+from openclaw_assistant.adapters.audio.endpointer import EndpointerConfig, StreamingEndpointer
+from openclaw_assistant.adapters.audio.ring_buffer import PcmRingBuffer, RingReader
+
+CaptureFn = Callable[[RingReader, StreamingEndpointer], np.ndarray]
+
+
+@dataclass
+class CaptureBenchResult:
+    name: str
+    audio_seconds: float
+    timings_us: list[float] = field(default_factory=list)
+    peak_alloc_bytes: int = 0
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "capture": self.name,
+            "audio_seconds": round(self.audio_seconds, 3),
+            "iterations": len(self.timings_us),
+            "us_p50": round(float(np.percentile(self.timings_us, 50)), 1),
+            "us_p95": round(float(np.percentile(self.timings_us, 95)), 1),
+            "peak_alloc_kib": round(self.peak_alloc_bytes / 1024.0, 1),
+        }
+
+
+def synthetic_command(sample_rate: int, speech_seconds: float, tail_seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    t = np.arange(int(speech_seconds * sample_rate)) / sample_rate
+    # 220 ms syllables separated by 80 ms gaps so the noise floor sees real pauses.
+    syllables = (t % 0.3) < 0.22
+    speech = 4000 * np.sin(2 * np.pi * 220 * t) * syllables
+    tail = rng.normal(0.0, 20.0, int(tail_seconds * sample_rate))
+    return np.concatenate([speech, tail]).astype(np.int16)
+
+
+def list_capture(
+    reader: RingReader, endpointer: StreamingEndpointer, max_samples: int
+) -> np.ndarray:
+    # The pre-buffer capture path: a fresh array per block, a float32 copy per
+    # block for the energy math, then concatenate and convert at the end.
+    chunks: list[np.ndarray] = []
+    total = 0
+    while total < max_samples:
+        pcm = reader.read(min(endpointer.block_samples, max_samples - total), timeout=0)
+        if pcm is None:
+            break
+        chunks.append(np.asarray(pcm, dtype=np.int16))
+        total += pcm.size
+        pcm.astype(np.float32)
+        if endpointer.process(pcm):
+            break
+    audio = np.concatenate(chunks)
+    if endpointer.endpoint_sample is not None:
+        audio = audio[: endpointer.endpoint_sample]
+    return audio.astype(np.float32) / 32768.0
+
+
+def _run(
+    name: str,
+    capture: CaptureFn,
+    ring: PcmRingBuffer,
+    config: EndpointerConfig,
+    iterations: int,
+) -> CaptureBenchResult:
+    audio_seconds = 0.0
+    result = CaptureBenchResult(name=name, audio_seconds=0.0)
+    capture(RingReader(ring, 0), StreamingEndpointer(config))
+    for _ in range(iterations):
+        endpointer = StreamingEndpointer(config)
+        reader = RingReader(ring, 0)
+        started = time.perf_counter_ns()
+        audio = capture(reader, endpointer)
+        result.timings_us.append((time.perf_counter_ns() - started) / 1000.0)
+        audio_seconds = audio.size / config.sample_rate
+
+    endpointer = StreamingEndpointer(config)
+    reader = RingReader(ring, 0)
+    tracemalloc.start()
+    try:
+        capture(reader, endpointer)
+        _, result.peak_alloc_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    result.audio_seconds = audio_seconds
+    return result
+
+
+def run_capture_bench(
+    *,
+    sample_rate: int = 16000,
+    record_max_seconds: float = 8.0,
+    speech_seconds: float = 3.0,
+    iterations: int = 200,
+    config: EndpointerConfig | None = None,
+) -> list[CaptureBenchResult]:
+    config = config or EndpointerConfig(
+        sample_rate=sample_rate,
+        min_seconds=1.0,
+        trailing_silence_seconds=0.9,
+        silence_threshold=180.0,
+        max_seconds=record_max_seconds,
+    )
+    pcm = synthetic_command(sample_rate, speech_seconds, record_max_seconds)
+    ring = PcmRingBuffer(pcm.size)
+    ring.write(pcm)
+    max_samples = int(record_max_seconds * sample_rate)
+    buffer = CommandCaptureBuffer(max_samples)
+
+    def _preallocated(reader: RingReader, endpointer: StreamingEndpointer) -> np.ndarray:
+        return capture_until_endpoint(
+            lambda out: reader.read_into(out, timeout=0), endpointer, buffer
+        )
+
+    return [
+        _run(
+            "list",
+            lambda reader, endpointer: list_capture(reader, endpointer, max_samples),
+            ring,
+            config,
+            iterations,
+        ),
+        _run("preallocated", _preallocated, ring, config, iterations),
+    ]
+
+
+def format_report(results: list[CaptureBenchResult]) -> str:
+    lines = [f"{'capture':<13} {'audio_s':>7} {'us_p50':>9} {'us_p95':>9} {'peak_kib':>9}"]
+    for result in results:
+        row = result.summary()
+        lines.append(
+            f"{result.name:<13} {row['audio_seconds']:>7} {row['us_p50']:>9} "
+            f"{row['us_p95']:>9} {row['peak_alloc_kib']:>9}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.endpointer import EndpointerConfig
+from openclaw_assistant.adapters.gateway.stub import StubActionExecutor
+from openclaw_assistant.adapters.replay.file_io import (
+    FileListener,
+    FileSpeaker,
+    FileWakewordDetector,
+    ReplayCursor,
+    Synthesize,
+)
+from openclaw_assistant.adapters.stt.cascade import FULL_TIER, CascadedWhisperTranscriber
+from openclaw_assistant.config.settings import Settings
+from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.contracts import ActionExecutor, Transcriber
+from openclaw_assistant.core.events import (
+    ActionCompleted,
+    AudioCaptured,
+    PipelineError,
+    ResponseSpoken,
+    TextTranscribed,
+    TranscriptTier,
+    WakeDetected,
+)
+from openclaw_assistant.core.pipeline import PipelineOrchestrator
+from openclaw_assistant.plugins.registry import PluginRegistry
+
+STAGES = ("capture", "transcribe", "action", "speak")
+TIMINGS_FILE = "timings.jsonl"
+
+_STAGE_EVENTS: dict[type, str] = {
+    AudioCaptured: "capture",
+    TextTranscribed: "transcribe",
+    ActionCompleted: "action",
+    ResponseSpoken: "speak",
+}
+
+
+@dataclass
+class UtteranceTiming:
+    clip: str
+    audio_seconds: float = 0.0
+    transcript: str = ""
+    stt_tier: str = ""
+    response: str = ""
+    stages_ms: dict[str, float] = field(default_factory=dict)
+    total_ms: float = 0.0
+    error: str | None = None
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "clip": self.clip,
+            "audio_seconds": round(self.audio_seconds, 3),
+            "transcript": self.transcript,
+            "stt_tier": self.stt_tier,
+            "response": self.response,
+            **{f"{stage}_ms": round(self.stages_ms.get(stage, 0.0), 2) for stage in STAGES},
+            "total_ms": round(self.total_ms, 2),
+            "error": self.error,
+        }
+
+
+class StageClock:
+    # Event handler that timestamps pipeline events as they are emitted and
+    # turns the gaps between them into per-stage durations.
+    def __init__(self, cursor: ReplayCursor, sample_rate: int) -> None:
+        self.cursor = cursor
+        self.sample_rate = sample_rate
+        self.timings: list[UtteranceTiming] = []
+        self._started = 0.0
+        self._last = 0.0
+
+    def __call__(self, event: object, _context: RuntimeContext) -> None:
+        now = time.perf_counter()
+        if isinstance(event, WakeDetected):
+            self.timings.append(UtteranceTiming(clip=self.cursor.relative.as_posix()))
+            self._started = self._last = now
+            return
+        if not self.timings:
+            return
+        current = self.timings[-1]
+        stage = _STAGE_EVENTS.get(type(event))
+        if stage is not None:
+            current.stages_ms[stage] = (now - self._last) * 1000.0
+            self._last = now
+        if isinstance(event, AudioCaptured):
+            current.audio_seconds = event.sample_count / self.sample_rate
+        elif isinstance(event, TranscriptTier):
+            current.stt_tier = event.tier
+        elif isinstance(event, TextTranscribed):
+            current.transcript = event.text
+        elif isinstance(event, ActionCompleted):
+            current.response = event.response
+        elif isinstance(event, PipelineError):
+            current.error = event.error
+        current.total_ms = (now - self._started) * 1000.0
+
+
+@dataclass
+class ShardResult:
+    utterances: list[UtteranceTiming]
+    setup_seconds: float
+    replay_seconds: float
+
+
+@dataclass
+class ReplayReport:
+    utterances: list[UtteranceTiming]
+    workers: int
+    wall_seconds: float
+    replay_seconds: float
+
+    @property
+    def audio_seconds(self) -> float:
+        return sum(utterance.audio_seconds for utterance in self.utterances)
+
+    @property
+    def realtime_factor(self) -> float:
+        return self.audio_seconds / self.replay_seconds if self.replay_seconds else 0.0
+
+    def summary(self) -> dict[str, object]:
+        stats: dict[str, object] = {
+            "utterances": len(self.utterances),
+            "errors": sum(utterance.error is not None for utterance in self.utterances),
+            "workers": self.workers,
+            "audio_seconds": round(self.audio_seconds, 2),
+            "wall_seconds": round(self.wall_seconds, 2),
+            "replay_seconds": round(self.replay_seconds, 2),
+            "realtime_factor": round(self.realtime_factor, 2),
+        }
+        tiers = [utterance.stt_tier for utterance in self.utterances if utterance.stt_tier]
+        if tiers:
+            stats["stt_escalation_rate"] = round(tiers.count(FULL_TIER) / len(tiers), 3)
+        for stage in [*STAGES, "total"]:
+            values = [
+                utterance.total_ms if stage == "total" else utterance.stages_ms[stage]
+                for utterance in self.utterances
+                if stage == "total" or stage in utterance.stages_ms
+            ]
+            stats[f"{stage}_ms_p50"] = _percentile(values, 50)
+            stats[f"{stage}_ms_p95"] = _percentile(values, 95)
+        return stats
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    return round(float(np.percentile(values, q)), 2)
+
+
+def load_clips(corpus_dir: Path) -> list[Path]:
+    return sorted(corpus_dir.rglob("*.wav"))
+
+
+def _endpointer_config(settings: Settings) -> EndpointerConfig:
+    return EndpointerConfig(
+        sample_rate=settings.command_sample_rate,
+        min_seconds=settings.record_min_seconds,
+        trailing_silence_seconds=settings.silence_seconds,
+        silence_threshold=settings.silence_threshold,
+        hop_ms=settings.endpoint_hop_ms,
+        noise_ratio=settings.endpoint_noise_ratio,
+        hysteresis=settings.endpoint_hysteresis,
+        noise_alpha=settings.endpoint_noise_alpha,
+        max_seconds=settings.record_max_seconds,
+    )
+
+
+def replay_clips(
+    clips: Sequence[Path],
+    settings: Settings,
+    *,
+    corpus_dir: Path,
+    output_dir: Path,
+    transcriber: Transcriber,
+    executor: ActionExecutor,
+    synthesize: Synthesize | None = None,
+) -> list[UtteranceTiming]:
+    # Prompts and the post-prompt delay only exist for a live user; the replay
+    # measures the command path.
+    settings = replace(
+        settings,
+        wake_hello_prompt="",
+        listen_start_prompt="",
+        wakeword_start_delay=0.0,
+    )
+    stop_event = threading.Event()
+    cursor = ReplayCursor(clips, corpus_dir)
+    context = RuntimeContext(
+        settings=settings,
+        stop_event=stop_event,
+        wakeword=FileWakewordDetector(cursor, stop_event),
+        listener=FileListener(
+            cursor,
+            sample_rate=settings.command_sample_rate,
+            endpointer=_endpointer_config(settings) if settings.stt_trim_silence else None,
+            speech_pad_ms=settings.stt_speech_pad_ms if settings.stt_trim_silence else None,
+        ),
+        transcriber=transcriber,
+        executor=executor,
+        speaker=FileSpeaker(cursor, output_dir, synthesize),
+    )
+    registry = PluginRegistry()
+    clock = StageClock(cursor, settings.command_sample_rate)
+    registry.register_event_handler(clock)
+    if isinstance(transcriber, CascadedWhisperTranscriber):
+        transcriber.on_tier = lambda tier, reason: registry.emit(
+            TranscriptTier(tier=tier, escalation_reason=reason), context
+        )
+    PipelineOrchestrator(context, registry).run_forever()
+    return clock.timings
+
+
+def _replay_shard(
+    clips: Sequence[Path],
+    corpus_dir: Path,
+    settings: Settings,
+    output_dir: Path,
+    use_gateway: bool,
+    stub_latency_seconds: float,
+    tts: bool,
+) -> ShardResult:
+    from openclaw_assistant.adapters.stt.faster_whisper import FasterWhisperTranscriber
+
+    started = time.perf_counter()
+    transcriber: Transcriber
+    if settings.whisper_fast_model:
+        transcriber = CascadedWhisperTranscriber.from_settings(settings)
+    else:
+        transcriber = FasterWhisperTranscriber(settings)
+    executor: ActionExecutor
+    if use_gateway:
+        from openclaw_assistant.adapters.gateway.openclaw_http import OpenClawHttpExecutor
+
+        executor = OpenClawHttpExecutor(settings)
+    else:
+        executor = StubActionExecutor(latency_seconds=stub_latency_seconds)
+    synthesize: Synthesize | None = None
+    if tts:
+        from openclaw_assistant.adapters.tts.kokoro import KokoroSpeaker
+
+        synthesize = KokoroSpeaker(settings, reuse_output_stream=False).render
+    setup_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    utterances = replay_clips(
+        clips,
+        settings,
+        corpus_dir=corpus_dir,
+        output_dir=output_dir,
+        transcriber=transcriber,
+        executor=executor,
+        synthesize=synthesize,
+    )
+    return ShardResult(utterances, setup_seconds, time.perf_counter() - started)
+
+
+def run_replay(
+    corpus_dir: Path,
+    settings: Settings,
+    *,
+    output_dir: Path,
+    workers: int = 1,
+    use_gateway: bool = False,
+    stub_latency_seconds: float = 0.0,
+    tts: bool = True,
+) -> ReplayReport:
+    clips = load_clips(corpus_dir)
+    workers = max(1, min(workers, len(clips)))
+    shards = [clips[index::workers] for index in range(workers)]
+    started = time.perf_counter()
+    args = (corpus_dir, settings, output_dir, use_gateway, stub_latency_seconds, tts)
+    if workers == 1:
+        results = [_replay_shard(shards[0], *args)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_replay_shard, shard, *args) for shard in shards]
+            results = [future.result() for future in futures]
+    wall_seconds = time.perf_counter() - started
+
+    utterances = [utterance for result in results for utterance in result.utterances]
+    report = ReplayReport(
+        utterances=sorted(utterances, key=lambda utterance: utterance.clip),
+        workers=workers,
+        wall_seconds=wall_seconds,
+        # Shards run concurrently, so the slowest one bounds steady-state throughput.
+        replay_seconds=max((result.replay_seconds for result in results), default=0.0),
+    )
+    write_timings(output_dir / TIMINGS_FILE, report.utterances)
+    return report
+
+
+def write_timings(path: Path, utterances: Sequence[UtteranceTiming]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as handle:
+        for utterance in utterances:
+            handle.write(json.dumps(utterance.summary()) + "\n")
+
+
+def format_report(report: ReplayReport) -> str:
+    header = f"{'clip':<32} {'audio_s':>7} " + " ".join(f"{stage:>10}" for stage in STAGES)
+    lines = [header + f" {'total':>9}"]
+    for utterance in report.utterances:
+        stages = " ".join(f"{utterance.stages_ms.get(stage, 0.0):>10.1f}" for stage in STAGES)
+        suffix = f"  ERROR: {utterance.error}" if utterance.error else ""
+        lines.append(
+            f"{utterance.clip[:32]:<32} {utterance.audio_seconds:>7.2f} {stages} "
+            f"{utterance.total_ms:>9.1f}{suffix}"
+        )
+    summary = report.summary()
+    lines.append("")
+    lines.append(
+        f"{summary['utterances']} utterances, {summary['audio_seconds']} s audio, "
+        f"{summary['workers']} worker(s): replay {summary['replay_seconds']} s "
+        f"({summary['realtime_factor']}x real time), wall {summary['wall_seconds']} s"
+    )
+    for stage in [*STAGES, "total"]:
+        lines.append(
+            f"  {stage:<10} p50 {summary[f'{stage}_ms_p50']:>9} ms  "
+            f"p95 {summary[f'{stage}_ms_p95']:>9} ms"
+        )
+    return "\n".join(lines)
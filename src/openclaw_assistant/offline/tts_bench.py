@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import dataclasses
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from openclaw_assistant.config.settings import Settings
+
+Synthesize = Callable[[str], tuple[np.ndarray, int]]
+Loader = Callable[[Settings], Synthesize]
+
+BENCH_TEXTS = (
+    "Ready.",
+    "It is sunny today, with a high of twenty two degrees.",
+    "I set a timer for ten minutes. I will let you know when it goes off, "
+    "and you can ask me to cancel it at any time.",
+)
+
+
+@dataclass
+class TtsBenchResult:
+    name: str
+    load_seconds: float = 0.0
+    first_synth_seconds: float = 0.0
+    synth_seconds: float = 0.0
+    audio_seconds: float = 0.0
+    peak_rss_bytes: int = 0
+    unit_rtf: list[float] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def realtime_factor(self) -> float:
+        # Synthesis seconds per audio second, as tts.unit_rtf reports it.
+        return self.synth_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+    def summary(self) -> dict[str, object]:
+        summary: dict[str, object] = {
+            "config": self.name,
+            "load_s": round(self.load_seconds, 3),
+            "first_synth_s": round(self.first_synth_seconds, 3),
+            "rtf": round(self.realtime_factor, 3),
+            "rtf_p95": round(float(np.percentile(self.unit_rtf, 95)), 3) if self.unit_rtf else 0.0,
+            "audio_s": round(self.audio_seconds, 2),
+            "peak_rss_mib": round(self.peak_rss_bytes / (1024 * 1024), 1),
+        }
+        if self.error is not None:
+            summary["error"] = self.error
+        return summary
+
+
+def config_name(settings: Settings) -> str:
+    session = settings.kokoro_session
+    threads = session.intra_op_threads or "auto"
+    return (
+        f"{settings.kokoro_model_variant or 'fp32'}/t{threads}/{session.graph_optimization}"
+        f"{'' if session.cpu_mem_arena else '/no-arena'}"
+    )
+
+
+def bench_configs(
+    settings: Settings,
+    *,
+    variants: Sequence[str] = (),
+    intra_op_threads: Sequence[int] = (),
+) -> list[Settings]:
+    # One configuration per variant and thread count; anything not swept
+    # keeps its configured value.
+    return [
+        dataclasses.replace(settings, kokoro_model_variant=variant, kokoro_intra_op_threads=threads)
+        for variant in (variants or [settings.kokoro_model_variant])
+        for threads in (intra_op_threads or [settings.kokoro_intra_op_threads])
+    ]
+
+
+def peak_rss_bytes() -> int:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB on Linux.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def measure(
+    settings: Settings,
+    load: Loader,
+    *,
+    texts: Sequence[str] = BENCH_TEXTS,
+    repeats: int = 3,
+) -> TtsBenchResult:
+    result = TtsBenchResult(name=config_name(settings))
+    try:
+        started = time.perf_counter()
+        synthesize = load(settings)
+        result.load_seconds = time.perf_counter() - started
+        # The first call pays for kernel selection and arena growth; it is
+        # reported on its own and kept out of the RTF.
+        started = time.perf_counter()
+        synthesize(texts[0])
+        result.first_synth_seconds = time.perf_counter() - started
+        for _ in range(max(1, repeats)):
+            for text in texts:
+                started = time.perf_counter()
+                samples, sample_rate = synthesize(text)
+                elapsed = time.perf_counter() - started
+                audio_seconds = len(samples) / sample_rate if sample_rate else 0.0
+                result.synth_seconds += elapsed
+                result.audio_seconds += audio_seconds
+                if audio_seconds:
+                    result.unit_rtf.append(elapsed / audio_seconds)
+    except Exception as error:
+        result.error = str(error)
+    result.peak_rss_bytes = peak_rss_bytes()
+    return result
+
+
+def _load_kokoro(settings: Settings) -> Synthesize:
+    from openclaw_assistant.adapters.tts.kokoro import load_kokoro
+
+    voice = settings.kokoro
+    kokoro = load_kokoro(str(voice.model_path), str(voice.voices_path), settings.kokoro_session)
+
+    def _synthesize(text: str) -> tuple[np.ndarray, int]:
+        samples, sample_rate = kokoro.create(
+            text, voice=voice.voice, speed=voice.speed, lang=voice.language
+        )
+        return samples, sample_rate
+
+    return _synthesize
+
+
+def _measure_kokoro(settings: Settings, texts: Sequence[str], repeats: int) -> TtsBenchResult:
+    return measure(settings, _load_kokoro, texts=texts, repeats=repeats)
+
+
+def run_tts_bench(
+    configs: Sequence[Settings],
+    *,
+    texts: Sequence[str] = BENCH_TEXTS,
+    repeats: int = 3,
+) -> list[TtsBenchResult]:
+    # Each configuration runs in a fresh process so its peak RSS is its own
+    # and no session or arena carries over to the next one.
+    results = []
+    for settings in configs:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results.append(pool.submit(_measure_kokoro, settings, texts, repeats).result())
+    return results
+
+
+def format_report(results: Sequence[TtsBenchResult]) -> str:
+    lines = [f"{'config':<28} {'load_s':>7} {'first_s':>7} {'rtf':>6} {'rtf95':>6} {'rss_mib':>8}"]
+    for result in results:
+        if result.error is not None:
+            lines.append(f"{result.name:<28} error: {result.error}")
+            continue
+        row = result.summary()
+        lines.append(
+            f"{result.name:<28} {row['load_s']:>7} {row['first_synth_s']:>7} "
+            f"{row['rtf']:>6} {row['rtf_p95']:>6} {row['peak_rss_mib']:>8}"
+        )
+    return "\n".join(lines)
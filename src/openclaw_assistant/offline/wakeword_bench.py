@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import importlib
+import json
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.wav_io import read_wav, resample, to_int16
+from openclaw_assistant.adapters.wakeword.energy import EnergyWakewordDetector
+from openclaw_assistant.config.settings import Settings
+from openclaw_assistant.core.contracts import WakewordFrameDetector
+
+LABELS_FILE = "labels.json"
+DetectorFactory = Callable[[float, Settings | None], WakewordFrameDetector]
+
+
+@dataclass(frozen=True)
+class CorpusClip:
+    path: Path
+    keyword_end: float | None
+
+
+@dataclass
+class SweepResult:
+    sensitivity: float
+    detector: str
+    clips: int = 0
+    positives: int = 0
+    hits: int = 0
+    false_accepts: int = 0
+    audio_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list)
+    frame_cpu_us: list[float] = field(default_factory=list)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.positives if self.positives else 0.0
+
+    @property
+    def false_accepts_per_hour(self) -> float:
+        hours = self.audio_seconds / 3600.0
+        return self.false_accepts / hours if hours else 0.0
+
+    @property
+    def realtime_factor(self) -> float:
+        return self.audio_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "detector": self.detector,
+            "sensitivity": self.sensitivity,
+            "clips": self.clips,
+            "positives": self.positives,
+            "hits": self.hits,
+            "hit_rate": round(self.hit_rate, 4),
+            "false_accepts": self.false_accepts,
+            "false_accepts_per_hour": round(self.false_accepts_per_hour, 3),
+            "latency_ms_p50": _percentile(self.latencies_ms, 50),
+            "latency_ms_p95": _percentile(self.latencies_ms, 95),
+            "frame_cpu_us_mean": round(float(np.mean(self.frame_cpu_us)), 2)
+            if self.frame_cpu_us
+            else 0.0,
+            "frame_cpu_us_p95": _percentile(self.frame_cpu_us, 95),
+            "realtime_factor": round(self.realtime_factor, 1),
+        }
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    return round(float(np.percentile(values, q)), 2)
+
+
+def load_corpus(corpus_dir: Path) -> list[CorpusClip]:
+    labels_path = corpus_dir / LABELS_FILE
+    labels: dict[str, float | None] = {}
+    if labels_path.exists():
+        labels = json.loads(labels_path.read_text())
+    clips = []
+    for path in sorted(corpus_dir.rglob("*.wav")):
+        label = labels.get(path.relative_to(corpus_dir).as_posix())
+        clips.append(CorpusClip(path=path, keyword_end=None if label is None else float(label)))
+    return clips
+
+
+def detector_name(spec: str, settings: Settings | None) -> str:
+    if spec != "auto":
+        return spec
+    has_porcupine = (
+        settings is not None
+        and bool(settings.porcupine_access_key)
+        and settings.porcupine_keyword_path.exists()
+    )
+    return "porcupine" if has_porcupine else "energy"
+
+
+def resolve_detector(spec: str, settings: Settings | None) -> DetectorFactory:
+    spec = detector_name(spec, settings)
+    if spec == "energy":
+        return lambda sensitivity, _settings: EnergyWakewordDetector(sensitivity=sensitivity)
+    if spec == "porcupine":
+        from openclaw_assistant.adapters.wakeword.porcupine import PorcupineFrameDetector
+
+        def _porcupine(sensitivity: float, settings: Settings | None) -> WakewordFrameDetector:
+            if settings is None:
+                raise RuntimeError("Porcupine detector requires runtime settings.")
+            return PorcupineFrameDetector.create(settings, sensitivity)
+
+        return _porcupine
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(
+            f"Unknown detector '{spec}'. Use auto, energy, porcupine or module:factory."
+        )
+    factory: DetectorFactory = getattr(importlib.import_module(module_name), attr)
+    return factory
+
+
+def _load_pcm(path: Path, sample_rate: int) -> np.ndarray:
+    audio, source_rate = read_wav(path)
+    return to_int16(resample(audio, source_rate, sample_rate))
+
+
+def replay_clip(
+    detector: WakewordFrameDetector,
+    pcm: np.ndarray,
+    clip: CorpusClip,
+    result: SweepResult,
+    *,
+    early_tolerance_seconds: float = 0.5,
+    max_latency_seconds: float = 1.0,
+) -> None:
+    frame_length = detector.frame_length
+    sample_rate = detector.sample_rate
+    usable = pcm.size - (pcm.size % frame_length)
+    frames = pcm[:usable].reshape(-1, frame_length)
+    hit = False
+
+    started = time.perf_counter()
+    for index, frame in enumerate(frames):
+        cpu_started = time.thread_time_ns()
+        detected = detector.process(frame)
+        result.frame_cpu_us.append((time.thread_time_ns() - cpu_started) / 1000.0)
+        if not detected:
+            continue
+        detected_at = (index + 1) * frame_length / sample_rate
+        in_window = clip.keyword_end is not None and (
+            clip.keyword_end - early_tolerance_seconds
+            <= detected_at
+            <= clip.keyword_end + max_latency_seconds
+        )
+        if in_window and not hit and clip.keyword_end is not None:
+            hit = True
+            result.latencies_ms.append((detected_at - clip.keyword_end) * 1000.0)
+        else:
+            result.false_accepts += 1
+    result.wall_seconds += time.perf_counter() - started
+
+    result.clips += 1
+    result.audio_seconds += usable / sample_rate
+    if clip.keyword_end is not None:
+        result.positives += 1
+        result.hits += int(hit)
+
+
+def run_sensitivity(
+    corpus_dir: Path,
+    sensitivity: float,
+    detector_spec: str,
+    settings: Settings | None,
+) -> SweepResult:
+    factory = resolve_detector(detector_spec, settings)
+    result = SweepResult(sensitivity=sensitivity, detector=detector_name(detector_spec, settings))
+    for clip in load_corpus(corpus_dir):
+        detector = factory(sensitivity, settings)
+        try:
+            replay_clip(detector, _load_pcm(clip.path, detector.sample_rate), clip, result)
+        finally:
+            detector.close()
+    return result
+
+
+def run_sweep(
+    corpus_dir: Path,
+    sensitivities: Sequence[float],
+    *,
+    detector_spec: str = "auto",
+    settings: Settings | None = None,
+    workers: int = 1,
+) -> list[SweepResult]:
+    if workers <= 1 or len(sensitivities) <= 1:
+        return [
+            run_sensitivity(corpus_dir, value, detector_spec, settings) for value in sensitivities
+        ]
+    with ProcessPoolExecutor(max_workers=min(workers, len(sensitivities))) as pool:
+        futures = [
+            pool.submit(run_sensitivity, corpus_dir, value, detector_spec, settings)
+            for value in sensitivities
+        ]
+        return [future.result() for future in futures]
+
+
+def format_report(results: Sequence[SweepResult]) -> str:
+    header = (
+        f"{'sens':>5} {'hit%':>6} {'FA':>4} {'FA/h':>7} {'lat50':>7} {'lat95':>7} "
+        f"{'cpu_us':>7} {'cpu95':>7} {'xRT':>7}"
+    )
+    lines = [header]
+    for result in results:
+        row = result.summary()
+        lines.append(
+            f"{result.sensitivity:>5.2f} {result.hit_rate * 100:>6.1f} "
+            f"{result.false_accepts:>4d} {result.false_accepts_per_hour:>7.2f} "
+            f"{row['latency_ms_p50']:>7} {row['latency_ms_p95']:>7} "
+            f"{row['frame_cpu_us_mean']:>7} {row['frame_cpu_us_p95']:>7} "
+            f"{row['realtime_factor']:>7}"
+        )
+    return "\n".join(lines)
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.contracts import StreamingActionExecutor
 
 
 class ActionStagePlugin:
     def execute(self, prompt: str, context: RuntimeContext) -> str:
         return context.executor.execute(prompt)
+
+    def execute_stream(self, prompt: str, context: RuntimeContext) -> Iterator[str]:
+        if isinstance(context.executor, StreamingActionExecutor):
+            yield from context.executor.execute_stream(prompt)
+        else:
+            yield context.executor.execute(prompt)
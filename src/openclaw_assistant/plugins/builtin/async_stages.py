@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+import numpy as np
+
+from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.contracts import AsyncActionExecutor, RenderingSpeaker
+
+if TYPE_CHECKING:
+    from openclaw_assistant.plugins.registry import (
+        ActionStage,
+        IntentStage,
+        ListenStage,
+        SpeakStage,
+        TranscribeStage,
+        WakewordListenerStage,
+    )
+
+T = TypeVar("T")
+
+EXECUTOR_NAMES = ("audio", "stt", "gateway", "tts", "playback")
+_END = object()
+
+
+class StageExecutors:
+    # One single-thread pool per blocking resource: work on the same resource
+    # stays serialized, work on different resources can overlap.
+    def __init__(self, names: tuple[str, ...] = EXECUTOR_NAMES) -> None:
+        self._pools = {
+            name: ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"stage-{name}")
+            for name in names
+        }
+
+    async def run(self, name: str, function: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pools[name], functools.partial(function, *args))
+
+    def shutdown(self) -> None:
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ExecutorWakewordListener:
+    def __init__(self, stage: WakewordListenerStage, executors: StageExecutors) -> None:
+        self.stage = stage
+        self.executors = executors
+
+    async def wait_for_wakeword(
+        self,
+        context: RuntimeContext,
+        timeout_seconds: float | None = None,
+    ) -> bool:
+        return await self.executors.run(
+            "audio", self.stage.wait_for_wakeword, context, timeout_seconds
+        )
+
+
+class ExecutorListenStage:
+    def __init__(self, stage: ListenStage, executors: StageExecutors) -> None:
+        self.stage = stage
+        self.executors = executors
+
+    async def capture_audio(self, context: RuntimeContext) -> np.ndarray:
+        return await self.executors.run("audio", self.stage.capture_audio, context)
+
+
+class ExecutorTranscribeStage:
+    def __init__(self, stage: TranscribeStage, executors: StageExecutors) -> None:
+        self.stage = stage
+        self.executors = executors
+
+    async def transcribe(self, audio: np.ndarray, context: RuntimeContext) -> str:
+        return await self.executors.run("stt", self.stage.transcribe, audio, context)
+
+
+class ExecutorIntentStage:
+    # Matching is instant, but replaying the last response plays audio.
+    def __init__(self, stage: IntentStage, executors: StageExecutors) -> None:
+        self.stage = stage
+        self.executors = executors
+
+    async def handle(self, text: str, context: RuntimeContext) -> str | None:
+        return await self.executors.run("playback", self.stage.handle, text, context)
+
+
+class ExecutorActionStage:
+    def __init__(self, stage: ActionStage, executors: StageExecutors) -> None:
+        self.stage = stage
+        self.executors = executors
+
+    async def prepare(self, context: RuntimeContext) -> None:
+        return None
+
+    async def execute(self, prompt: str, context: RuntimeContext) -> str:
+        return await self.executors.run("gateway", self.stage.execute, prompt, context)
+
+    async def execute_stream(self, prompt: str, context: RuntimeContext) -> AsyncIterator[str]:
+        execute_stream = getattr(self.stage, "execute_stream", None)
+        if execute_stream is None:
+            yield await self.execute(prompt, context)
+            return
+        deltas: Iterator[str] = execute_stream(prompt, context)
+        while (delta := await self.executors.run("gateway", next, deltas, _END)) is not _END:
+            yield str(delta)
+
+
+class GatewayActionStage:
+    # Async action stage over an async executor; `prepare` pre-connects while
+    # the command is still being recorded.
+    def __init__(self, executor: AsyncActionExecutor) -> None:
+        self.executor = executor
+
+    async def prepare(self, context: RuntimeContext) -> None:
+        if context.settings.openclaw_preconnect:
+            await self.executor.preconnect()
+
+    async def execute(self, prompt: str, context: RuntimeContext) -> str:
+        return await self.executor.execute(prompt)
+
+    async def execute_stream(self, prompt: str, context: RuntimeContext) -> AsyncIterator[str]:
+        async for delta in self.executor.execute_stream(prompt):
+            yield delta
+
+
+class ExecutorSpeakStage:
+    # Speakers that can render and play separately synthesize on the "tts"
+    # pool and play on the "playback" pool; others speak whole on playback.
+    def __init__(self, stage: SpeakStage, executors: StageExecutors) -> None:
+        self.stage = stage
+        self.executors = executors
+
+    async def speak(self, response: str, context: RuntimeContext) -> None:
+        await self.executors.run("playback", self.stage.speak, response, context)
+
+    async def render(self, text: str, context: RuntimeContext) -> object:
+        if isinstance(context.speaker, RenderingSpeaker):
+            return await self.executors.run("tts", context.speaker.render, text)
+        return text
+
+    async def play(self, rendered: object, context: RuntimeContext) -> None:
+        if isinstance(rendered, str):
+            await self.speak(rendered, context)
+            return
+        assert isinstance(context.speaker, RenderingSpeaker)
+        audio, sample_rate = cast(tuple[np.ndarray, int], rendered)
+        await self.executors.run("playback", context.speaker.play, audio, sample_rate)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import logging
+
+from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.contracts import ReplayingSpeaker, VolumeSpeaker
+from openclaw_assistant.core.intents import IntentMatcher, parse_local_commands
+
+# Playback gain factor per "louder"/"quieter" (about 2 dB).
+VOLUME_STEP = 1.25
+
+
+class LocalIntentStagePlugin:
+    # Control commands are answered on the device: no gateway request and no
+    # new synthesis. Returns the handled intent, or None to go to the gateway.
+    def __init__(self) -> None:
+        self._spec: str | None = None
+        self._matcher = IntentMatcher(())
+
+    def _matcher_for(self, spec: str) -> IntentMatcher:
+        if spec != self._spec:
+            self._matcher = IntentMatcher(parse_local_commands(spec))
+            self._spec = spec
+        return self._matcher
+
+    def match(self, text: str, context: RuntimeContext) -> str | None:
+        settings = context.settings
+        if not settings.local_intents:
+            return None
+        return self._matcher_for(settings.local_intent_phrases).match(text)
+
+    def handle(self, text: str, context: RuntimeContext) -> str | None:
+        intent = self.match(text, context)
+        if intent is None:
+            return None
+        speaker = context.speaker
+        if intent == "repeat":
+            if not isinstance(speaker, ReplayingSpeaker) or not speaker.replay_last():
+                logging.info("Nothing to repeat.")
+        elif intent in ("louder", "quieter"):
+            if isinstance(speaker, VolumeSpeaker):
+                factor = VOLUME_STEP if intent == "louder" else 1.0 / VOLUME_STEP
+                logging.info("Playback gain set to %.2f.", speaker.adjust_volume(factor))
+        # "stop"/"cancel" and unknown table entries only suppress the request.
+        return intent
@@ -7,10 +7,13 @@ from openclaw_assistant.core.context import RuntimeContext
 
 class ListenStagePlugin:
     def capture_audio(self, context: RuntimeContext) -> np.ndarray:
-        if context.settings.wake_hello_prompt:
-            context.speaker.speak(context.settings.wake_hello_prompt)
-        if context.settings.listen_start_prompt:
-            context.speaker.speak(context.settings.listen_start_prompt)
+        # Capture from the wake instant already covers the time the prompts
+        # would play, so they are skipped rather than recorded into the command.
+        if not context.settings.capture_from_wake:
+            if context.settings.wake_hello_prompt:
+                context.speaker.speak(context.settings.wake_hello_prompt)
+            if context.settings.listen_start_prompt:
+                context.speaker.speak(context.settings.listen_start_prompt)
         if context.settings.wakeword_start_delay > 0:
             context.stop_event.wait(context.settings.wakeword_start_delay)
         return context.listener.record_command_audio()
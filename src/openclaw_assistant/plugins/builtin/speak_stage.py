@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.contracts import PendingPlayback, QueueingSpeaker
 
 
 class SpeakStagePlugin:
     def speak(self, response: str, context: RuntimeContext) -> None:
         context.speaker.speak(response)
+
+    def enqueue(self, response: str, context: RuntimeContext) -> PendingPlayback | None:
+        speaker = context.speaker
+        if isinstance(speaker, QueueingSpeaker):
+            return speaker.speak_async(response)
+        speaker.speak(response)
+        return None
@@ -3,8 +3,18 @@ from __future__ import annotations
 import numpy as np
 
 from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.contracts import SpeechMapProvider, SpeechTranscriber
 
 
 class TranscribeStagePlugin:
     def transcribe(self, audio: np.ndarray, context: RuntimeContext) -> str:
-        return context.transcriber.transcribe(audio)
+        # With the listener's speech map, only the speech regions reach the
+        # model and its own VAD pass is skipped. Without one (or when the
+        # endpointer heard nothing) the whole capture goes through as before.
+        transcriber = context.transcriber
+        listener = context.listener
+        if isinstance(transcriber, SpeechTranscriber) and isinstance(listener, SpeechMapProvider):
+            speech = listener.last_speech_map()
+            if speech is not None and speech.regions and speech.length == audio.size:
+                return transcriber.transcribe_speech(speech.extract(audio))
+        return transcriber.transcribe(audio)
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterator
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 import numpy as np
 
 from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.contracts import PendingPlayback
 from openclaw_assistant.plugins.builtin.action_stage import ActionStagePlugin
+from openclaw_assistant.plugins.builtin.async_stages import (
+    ExecutorActionStage,
+    ExecutorIntentStage,
+    ExecutorListenStage,
+    ExecutorSpeakStage,
+    ExecutorTranscribeStage,
+    ExecutorWakewordListener,
+    StageExecutors,
+)
+from openclaw_assistant.plugins.builtin.intent_stage import LocalIntentStagePlugin
 from openclaw_assistant.plugins.builtin.listen_stage import ListenStagePlugin
 from openclaw_assistant.plugins.builtin.speak_stage import SpeakStagePlugin
 from openclaw_assistant.plugins.builtin.transcribe_stage import TranscribeStagePlugin
@@ -32,19 +43,36 @@ class TranscribeStage(Protocol):
     def transcribe(self, audio: np.ndarray, context: RuntimeContext) -> str: ...
 
 
+class IntentStage(Protocol):
+    def handle(self, text: str, context: RuntimeContext) -> str | None: ...
+
+
 class ActionStage(Protocol):
     def execute(self, prompt: str, context: RuntimeContext) -> str: ...
 
 
+@runtime_checkable
+class StreamingActionStage(Protocol):
+    def execute_stream(self, prompt: str, context: RuntimeContext) -> Iterator[str]: ...
+
+
 class SpeakStage(Protocol):
     def speak(self, response: str, context: RuntimeContext) -> None: ...
 
 
+@runtime_checkable
+class QueueingSpeakStage(Protocol):
+    # Queues the response and returns its pending playback, or None once it
+    # has been spoken in full.
+    def enqueue(self, response: str, context: RuntimeContext) -> PendingPlayback | None: ...
+
+
 @dataclass
 class PluginRegistry:
     wakeword_listener: WakewordListenerStage = field(default_factory=WakewordListenerPlugin)
     listen_stage: ListenStage = field(default_factory=ListenStagePlugin)
     transcribe_stage: TranscribeStage = field(default_factory=TranscribeStagePlugin)
+    intent_stage: IntentStage = field(default_factory=LocalIntentStagePlugin)
     action_stage: ActionStage = field(default_factory=ActionStagePlugin)
     speak_stage: SpeakStage = field(default_factory=SpeakStagePlugin)
     _handlers: list[EventHandler] = field(default_factory=list)
@@ -61,6 +89,7 @@ class PluginRegistry:
             "wakeword_listener": ("wait_for_wakeword",),
             "listen_stage": ("capture_audio",),
             "transcribe_stage": ("transcribe",),
+            "intent_stage": ("handle",),
             "action_stage": ("execute",),
             "speak_stage": ("speak",),
         }
@@ -69,3 +98,78 @@ class PluginRegistry:
             for method in methods:
                 if not hasattr(plugin, method):
                     raise TypeError(f"Plugin '{attr}' is missing method '{method}'")
+
+
+class AsyncWakewordListenerStage(Protocol):
+    async def wait_for_wakeword(
+        self,
+        context: RuntimeContext,
+        timeout_seconds: float | None = None,
+    ) -> bool: ...
+
+
+class AsyncListenStage(Protocol):
+    async def capture_audio(self, context: RuntimeContext) -> np.ndarray: ...
+
+
+class AsyncTranscribeStage(Protocol):
+    async def transcribe(self, audio: np.ndarray, context: RuntimeContext) -> str: ...
+
+
+class AsyncIntentStage(Protocol):
+    async def handle(self, text: str, context: RuntimeContext) -> str | None: ...
+
+
+class AsyncActionStage(Protocol):
+    async def prepare(self, context: RuntimeContext) -> None: ...
+
+    async def execute(self, prompt: str, context: RuntimeContext) -> str: ...
+
+    def execute_stream(self, prompt: str, context: RuntimeContext) -> AsyncIterator[str]: ...
+
+
+class AsyncSpeakStage(Protocol):
+    async def speak(self, response: str, context: RuntimeContext) -> None: ...
+
+    async def render(self, text: str, context: RuntimeContext) -> object: ...
+
+    async def play(self, rendered: object, context: RuntimeContext) -> None: ...
+
+
+@dataclass
+class AsyncPluginRegistry:
+    wakeword_listener: AsyncWakewordListenerStage
+    listen_stage: AsyncListenStage
+    transcribe_stage: AsyncTranscribeStage
+    intent_stage: AsyncIntentStage
+    action_stage: AsyncActionStage
+    speak_stage: AsyncSpeakStage
+    _handlers: list[EventHandler] = field(default_factory=list)
+
+    @classmethod
+    def from_sync(
+        cls,
+        registry: PluginRegistry,
+        executors: StageExecutors,
+        *,
+        action_stage: AsyncActionStage | None = None,
+    ) -> AsyncPluginRegistry:
+        # Blocking stages run on the managed executors; event handlers are
+        # shared with the sync registry.
+        registry.validate()
+        return cls(
+            wakeword_listener=ExecutorWakewordListener(registry.wakeword_listener, executors),
+            listen_stage=ExecutorListenStage(registry.listen_stage, executors),
+            transcribe_stage=ExecutorTranscribeStage(registry.transcribe_stage, executors),
+            intent_stage=ExecutorIntentStage(registry.intent_stage, executors),
+            action_stage=action_stage or ExecutorActionStage(registry.action_stage, executors),
+            speak_stage=ExecutorSpeakStage(registry.speak_stage, executors),
+            _handlers=registry._handlers,
+        )
+
+    def register_event_handler(self, handler: EventHandler) -> None:
+        self._handlers.append(handler)
+
+    def emit(self, event: object, context: RuntimeContext) -> None:
+        for handler in self._handlers:
+            handler(event, context)
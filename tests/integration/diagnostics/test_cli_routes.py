@@ -3,6 +3,12 @@ from __future__ import annotations
 from openclaw_assistant.commands import build_parser
 
 
+def test_run_async_flag_parses() -> None:
+    parser = build_parser()
+    assert parser.parse_args(["run"]).async_mode is False
+    assert parser.parse_args(["run", "--async"]).async_mode is True
+
+
 def test_diagnostics_pipeline_subcommand_parses() -> None:
     parser = build_parser()
     args = parser.parse_args(["diagnostics", "pipeline", "--timeout", "12", "--openclaw"])
@@ -10,3 +16,40 @@ def test_diagnostics_pipeline_subcommand_parses() -> None:
     assert args.diag_cmd == "pipeline"
     assert args.timeout == 12
     assert args.openclaw is True
+
+
+def test_bench_wakeword_subcommand_parses() -> None:
+    parser = build_parser()
+    args = parser.parse_args(
+        ["bench", "wakeword", "--corpus", "corpus", "--sensitivities", "0.4,0.6", "--workers", "2"]
+    )
+    assert args.command == "bench"
+    assert args.bench_cmd == "wakeword"
+    assert args.sensitivities == "0.4,0.6"
+    assert args.workers == 2
+
+
+def test_bench_capture_subcommand_parses() -> None:
+    parser = build_parser()
+    args = parser.parse_args(["bench", "capture", "--iterations", "10", "--json"])
+    assert args.bench_cmd == "capture"
+    assert args.iterations == 10
+    assert args.json is True
+
+
+def test_replay_subcommand_parses() -> None:
+    parser = build_parser()
+    args = parser.parse_args(["replay", "--corpus", "corpus", "--workers", "4", "--no-tts"])
+    assert args.command == "replay"
+    assert args.workers == 4
+    assert args.no_tts is True
+    assert args.openclaw is False
+
+
+def test_transcribe_batch_subcommand_parses() -> None:
+    parser = build_parser()
+    args = parser.parse_args(["transcribe-batch", "archive", "--batch-size", "16"])
+    assert args.command == "transcribe-batch"
+    assert str(args.directory) == "archive"
+    assert args.batch_size == 16
+    assert args.workers is None
@@ -16,6 +16,7 @@ class _S:
     listen_start_prompt: str = "Listening"
     wake_hello_prompt: str = "Hi"
     wakeword_start_delay: float = 0.0
+    capture_from_wake: bool = False
 
 
 class _Wake:
@@ -25,6 +26,15 @@ class _Wake:
     def wait_for_wakeword(self, timeout_seconds=None):
         return True
 
+    def pause(self):
+        return None
+
+    def resume(self):
+        return None
+
+    def close(self):
+        return None
+
 
 class _Listener:
     def record_command_audio(self):
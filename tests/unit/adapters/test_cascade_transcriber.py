@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from openclaw_assistant.adapters.stt.cascade import CascadedWhisperTranscriber, EscalationPolicy
+
+_RATE = 16000
+
+
+class _Model:
+    def __init__(self, text: str, avg_logprob: float = -0.2, no_speech_prob: float = 0.1) -> None:
+        self.segment = SimpleNamespace(
+            text=text, avg_logprob=avg_logprob, no_speech_prob=no_speech_prob
+        )
+        self.calls = 0
+
+    def transcribe(self, audio: np.ndarray, **_options: object):
+        self.calls += 1
+        return iter([self.segment]), None
+
+
+def _cascade(fast: _Model, full: _Model) -> CascadedWhisperTranscriber:
+    policy = EscalationPolicy(min_avg_logprob=-0.6, max_no_speech_prob=0.5, max_fast_seconds=3.0)
+    return CascadedWhisperTranscriber(fast, full, options={}, policy=policy, sample_rate=_RATE)
+
+
+def test_confident_short_command_stays_on_fast_tier() -> None:
+    fast, full = _Model(" stop"), _Model(" Stop.")
+    stt = _cascade(fast, full)
+    tiers: list[tuple[str, str]] = []
+    stt.on_tier = lambda tier, reason: tiers.append((tier, reason))
+
+    assert stt.transcribe(np.zeros(_RATE, dtype=np.float32)) == "stop"
+    assert (fast.calls, full.calls) == (1, 0)
+    assert tiers == [("fast", "")]
+    assert stt.escalation_rate == 0.0
+
+
+def test_low_confidence_and_long_audio_use_full_tier() -> None:
+    fast, full = _Model(" pores", avg_logprob=-1.1), _Model(" pause")
+    stt = _cascade(fast, full)
+    tiers: list[tuple[str, str]] = []
+    stt.on_tier = lambda tier, reason: tiers.append((tier, reason))
+
+    assert stt.transcribe(np.zeros(_RATE, dtype=np.float32)) == "pause"
+    assert stt.transcribe(np.zeros(4 * _RATE, dtype=np.float32)) == "pause"
+
+    assert (fast.calls, full.calls) == (1, 2)
+    assert tiers == [("full", "avg_logprob"), ("full", "long")]
+    assert stt.escalation_rate == 1.0
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.command_buffer import (
+    CommandCaptureBuffer,
+    capture_until_endpoint,
+)
+from openclaw_assistant.adapters.audio.endpointer import EndpointerConfig, StreamingEndpointer
+from openclaw_assistant.adapters.audio.ring_buffer import PcmRingBuffer, RingReader
+from openclaw_assistant.offline.capture_bench import synthetic_command
+
+_RATE = 16000
+
+
+def _endpointer() -> StreamingEndpointer:
+    return StreamingEndpointer(
+        EndpointerConfig(
+            sample_rate=_RATE,
+            min_seconds=0.5,
+            trailing_silence_seconds=0.3,
+            silence_threshold=180.0,
+        )
+    )
+
+
+def _reader(pcm: np.ndarray) -> RingReader:
+    ring = PcmRingBuffer(pcm.size)
+    ring.write(pcm)
+    return RingReader(ring, 0)
+
+
+def test_capture_reads_into_buffer_and_trims_to_endpoint() -> None:
+    pcm = synthetic_command(_RATE, 1.0, 2.0)
+    buffer = CommandCaptureBuffer(4 * _RATE)
+    reader = _reader(pcm)
+    endpointer = _endpointer()
+
+    audio = capture_until_endpoint(lambda out: reader.read_into(out, timeout=0), endpointer, buffer)
+
+    assert endpointer.endpoint_sample is not None
+    assert audio.size == endpointer.endpoint_sample
+    assert audio.dtype == np.float32
+    assert np.shares_memory(audio, buffer.audio())
+    np.testing.assert_allclose(audio, pcm[: audio.size] / 32768.0, rtol=1e-6)
+
+
+def test_capture_stops_at_buffer_capacity() -> None:
+    pcm = synthetic_command(_RATE, 3.0, 0.5)
+    buffer = CommandCaptureBuffer(_RATE)
+    reader = _reader(pcm)
+
+    audio = capture_until_endpoint(
+        lambda out: reader.read_into(out, timeout=0), _endpointer(), buffer
+    )
+
+    assert audio.size == _RATE
+
+
+def test_repeat_capture_reuses_buffers_without_growing() -> None:
+    pcm = synthetic_command(_RATE, 1.0, 2.0)
+    buffer = CommandCaptureBuffer(4 * _RATE)
+    warmup = _reader(pcm)
+    capture_until_endpoint(lambda out: warmup.read_into(out, timeout=0), _endpointer(), buffer)
+    reader = _reader(pcm)
+    endpointer = _endpointer()
+
+    tracemalloc.start()
+    try:
+        capture_until_endpoint(lambda out: reader.read_into(out, timeout=0), endpointer, buffer)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Only endpointer bookkeeping; a list-based capture of this clip peaks above 200 KiB.
+    assert peak < 64 * 1024
+
+
+class _Speculation:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int]] = []
+
+    def speech_paused(self, audio: np.ndarray) -> None:
+        self.calls.append(("paused", audio.size))
+
+    def speech_resumed(self) -> None:
+        self.calls.append(("resumed", 0))
+
+
+def test_capture_reports_pauses_and_resumed_speech() -> None:
+    # Speech, a 0.2 s gap (a pause, not an endpoint), speech, then silence.
+    pcm = np.concatenate([synthetic_command(_RATE, 0.6, 0.2), synthetic_command(_RATE, 0.6, 1.0)])
+    buffer = CommandCaptureBuffer(4 * _RATE)
+    reader = _reader(pcm)
+    endpointer = StreamingEndpointer(
+        EndpointerConfig(
+            sample_rate=_RATE,
+            min_seconds=0.5,
+            trailing_silence_seconds=0.3,
+            silence_threshold=180.0,
+            pause_seconds=0.1,
+        )
+    )
+    speculation = _Speculation()
+
+    audio = capture_until_endpoint(
+        lambda out: reader.read_into(out, timeout=0),
+        endpointer,
+        buffer,
+        speculation=speculation,
+    )
+
+    assert [call for call, _ in speculation.calls] == ["paused", "resumed", "paused"]
+    first_pause, last_pause = speculation.calls[0][1], speculation.calls[2][1]
+    assert 0.6 * _RATE < first_pause < 0.8 * _RATE
+    assert 1.4 * _RATE < last_pause < audio.size
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.endpointer import EndpointerConfig, StreamingEndpointer
+
+_RATE = 16000
+
+
+def _endpointer() -> StreamingEndpointer:
+    return StreamingEndpointer(
+        EndpointerConfig(
+            sample_rate=_RATE,
+            min_seconds=0.2,
+            trailing_silence_seconds=0.3,
+            silence_threshold=180.0,
+        )
+    )
+
+
+def _noise(seconds: float, level: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.normal(0.0, level, int(seconds * _RATE)).astype(np.int16)
+
+
+def _speech(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * _RATE)) / _RATE
+    return (4000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+
+
+def _feed(endpointer: StreamingEndpointer, audio: np.ndarray, block: int = 480) -> bool:
+    for start in range(0, audio.size, block):
+        if endpointer.process(audio[start : start + block]):
+            return True
+    return False
+
+
+def test_endpoint_fires_at_hop_resolution_after_trailing_silence() -> None:
+    endpointer = _endpointer()
+    audio = np.concatenate([_speech(0.5), _noise(1.0, 20.0)])
+
+    assert _feed(endpointer, audio)
+    assert endpointer.speech_seen
+    assert endpointer.endpoint_sample == int(0.8 * _RATE)
+
+
+def test_noise_floor_adapts_so_noisy_room_still_endpoints() -> None:
+    # The room is above the static threshold, so only the learned floor
+    # lets the trailing room noise count as silence.
+    endpointer = _endpointer()
+    room = 220.0
+    audio = np.concatenate([_noise(0.25, room), _speech(0.5), _noise(1.0, room, seed=1)])
+
+    assert _feed(endpointer, audio)
+    assert endpointer.noise_floor > 180.0
+    assert endpointer.endpoint_sample is not None
+    assert endpointer.endpoint_sample < int(1.2 * _RATE)
+
+
+def test_sustained_speech_does_not_raise_the_floor_or_endpoint() -> None:
+    endpointer = _endpointer()
+    floor = endpointer.noise_floor
+
+    assert not _feed(endpointer, _speech(4.0))
+    assert all(endpointer.activity)
+    assert endpointer.noise_floor == floor
+
+
+def test_hysteresis_keeps_speech_through_brief_dips() -> None:
+    endpointer = _endpointer()
+    dip = (_speech(0.1) // 2).astype(np.int16)
+    audio = np.concatenate([_speech(0.3), dip, _speech(0.3)])
+
+    assert not _feed(endpointer, audio)
+    assert all(endpointer.activity)
+
+
+def test_speech_map_pads_speech_runs_and_merges_short_gaps() -> None:
+    endpointer = _endpointer()
+    speech = [_speech(0.3), _noise(0.2, 20.0, seed=1), _speech(0.3)]
+    audio = np.concatenate([_noise(0.25, 20.0), *speech, _noise(1.0, 20.0, seed=2)])
+    assert _feed(endpointer, audio)
+    length = endpointer.endpoint_sample or 0
+
+    split = endpointer.speech_map(length, pad_ms=50.0)
+    merged = endpointer.speech_map(length, pad_ms=150.0)
+
+    assert split.regions == ((3200, 9600), (11200, 17600))
+    assert merged.regions == ((1600, 19200),)
+    assert split.extract(audio).size == split.speech_samples == int(0.8 * _RATE)
+
+
+def test_activity_grows_past_the_preallocated_capture() -> None:
+    endpointer = StreamingEndpointer(
+        EndpointerConfig(
+            sample_rate=_RATE,
+            min_seconds=0.2,
+            trailing_silence_seconds=0.3,
+            silence_threshold=180.0,
+            max_seconds=0.1,
+        )
+    )
+
+    assert not _feed(endpointer, _speech(1.0))
+    assert endpointer.activity.size == endpointer.hops == 100
+    assert endpointer.activity.all()
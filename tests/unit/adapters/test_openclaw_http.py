@@ -1,5 +1,13 @@
 from __future__ import annotations
 
+import json
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openclaw_assistant.adapters.gateway.health import OPEN, CircuitBreaker, LatencyTracker
 from openclaw_assistant.adapters.gateway.openclaw_http import OpenClawHttpExecutor
 
 
@@ -11,3 +19,192 @@ def test_extract_response_priority() -> None:
 def test_extract_response_fallback() -> None:
     payload = {"foo": "bar"}
     assert OpenClawHttpExecutor.extract_response(payload, fallback_text="x") == "x"
+
+
+class _Gateway(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[tuple[str, int]] = set()
+
+    def _reply(self, body: bytes) -> None:
+        _Gateway.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        self._reply(b"{}")
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if not body.get("stream"):
+            self._reply(json.dumps({"response": body["text"].upper()}).encode())
+            return
+        _Gateway.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        events = [{"delta": "Hé"}, {"delta": "llo. "}, {"choices": [{"delta": {"content": "Bye"}}]}]
+        for event in [*(f"data: {json.dumps(e)}\n\n" for e in events), "data: [DONE]\n\n"]:
+            chunk = event.encode()
+            self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *_args: object) -> None:
+        return None
+
+
+@dataclass(frozen=True)
+class _S:
+    openclaw_rest_url: str
+    openclaw_timeout_seconds: float = 2.0
+    openclaw_pool_size: int = 2
+    openclaw_retries: int = 1
+    openclaw_retry_backoff_seconds: float = 0.0
+    openclaw_preconnect: bool = True
+    openclaw_fallback_urls: tuple[str, ...] = ()
+    openclaw_hedge_percentile: float = 95.0
+    openclaw_hedge_delay_ms: float = 50.0
+    openclaw_breaker_failures: int = 1
+    openclaw_breaker_cooldown_seconds: float = 60.0
+
+
+def test_preconnected_session_reuses_one_keep_alive_connection_and_streams_sse() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Gateway)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _Gateway.connections.clear()
+    executor = OpenClawHttpExecutor(_S(f"http://127.0.0.1:{server.server_port}/v1"))  # type: ignore[arg-type]
+    try:
+        executor.preconnect()
+        replies = [executor.execute("stop"), executor.execute("pause")]
+        deltas = list(executor.execute_stream("hi"))
+    finally:
+        executor.close()
+        server.shutdown()
+        server.server_close()
+
+    assert replies == ["STOP", "PAUSE"]
+    assert deltas == ["Hé", "llo. ", "Bye"]
+    assert len(_Gateway.connections) == 1
+    assert executor.reuse_rate == 1.0
+
+
+class _SlowGateway(_Gateway):
+    delay_seconds = 0.0
+
+    def do_POST(self) -> None:
+        time.sleep(self.delay_seconds)
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply(json.dumps({"response": type(self).__name__}).encode())
+
+
+class _Slow(_SlowGateway):
+    delay_seconds = 1.0
+
+
+class _Fast(_SlowGateway):
+    pass
+
+
+def _serve(handler: type[BaseHTTPRequestHandler]) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _closed_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return int(probe.getsockname()[1])
+
+
+class _ListGateway(_Gateway):
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply(b'["Sure", "thing"]')
+
+
+def test_json_body_that_is_not_an_object_falls_back_to_raw_text() -> None:
+    server = _serve(_ListGateway)
+    executor = OpenClawHttpExecutor(_S(f"http://127.0.0.1:{server.server_port}/v1"))  # type: ignore[arg-type]
+    try:
+        reply = executor.execute("hi")
+        deltas = list(executor.execute_stream("hi"))
+    finally:
+        executor.close()
+        server.shutdown()
+        server.server_close()
+
+    assert reply == '["Sure", "thing"]'
+    assert deltas == [reply]
+
+
+def test_slow_primary_is_hedged_to_the_next_endpoint() -> None:
+    slow, fast = _serve(_Slow), _serve(_Fast)
+    executor = OpenClawHttpExecutor(
+        _S(  # type: ignore[arg-type]
+            f"http://127.0.0.1:{slow.server_port}/v1",
+            openclaw_fallback_urls=(f"http://127.0.0.1:{fast.server_port}/v1",),
+        )
+    )
+    try:
+        started = time.monotonic()
+        reply = executor.execute("hi")
+        elapsed = time.monotonic() - started
+    finally:
+        executor.close()
+        for server in (slow, fast):
+            server.shutdown()
+            server.server_close()
+
+    assert reply == "_Fast"
+    assert elapsed < 0.5
+
+
+def test_failed_endpoint_fails_over_and_its_breaker_opens() -> None:
+    fast = _serve(_Fast)
+    executor = OpenClawHttpExecutor(
+        _S(  # type: ignore[arg-type]
+            f"http://127.0.0.1:{_closed_port()}/v1",
+            openclaw_retries=0,
+            openclaw_hedge_percentile=0.0,
+            openclaw_fallback_urls=(f"http://127.0.0.1:{fast.server_port}/v1",),
+        )
+    )
+    try:
+        replies = [executor.execute("one"), executor.execute("two")]
+    finally:
+        executor.close()
+        fast.shutdown()
+        fast.server_close()
+
+    assert replies == ["_Fast", "_Fast"]
+    assert executor.endpoints[0].breaker.state == OPEN
+
+
+def test_latency_percentile_and_breaker_cooldown() -> None:
+    tracker = LatencyTracker(window=10, min_samples=3)
+    tracker.observe(10.0)
+    assert tracker.percentile(95) is None
+    for value in (20.0, 30.0, 40.0):
+        tracker.observe(value)
+    assert tracker.percentile(50) == 20.0
+    assert tracker.percentile(95) == 40.0
+
+    now = [0.0]
+    breaker = CircuitBreaker(2, 5.0, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.available
+    breaker.record_failure()
+    assert not breaker.available
+    now[0] = 6.0
+    assert breaker.available
+    breaker.record_failure()
+    assert not breaker.available
+    now[0] = 12.0
+    breaker.record_success()
+    assert breaker.state == "closed"
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from openclaw_assistant.adapters.tts.phoneme_cache import PhonemeCache
+
+
+class _Espeak:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, text: str) -> str:
+        self.calls.append(text)
+        return text.upper()
+
+
+def test_repeated_sentences_skip_the_phonemizer() -> None:
+    espeak = _Espeak()
+    cache = PhonemeCache(espeak, max_entries=8)
+
+    assert cache.phonemes("Sure. It is  sunny.") == "SURE. IT IS SUNNY."
+    assert cache.phonemes("It is sunny. Anything else?") == "IT IS SUNNY. ANYTHING ELSE?"
+
+    assert espeak.calls == ["Sure.", "It is sunny.", "Anything else?"]
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert cache.hit_rate == 0.25
+
+
+def test_word_level_builds_new_sentences_from_known_words() -> None:
+    espeak = _Espeak()
+    cache = PhonemeCache(espeak, max_entries=8, word_level=True)
+
+    assert cache.phonemes("Turn the light on.") == "TURN THE LIGHT ON."
+    assert cache.phonemes("Turn the light off, please!") == "TURN THE LIGHT OFF, PLEASE!"
+
+    assert espeak.calls == ["Turn", "the", "light", "on", "off", "please"]
+
+
+def test_entries_are_bounded_least_recently_used_first() -> None:
+    espeak = _Espeak()
+    cache = PhonemeCache(espeak, max_entries=2)
+    for text in ["One.", "Two.", "One.", "Three.", "One.", "Two."]:
+        cache.phonemes(text)
+
+    assert espeak.calls == ["One.", "Two.", "Three.", "Two."]
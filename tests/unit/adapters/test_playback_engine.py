@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.playback import PlaybackEngine, StreamCallback
+
+
+class _Stream:
+    def __init__(self, callback: StreamCallback) -> None:
+        self.callback = callback
+        self.closed = False
+
+    def pull(self, frames: int) -> np.ndarray:
+        outdata = np.full((frames, 1), np.nan, dtype=np.float32)
+        self.callback(outdata, frames, None, None)
+        return outdata[:, 0]
+
+    def stop(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _engine() -> tuple[PlaybackEngine, list[_Stream]]:
+    streams: list[_Stream] = []
+
+    def _open(callback: StreamCallback) -> _Stream:
+        streams.append(_Stream(callback))
+        return streams[-1]
+
+    return PlaybackEngine(100, _open), streams
+
+
+def test_handles_play_in_order_from_the_callback() -> None:
+    engine, streams = _engine()
+    progress: list[tuple[float, float]] = []
+    first = engine.submit(np.ones(6, dtype=np.float32), on_progress=lambda *p: progress.append(p))
+    second = engine.submit(np.full(3, 2.0, dtype=np.float32))
+
+    assert len(streams) == 1
+    assert not first.done()
+    assert streams[0].pull(4).tolist() == [1.0, 1.0, 1.0, 1.0]
+    assert streams[0].pull(8).tolist() == [1.0, 1.0, 2.0, 2.0, 2.0, 0.0, 0.0, 0.0]
+    assert first.wait(0) and second.wait(0)
+    assert engine.drain(0)
+    assert progress == [(0.04, 0.06), (0.06, 0.06)]
+    assert engine.underruns == 0
+
+
+def test_open_handle_counts_underruns_only_after_playback_starts() -> None:
+    engine, streams = _engine()
+    handle = engine.open()
+    engine.start()
+    streams[0].pull(4)
+    assert engine.underruns == 0
+
+    handle.append(np.ones(2, dtype=np.float32))
+    assert streams[0].pull(4).tolist() == [1.0, 1.0, 0.0, 0.0]
+    assert engine.underruns == 1
+    assert not engine.drain(0)
+
+    handle.append(np.ones(2, dtype=np.float32))
+    handle.close()
+    streams[0].pull(4)
+    assert handle.wait(0)
+    assert engine.underruns == 1
+
+
+def test_cancel_releases_waiters_and_silences_output() -> None:
+    engine, streams = _engine()
+    handle = engine.submit(np.ones(50, dtype=np.float32))
+    waiter = threading.Thread(target=handle.wait)
+    waiter.start()
+
+    engine.cancel()
+    waiter.join(timeout=1)
+
+    assert not waiter.is_alive()
+    assert handle.cancelled
+    assert streams[0].pull(4).tolist() == [0.0, 0.0, 0.0, 0.0]
+    engine.close()
+    assert streams[0].closed
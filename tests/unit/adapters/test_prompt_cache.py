@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.wav_io import write_wav
+from openclaw_assistant.adapters.tts.prompt_cache import PromptAudioCache
+
+
+def _shape(samples: np.ndarray, _sample_rate: int) -> np.ndarray:
+    return np.asarray(samples, dtype=np.float32) * 0.5
+
+
+def test_prompt_rendered_once_then_loaded_from_disk(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    def _render(text: str) -> tuple[np.ndarray, int]:
+        calls.append(text)
+        return np.ones(4, dtype=np.float32), 24000
+
+    key = {"voice": "af_heart", "speed": 1.0}
+    PromptAudioCache(tmp_path, settings_key=key).load_or_render("Hi", _render, _shape)
+    cache = PromptAudioCache(tmp_path, settings_key=key)
+    prompt = cache.load_or_render("Hi", _render, _shape)
+
+    assert calls == ["Hi"]
+    assert prompt.sample_rate == 24000
+    assert prompt.audio.dtype == np.float32
+    assert prompt.audio.tolist() == [0.5] * 4
+    assert cache.get("Hi") is prompt
+
+
+def test_settings_change_invalidates_cached_prompt(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    def _render(text: str) -> tuple[np.ndarray, int]:
+        calls.append(text)
+        return np.ones(4, dtype=np.float32), 24000
+
+    PromptAudioCache(tmp_path, settings_key={"speed": 1.0}).load_or_render("Hi", _render, _shape)
+    cache = PromptAudioCache(tmp_path, settings_key={"speed": 1.2})
+    cache.load_or_render("Hi", _render, _shape)
+    cache.prune()
+
+    assert calls == ["Hi", "Hi"]
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+
+def test_prune_keeps_files_the_cache_did_not_write(tmp_path: Path) -> None:
+    user_file = tmp_path / "weights.npz"
+    np.savez(user_file, data=np.zeros(2))
+    cache = PromptAudioCache(tmp_path, settings_key={})
+    cache.load_or_render("Hi", lambda _text: (np.ones(4, dtype=np.float32), 24000), _shape)
+
+    cache.prune()
+
+    assert user_file.exists()
+    assert len(list(tmp_path.glob("prompt-*.npz"))) == 1
+
+
+def test_earcon_is_resampled_to_playback_rate(tmp_path: Path) -> None:
+    earcon = tmp_path / "ding.wav"
+    write_wav(earcon, np.full(160, 0.25, dtype=np.float32), 16000)
+    cache = PromptAudioCache(tmp_path / "cache", settings_key={})
+
+    prompt = cache.add_earcon("Hi", earcon, 24000)
+
+    assert prompt.sample_rate == 24000
+    assert prompt.audio.size == 240
+    assert np.allclose(prompt.audio, 0.25, atol=1e-3)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.ring_buffer import PcmRingBuffer, RingReader
+
+
+def test_reader_sees_samples_written_after_its_start() -> None:
+    ring = PcmRingBuffer(8)
+    ring.write(np.arange(3, dtype=np.int16))
+    reader = RingReader(ring)
+    ring.write(np.arange(10, 14, dtype=np.int16))
+
+    assert reader.read(4, timeout=0).tolist() == [10, 11, 12, 13]
+    assert reader.read(1, timeout=0) is None
+
+
+def test_reader_can_start_from_preroll_position() -> None:
+    ring = PcmRingBuffer(8)
+    ring.write(np.arange(6, dtype=np.int16))
+    reader = RingReader(ring, start=ring.position - 2)
+
+    assert reader.read(2, timeout=0).tolist() == [4, 5]
+
+
+def test_lapped_reader_skips_to_oldest_retained_sample() -> None:
+    ring = PcmRingBuffer(4)
+    reader = RingReader(ring, start=0)
+    ring.write(np.arange(6, dtype=np.int16))
+
+    assert reader.read(2, timeout=0).tolist() == [2, 3]
+    assert reader.overruns == 1
+
+
+def test_oversized_write_keeps_newest_samples() -> None:
+    ring = PcmRingBuffer(4)
+    ring.write(np.arange(10, dtype=np.int16))
+    reader = RingReader(ring, start=0)
+
+    assert ring.position == 10
+    assert reader.read(4, timeout=0).tolist() == [6, 7, 8, 9]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import queue
+from types import SimpleNamespace
+
+import numpy as np
+
+from openclaw_assistant.adapters.stt.streaming import StreamingWhisperTranscriber
+
+_RATE = 16000
+_HALF = _RATE // 2
+
+
+class _Model:
+    # Every half second of audio is one word whose number is encoded in the
+    # sample value, so any window decodes to the words it fully contains.
+    def __init__(self) -> None:
+        self.sizes: list[int] = []
+        self.prompts: list[str | None] = []
+
+    def transcribe(self, audio: np.ndarray, initial_prompt: str | None = None, **_options: object):
+        self.sizes.append(audio.size)
+        self.prompts.append(initial_prompt)
+        words = [
+            SimpleNamespace(
+                word=f" w{round(float(audio[index * _HALF]) * 32768 / 1000)}",
+                start=index * 0.5,
+                end=(index + 1) * 0.5,
+            )
+            for index in range(audio.size // _HALF)
+        ]
+        return [SimpleNamespace(words=words)], None
+
+
+def _words(count: int) -> np.ndarray:
+    return np.repeat(np.arange(1, count + 1, dtype=np.int16) * 1000, _HALF)
+
+
+def _transcriber(model: _Model) -> StreamingWhisperTranscriber:
+    return StreamingWhisperTranscriber(model, options={}, step_seconds=1.0, sample_rate=_RATE)
+
+
+def test_partials_commit_agreed_prefix_and_final_decodes_only_tail() -> None:
+    model = _Model()
+    stt = _transcriber(model)
+    partials: queue.Queue[tuple[str, str]] = queue.Queue()
+    stt.on_partial = lambda committed, tentative: partials.put((committed, tentative))
+    pcm = _words(6)
+
+    try:
+        stt.capture_started(_RATE, 8 * _RATE)
+        seen = []
+        for second in range(3):
+            stt.capture_block(pcm[second * _RATE : (second + 1) * _RATE])
+            seen.append(partials.get(timeout=2.0))
+        text = stt.transcribe(pcm.astype(np.float32) / 32768.0)
+    finally:
+        stt.close()
+
+    assert seen == [("", "w1 w2"), ("w1 w2", "w3 w4"), ("w1 w2 w3 w4", "w5 w6")]
+    assert model.sizes == [_RATE, 2 * _RATE, 2 * _RATE, _RATE]
+    assert model.prompts[-1] == "w1 w2 w3 w4"
+    assert text == "w1 w2 w3 w4 w5 w6"
+
+
+def test_audio_not_seen_during_capture_is_decoded_whole() -> None:
+    model = _Model()
+    stt = _transcriber(model)
+
+    text = stt.transcribe(_words(3).astype(np.float32) / 32768.0)
+
+    assert text == "w1 w2 w3"
+    assert model.sizes == [3 * _HALF]
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from openclaw_assistant.adapters.stt.worker import ProcessTranscriber
+
+# Sample values that make the fake transcriber crash or stall.
+_CRASH = -1.0
+_STALL = -0.5
+
+
+@dataclass(frozen=True)
+class _S:
+    record_max_seconds: float = 0.5
+    command_sample_rate: int = 1000
+    stt_worker_timeout_seconds: float = 10.0
+
+
+class _Echo:
+    def __init__(self) -> None:
+        self.on_tier = None
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        if audio[0] == _CRASH:
+            os._exit(1)
+        if audio[0] == _STALL:
+            time.sleep(1.0)
+        if self.on_tier is not None:
+            self.on_tier("fast", "")
+        return f"{os.getpid()}:{audio.size}:{float(audio.sum()):g}"
+
+
+def _echo(_settings: object) -> _Echo:
+    return _Echo()
+
+
+@pytest.fixture
+def worker():
+    transcriber = ProcessTranscriber(_S(), factory=_echo)  # type: ignore[arg-type]
+    yield transcriber
+    transcriber.close()
+
+
+def test_audio_round_trips_through_shared_memory_and_grows_slots(worker) -> None:
+    tiers: list[tuple[str, str]] = []
+    worker.on_tier = lambda tier, reason: tiers.append((tier, reason))
+
+    first = worker.transcribe(np.full(400, 0.5, dtype=np.float32))
+    second = worker.transcribe(np.ones(900, dtype=np.float32))
+
+    assert first.split(":")[1:] == ["400", "200"]
+    assert second.split(":")[1:] == ["900", "900"]
+    assert first.split(":")[0] != str(os.getpid())
+    assert tiers == [("fast", ""), ("fast", "")]
+
+
+def test_dead_worker_is_restarted(worker) -> None:
+    pid = worker.transcribe(np.ones(10, dtype=np.float32)).split(":")[0]
+
+    with pytest.raises(RuntimeError, match="died twice"):
+        worker.transcribe(np.full(10, _CRASH, dtype=np.float32))
+    restarted = worker.transcribe(np.ones(10, dtype=np.float32)).split(":")[0]
+
+    assert restarted != pid
+
+
+def test_cancel_releases_a_pending_transcribe(worker) -> None:
+    worker.warm_up()
+    results: list[str] = []
+    thread = threading.Thread(
+        target=lambda: results.append(worker.transcribe(np.full(10, _STALL, dtype=np.float32)))
+    )
+    thread.start()
+    time.sleep(0.2)
+    worker.cancel()
+    thread.join(timeout=0.5)
+
+    assert results == [""]
+    assert worker.transcribe(np.ones(3, dtype=np.float32)).endswith(":3:3")
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import numpy as np
+
+from openclaw_assistant.adapters.tts.synthesis_cache import SynthesisCache
+
+_RATE = 24000
+_KEY = {"voice": "af_heart", "speed": 1.0, "model": "k.onnx:1:2"}
+
+
+def _cache(path: Path, *, memory: int = 1 << 20, disk: int = 1 << 20, key=_KEY) -> SynthesisCache:
+    return SynthesisCache(path, settings_key=key, max_memory_bytes=memory, max_disk_bytes=disk)
+
+
+def _speech(seconds: float = 1.0) -> np.ndarray:
+    return np.sin(np.linspace(0, 400, int(seconds * _RATE))).astype(np.float32) * 0.5
+
+
+def test_memory_then_disk_hits_with_normalized_text(tmp_path: Path) -> None:
+    audio = _speech()
+    cache = _cache(tmp_path)
+    assert cache.get("Done.") is None
+    cache.put("Done.", audio, _RATE)
+
+    assert cache.get("  Done. ") is not None
+    reopened = _cache(tmp_path)
+    started = time.perf_counter()
+    hit = reopened.get("Done.")
+    elapsed = time.perf_counter() - started
+
+    assert hit is not None and hit[1] == _RATE
+    np.testing.assert_allclose(hit[0], audio, atol=1.0 / 16384)
+    assert elapsed < 0.01
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert (reopened.hits, reopened.disk_hits) == (1, 1)
+    assert _cache(tmp_path, key={**_KEY, "speed": 1.2}).get("Done.") is None
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path: Path) -> None:
+    clip = _speech(0.1)
+    cache = _cache(tmp_path, memory=2 * clip.nbytes, disk=0)
+    cache.put("a", clip, _RATE)
+    cache.put("b", clip, _RATE)
+    cache.get("a")
+    cache.put("c", clip, _RATE)
+
+    assert cache.evictions == 1
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert not list(tmp_path.iterdir())
+
+
+def test_disk_tier_stays_within_its_byte_bound(tmp_path: Path) -> None:
+    clip = _speech(0.1)
+    cache = _cache(tmp_path, disk=int(2.5 * clip.size * 2))
+    for text in ("a", "b", "c"):
+        cache.put(text, clip, _RATE)
+
+    assert len(list(tmp_path.glob("*.i16"))) == 2
+    assert cache.stats()["disk_bytes"] <= 2.5 * clip.size * 2
+
+
+def test_disk_eviction_keeps_recently_read_entries(tmp_path: Path) -> None:
+    clip = _speech(0.1)
+    cache = _cache(tmp_path, memory=0, disk=int(2.5 * clip.size * 2))
+    cache.put("a", clip, _RATE)
+    cache.put("b", clip, _RATE)
+    mtimes = {path: path.stat().st_mtime_ns for path in tmp_path.glob("tts-*.i16")}
+    assert cache.get("a") is not None
+    # A hit only notes its recency in memory; the file is untouched until eviction.
+    assert {path: path.stat().st_mtime_ns for path in mtimes} == mtimes
+    cache.put("c", clip, _RATE)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_overwriting_an_entry_does_not_inflate_disk_bytes(tmp_path: Path) -> None:
+    clip = _speech(0.1)
+    user_file = tmp_path / "notes.i16"
+    user_file.write_bytes(b"\0" * 64)
+    cache = _cache(tmp_path)
+    cache.put("a", clip, _RATE)
+    cache.put("a", clip, _RATE)
+
+    [entry] = tmp_path.glob("tts-*.i16")
+    assert cache.stats()["disk_bytes"] == entry.stat().st_size
+    assert _cache(tmp_path).stats()["disk_bytes"] == entry.stat().st_size
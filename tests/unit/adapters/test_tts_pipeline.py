@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from openclaw_assistant.adapters.tts.pipelined import iter_synthesized
+
+_RATE = 24000
+
+
+class _Synth:
+    # 50 ms per unit for 0.5 s of audio, logging when each unit starts.
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.fail_on = fail_on
+        self.started: dict[str, float] = {}
+
+    def __call__(self, text: str) -> tuple[np.ndarray, int]:
+        self.started[text] = time.monotonic()
+        if text == self.fail_on:
+            raise RuntimeError("synthesis failed")
+        time.sleep(0.05)
+        return np.zeros(_RATE // 2, dtype=np.float32), _RATE
+
+
+def test_next_unit_is_synthesized_while_the_current_one_plays() -> None:
+    synth = _Synth()
+    played: list[tuple[str, float, float]] = []
+
+    for unit in iter_synthesized(["a", "b", "c"], synth):
+        started = time.monotonic()
+        time.sleep(0.1)
+        played.append((unit.text, started, time.monotonic()))
+        assert unit.realtime_factor == pytest.approx(0.1, abs=0.08)
+
+    assert [text for text, _, _ in played] == ["a", "b", "c"]
+    assert synth.started["b"] < played[0][2]
+    assert synth.started["c"] < played[1][2]
+
+
+def test_synthesis_errors_reach_the_consumer() -> None:
+    with pytest.raises(RuntimeError, match="synthesis failed"):
+        list(iter_synthesized(["a", "b"], _Synth(fail_on="b")))
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.frame_queue import BoundedFrameQueue
+from openclaw_assistant.adapters.wakeword.worker import WakewordDetectionWorker
+
+
+class _FireOnLoudFrame:
+    sample_rate = 16000
+    frame_length = 4
+
+    def __init__(self) -> None:
+        self.frames: list[list[int]] = []
+
+    def process(self, pcm: np.ndarray) -> bool:
+        self.frames.append(pcm.tolist())
+        return bool(pcm.max() > 100)
+
+    def close(self) -> None:
+        return None
+
+
+def test_full_queue_drops_oldest_block() -> None:
+    frames = BoundedFrameQueue(2)
+    for position in (1, 2, 3):
+        frames.put(position, np.zeros(1, dtype=np.int16))
+
+    assert frames.dropped == 1
+    assert frames.depth == 2
+    item = frames.get(timeout=0)
+    assert item is not None and item[0] == 2
+
+
+def test_worker_reframes_blocks_and_reports_detection_position() -> None:
+    detector = _FireOnLoudFrame()
+    worker = WakewordDetectionWorker(detector, queue_blocks=8)
+    worker.start()
+    try:
+        worker.on_audio(3, np.zeros(3, dtype=np.int16))
+        worker.arm()
+        worker.on_audio(9, np.zeros(6, dtype=np.int16))
+        worker.on_audio(15, np.array([0, 0, 500, 0, 0, 0], dtype=np.int16))
+
+        result = worker.next_result(timeout=1.0)
+    finally:
+        worker.stop()
+
+    assert detector.frames == [[0, 0, 0, 0], [0, 0, 0, 0], [500, 0, 0, 0]]
+    assert result == 15
+    assert not worker.armed
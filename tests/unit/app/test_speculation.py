@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from openclaw_assistant.app.speculation import (
+    SpeculativeActionStage,
+    SpeculativeDispatcher,
+    SpeculativeTranscribeStage,
+)
+from openclaw_assistant.observability.metrics import METRICS
+
+
+@dataclass
+class _Stage:
+    text: str = "final"
+    calls: int = 0
+
+    def transcribe(self, _audio: np.ndarray, _context: object) -> str:
+        self.calls += 1
+        return self.text
+
+    def execute(self, prompt: str, _context: object) -> str:
+        self.calls += 1
+        return f"final:{prompt}"
+
+
+def _dispatcher(sent: list[str], release: threading.Event | None = None):
+    def _execute(prompt: str) -> str:
+        sent.append(prompt)
+        if release is not None:
+            release.wait(2.0)
+        return f"early:{prompt}"
+
+    return SpeculativeDispatcher(lambda audio: f"spoken {audio.size}", _execute)
+
+
+def test_confirmed_endpoint_uses_speculative_transcript_and_reply() -> None:
+    sent: list[str] = []
+    dispatcher = _dispatcher(sent)
+    inner = _Stage()
+    transcribe = SpeculativeTranscribeStage(inner, dispatcher)
+    action = SpeculativeActionStage(inner, dispatcher)
+    before = METRICS.timing("speculation.saved_ms")
+
+    dispatcher.speech_paused(np.zeros(8, dtype=np.float32))
+    text = transcribe.transcribe(np.zeros(12, dtype=np.float32), None)
+    response = action.execute(text, None)
+
+    assert (text, response) == ("spoken 8", "early:spoken 8")
+    assert sent == ["spoken 8"] and inner.calls == 0
+    assert (dispatcher.hits, dispatcher.misses) == (1, 0)
+    saved = METRICS.timing("speculation.saved_ms")
+    assert saved is not None and saved.count == (before.count if before else 0) + 1
+
+
+def test_resumed_speech_discards_speculation() -> None:
+    sent: list[str] = []
+    release = threading.Event()
+    dispatcher = _dispatcher(sent, release)
+    inner = _Stage()
+    transcribe = SpeculativeTranscribeStage(inner, dispatcher)
+    action = SpeculativeActionStage(inner, dispatcher)
+
+    dispatcher.speech_paused(np.zeros(8, dtype=np.float32))
+    dispatcher.speech_resumed()
+    text = transcribe.transcribe(np.zeros(12, dtype=np.float32), None)
+    response = action.execute(text, None)
+    release.set()
+
+    assert (text, response) == ("final", "final:final")
+    assert inner.calls == 2
+    assert (dispatcher.hits, dispatcher.misses) == (0, 1)
+    assert dispatcher.hit_rate == 0.0
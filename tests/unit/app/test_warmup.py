@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from openclaw_assistant.app.warmup import run_warmup
+from openclaw_assistant.core.readiness import Readiness
+
+
+class _Component:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.calls = 0
+
+    def warm_up(self) -> None:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("model missing")
+
+
+def test_warmup_records_each_component_and_sets_ready_despite_failures() -> None:
+    stt, tts = _Component(), _Component(fail=True)
+    readiness = Readiness()
+
+    run_warmup({"stt": stt, "tts": tts}, readiness)
+
+    assert readiness.is_ready
+    assert (stt.calls, tts.calls) == (1, 1)
+    assert set(readiness.timings_ms) == {"stt", "tts"}
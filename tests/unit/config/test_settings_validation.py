@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from openclaw_assistant.config.loader import load_settings
 from openclaw_assistant.config.settings import Settings
 
 
@@ -13,6 +14,7 @@ def _settings(tmp_path: Path) -> Settings:
         porcupine_access_key="",
         porcupine_keyword_path=tmp_path / "missing.ppn",
         porcupine_sensitivity=0.5,
+        wakeword_queue_blocks=64,
         audio_input_device=None,
         audio_output_device=None,
         command_sample_rate=16000,
@@ -20,25 +22,73 @@ def _settings(tmp_path: Path) -> Settings:
         record_min_seconds=1.0,
         silence_seconds=0.9,
         silence_threshold=180.0,
+        endpoint_hop_ms=10.0,
+        endpoint_noise_ratio=2.0,
+        endpoint_hysteresis=1.5,
+        endpoint_noise_alpha=0.05,
+        capture_ring_seconds=12.0,
+        capture_preroll_seconds=0.0,
+        capture_from_wake=False,
         wakeword_start_delay=0.4,
         listen_start_prompt="Listening",
         wake_hello_prompt="Hi",
+        wake_earcon_path=None,
+        listen_earcon_path=None,
+        prompt_cache_dir=tmp_path / "prompts",
         whisper_model="small.en",
         whisper_device="cpu",
         whisper_compute_type="int8",
         whisper_language="en",
         whisper_download_root=tmp_path,
+        stt_streaming=False,
+        stt_stream_step_seconds=1.0,
+        stt_trim_silence=True,
+        stt_speech_pad_ms=200.0,
+        whisper_fast_model="",
+        stt_escalate_avg_logprob=-0.6,
+        stt_escalate_no_speech_prob=0.5,
+        stt_escalate_seconds=3.0,
+        stt_worker_process=False,
+        stt_worker_timeout_seconds=30.0,
         kokoro_model_path=tmp_path / "k.onnx",
         kokoro_voices_path=tmp_path / "v.bin",
         kokoro_voice="af_heart",
         kokoro_speed=1.0,
         kokoro_language="en-us",
+        kokoro_model_variant="",
+        kokoro_intra_op_threads=0,
+        kokoro_inter_op_threads=0,
+        kokoro_graph_optimization="all",
+        kokoro_execution_mode="sequential",
+        kokoro_cpu_mem_arena=True,
         openclaw_rest_url="http://127.0.0.1:3000/v1/assistant",
+        openclaw_fallback_urls=(),
+        openclaw_hedge_percentile=95.0,
+        openclaw_hedge_delay_ms=1500.0,
+        openclaw_breaker_failures=3,
+        openclaw_breaker_cooldown_seconds=30.0,
         openclaw_timeout_seconds=10.0,
+        openclaw_pool_size=4,
+        openclaw_retries=2,
+        openclaw_retry_backoff_seconds=0.1,
+        openclaw_preconnect=True,
+        stream_responses=False,
+        local_intents=True,
+        local_intent_phrases="stop=stop|cancel",
+        speculative_dispatch=False,
+        speculation_pause_ms=250.0,
         wakeword_label="OpenClaw",
         tts_fade_ms=20.0,
         tts_padding_ms=40.0,
         tts_prewarm_ms=50.0,
+        tts_pipelined=True,
+        tts_first_unit_chars=60,
+        tts_callback_playback=True,
+        tts_cache_dir=tmp_path / "cache" / "tts",
+        tts_cache_memory_mb=32.0,
+        tts_cache_disk_mb=256.0,
+        tts_phoneme_cache_entries=1024,
+        tts_phoneme_word_level=False,
     )
 
 
@@ -46,3 +96,11 @@ def test_missing_access_key_raises(tmp_path: Path) -> None:
     s = _settings(tmp_path)
     with pytest.raises(RuntimeError, match="PORCUPINE_ACCESS_KEY"):
         s.validate_runtime_assets()
+
+
+def test_invalid_local_intent_table_fails_at_load(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("OPENCLAW_LOCAL_INTENT_PHRASES", "stop=stop;two words=halt")
+    with pytest.raises(ValueError, match="OPENCLAW_LOCAL_INTENT_PHRASES"):
+        load_settings(tmp_path)
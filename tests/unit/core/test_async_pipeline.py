@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from openclaw_assistant.core.async_pipeline import AsyncPipelineOrchestrator
+from openclaw_assistant.core.context import RuntimeContext
+from openclaw_assistant.core.events import (
+    ActionCompleted,
+    AudioCaptured,
+    ListenStarted,
+    ResponseSentence,
+    ResponseSpoken,
+    RuntimeReady,
+    TextTranscribed,
+    WakeDetected,
+)
+from openclaw_assistant.core.readiness import Readiness
+from openclaw_assistant.plugins.builtin.async_stages import StageExecutors
+from openclaw_assistant.plugins.registry import AsyncPluginRegistry, PluginRegistry
+
+
+@dataclass
+class _S:
+    wakeword_label: str = "OpenClaw"
+    listen_start_prompt: str = ""
+    wake_hello_prompt: str = ""
+    wakeword_start_delay: float = 0.0
+    capture_from_wake: bool = False
+    stream_responses: bool = True
+    local_intents: bool = False
+    openclaw_preconnect: bool = False
+
+
+class _Wake:
+    def __init__(self, stop_event: threading.Event) -> None:
+        self.stop_event = stop_event
+        self.closed = False
+
+    def audio_params(self):
+        return (16000, 512)
+
+    def wait_for_wakeword(self, timeout_seconds=None):
+        self.stop_event.wait()
+        return False
+
+    def pause(self):
+        return None
+
+    def resume(self):
+        return None
+
+    def close(self):
+        self.closed = True
+
+
+class _Listener:
+    def record_command_audio(self):
+        return np.array([0.1, 0.2], dtype=np.float32)
+
+
+class _Transcriber:
+    def transcribe(self, _audio):
+        return "hello"
+
+
+class _Executor:
+    def execute(self, prompt: str):
+        return f"ok:{prompt}"
+
+    def execute_stream(self, prompt: str):
+        yield from ["One. Two.", " Three."]
+
+
+class _RenderingSpeaker:
+    # Render and play each take 50 ms and log when they start and finish.
+    def __init__(self) -> None:
+        self.log: list[tuple[str, str, float, float]] = []
+
+    def _timed(self, kind: str, text: str) -> None:
+        started = time.monotonic()
+        time.sleep(0.05)
+        self.log.append((kind, text, started, time.monotonic()))
+
+    def speak(self, text: str) -> None:
+        self._timed("speak", text)
+
+    def render(self, text: str):
+        self._timed("render", text)
+        return np.zeros(4, dtype=np.float32), 24000
+
+    def play(self, audio: np.ndarray, sample_rate: int) -> None:
+        self._timed("play", "")
+
+
+def _context(speaker: _RenderingSpeaker, readiness: Readiness | None = None) -> RuntimeContext:
+    stop_event = threading.Event()
+    return RuntimeContext(
+        settings=_S(),
+        stop_event=stop_event,
+        wakeword=_Wake(stop_event),
+        listener=_Listener(),
+        transcriber=_Transcriber(),
+        executor=_Executor(),
+        speaker=speaker,
+        readiness=readiness or Readiness(ready=True),
+    )
+
+
+def test_streamed_sentences_render_while_previous_plays() -> None:
+    speaker = _RenderingSpeaker()
+    context = _context(speaker)
+    executors = StageExecutors()
+    registry = AsyncPluginRegistry.from_sync(PluginRegistry(), executors)
+    events: list[object] = []
+    registry.register_event_handler(lambda event, _context: events.append(event))
+    try:
+        text = asyncio.run(AsyncPipelineOrchestrator(context, registry).run_once_after_wake())
+    finally:
+        executors.shutdown()
+
+    assert text == "hello"
+    assert [type(event) for event in events[:4]] == [
+        WakeDetected,
+        ListenStarted,
+        AudioCaptured,
+        TextTranscribed,
+    ]
+    # The stream outruns synthesis, so ActionCompleted may precede sentences.
+    assert [event.text for event in events if isinstance(event, ResponseSentence)] == [
+        "One.",
+        "Two.",
+        "Three.",
+    ]
+    assert ActionCompleted(prompt="hello", response="One. Two. Three.") in events
+    assert events[-1] == ResponseSpoken(response="One. Two. Three.")
+    renders = [entry for entry in speaker.log if entry[0] == "render"]
+    plays = [entry for entry in speaker.log if entry[0] == "play"]
+    assert [entry[1] for entry in renders] == ["One.", "Two.", "Three."]
+    assert len(plays) == 3
+    # "Two." is synthesized while "One." is still playing.
+    assert renders[1][2] < plays[0][3]
+
+
+def test_cancelling_run_forever_closes_wakeword() -> None:
+    readiness = Readiness()
+    context = _context(_RenderingSpeaker(), readiness)
+    executors = StageExecutors()
+    registry = AsyncPluginRegistry.from_sync(PluginRegistry(), executors)
+    events: list[object] = []
+    registry.register_event_handler(lambda event, _context: events.append(event))
+
+    async def _main() -> bool:
+        task = asyncio.create_task(AsyncPipelineOrchestrator(context, registry).run_forever())
+        await asyncio.sleep(0.2)
+        assert not events
+        readiness.set()
+        await asyncio.sleep(0.2)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    try:
+        cancelled = asyncio.run(_main())
+    finally:
+        # Releases the wake-word wait still blocking its executor thread.
+        context.stop_event.set()
+        executors.shutdown()
+
+    assert cancelled
+    assert context.wakeword.closed
+    assert events == [RuntimeReady(warmup_ms={})]
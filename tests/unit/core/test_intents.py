@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from openclaw_assistant.core.intents import IntentMatcher, parse_local_commands
+
+_SPEC = "stop=stop|cancel|never mind;repeat=repeat|repeat that;louder=louder|volume up"
+
+
+def test_matches_whole_utterances_with_filler() -> None:
+    matcher = IntentMatcher(parse_local_commands(_SPEC))
+
+    assert matcher.match("Stop.") == "stop"
+    assert matcher.match("Okay, never  mind please") == "stop"
+    assert matcher.match("Repeat that!") == "repeat"
+    assert matcher.match("volume up now") == "louder"
+    assert matcher.match("stop the timer") is None
+    assert matcher.match("what's the weather") is None
+
+
+def test_empty_table_matches_nothing() -> None:
+    assert IntentMatcher(parse_local_commands("")).match("stop") is None
+
+
+@pytest.mark.parametrize("spec", ["stop", "two words=stop", "stop=|"])
+def test_invalid_table_raises(spec: str) -> None:
+    with pytest.raises(ValueError):
+        parse_local_commands(spec)
+
+
+def test_repeated_name_merges_phrases() -> None:
+    commands = parse_local_commands("stop=stop;repeat=repeat;stop=halt|stop")
+    matcher = IntentMatcher(commands)
+
+    assert [command.name for command in commands] == ["stop", "repeat"]
+    assert matcher.match("halt") == "stop"
+    assert matcher.match("stop") == "stop"
@@ -4,17 +4,21 @@ import threading
 from dataclasses import dataclass
 
 import numpy as np
+import pytest
 
 from openclaw_assistant.core.context import RuntimeContext
 from openclaw_assistant.core.events import (
     ActionCompleted,
     AudioCaptured,
     ListenStarted,
+    LocalIntentHandled,
     ResponseSpoken,
+    RuntimeReady,
     TextTranscribed,
     WakeDetected,
 )
 from openclaw_assistant.core.pipeline import PipelineOrchestrator
+from openclaw_assistant.core.readiness import Readiness
 from openclaw_assistant.plugins.registry import PluginRegistry
 
 
@@ -24,6 +28,10 @@ class _S:
     listen_start_prompt: str = "Listening"
     wake_hello_prompt: str = "Hi"
     wakeword_start_delay: float = 0.0
+    capture_from_wake: bool = False
+    stream_responses: bool = False
+    local_intents: bool = False
+    local_intent_phrases: str = ""
 
 
 class _Wake:
@@ -33,6 +41,15 @@ class _Wake:
     def wait_for_wakeword(self, timeout_seconds=None):
         return True
 
+    def pause(self):
+        return None
+
+    def resume(self):
+        return None
+
+    def close(self):
+        return None
+
 
 class _Listener:
     def record_command_audio(self):
@@ -73,3 +90,236 @@ def test_pipeline_event_sequence() -> None:
     assert isinstance(events[3], TextTranscribed)
     assert isinstance(events[4], ActionCompleted)
     assert isinstance(events[5], ResponseSpoken)
+
+
+class _CountingWake(_Wake):
+    def __init__(self, stop_event: threading.Event) -> None:
+        self.stop_event = stop_event
+        self.calls: list[str] = []
+
+    def wait_for_wakeword(self, timeout_seconds=None):
+        self.calls.append("wait")
+        self.stop_event.set()
+        return True
+
+    def pause(self):
+        self.calls.append("pause")
+
+    def resume(self):
+        self.calls.append("resume")
+
+    def close(self):
+        self.calls.append("close")
+
+
+def test_run_forever_pauses_wakeword_around_cycle() -> None:
+    stop_event = threading.Event()
+    wake = _CountingWake(stop_event)
+    context = RuntimeContext(
+        settings=_S(),
+        stop_event=stop_event,
+        wakeword=wake,
+        listener=_Listener(),
+        transcriber=_Transcriber(),
+        executor=_Executor(),
+        speaker=_Speaker(),
+    )
+    PipelineOrchestrator(context, PluginRegistry()).run_forever()
+
+    assert wake.calls == ["wait", "pause", "resume", "close"]
+
+
+def test_run_forever_waits_for_readiness_before_listening() -> None:
+    stop_event = threading.Event()
+    wake = _CountingWake(stop_event)
+    readiness = Readiness()
+    context = RuntimeContext(
+        settings=_S(),
+        stop_event=stop_event,
+        wakeword=wake,
+        listener=_Listener(),
+        transcriber=_Transcriber(),
+        executor=_Executor(),
+        speaker=_Speaker(),
+        readiness=readiness,
+    )
+    registry = PluginRegistry()
+    events: list[object] = []
+    registry.register_event_handler(lambda event, _context: events.append(event))
+    loop = threading.Thread(target=PipelineOrchestrator(context, registry).run_forever)
+    loop.start()
+
+    loop.join(timeout=0.3)
+    assert loop.is_alive() and wake.calls == []
+
+    readiness.record("stt", 12.5)
+    readiness.set()
+    loop.join(timeout=2.0)
+
+    assert wake.calls == ["wait", "pause", "resume", "close"]
+    assert events[0] == RuntimeReady(warmup_ms={"stt": 12.5})
+
+
+class _StreamingExecutor(_Executor):
+    def execute_stream(self, prompt: str):
+        yield from ["Sure. It is", " sunny today! Enjoy", " it"]
+
+
+class _RecordingSpeaker:
+    def __init__(self, events: list[object]) -> None:
+        self.events = events
+
+    def speak(self, text: str) -> None:
+        self.events.append(f"spoken:{text}")
+
+
+def test_streamed_response_is_spoken_sentence_by_sentence() -> None:
+    events: list[object] = []
+    context = RuntimeContext(
+        settings=_S(wake_hello_prompt="", listen_start_prompt="", stream_responses=True),
+        stop_event=threading.Event(),
+        wakeword=_Wake(),
+        listener=_Listener(),
+        transcriber=_Transcriber(),
+        executor=_StreamingExecutor(),
+        speaker=_RecordingSpeaker(events),
+    )
+    registry = PluginRegistry()
+    registry.register_event_handler(lambda event, _context: events.append(event))
+    PipelineOrchestrator(context, registry).run_once_after_wake()
+
+    spoken_or_done = [
+        event for event in events if isinstance(event, (str, ActionCompleted, ResponseSpoken))
+    ]
+    assert spoken_or_done == [
+        "spoken:Sure.",
+        "spoken:It is sunny today!",
+        ActionCompleted(prompt="hello", response="Sure. It is sunny today! Enjoy it"),
+        "spoken:Enjoy it",
+        ResponseSpoken(response="Sure. It is sunny today! Enjoy it"),
+    ]
+
+
+class _Pending:
+    def __init__(self, events: list[object], text: str) -> None:
+        self.events = events
+        self.text = text
+
+    def done(self) -> bool:
+        return False
+
+    def wait(self, timeout=None) -> bool:
+        self.events.append(f"played:{self.text}")
+        return True
+
+    def cancel(self) -> None:
+        self.events.append(f"cancelled:{self.text}")
+
+
+class _QueueingSpeaker(_RecordingSpeaker):
+    def speak_async(self, text: str) -> _Pending:
+        self.events.append(f"queued:{text}")
+        return _Pending(self.events, text)
+
+    def drain(self, timeout=None) -> bool:
+        return True
+
+    def cancel(self) -> None:
+        return None
+
+
+def test_streamed_sentences_are_queued_and_awaited_before_response_spoken() -> None:
+    events: list[object] = []
+    context = RuntimeContext(
+        settings=_S(wake_hello_prompt="", listen_start_prompt="", stream_responses=True),
+        stop_event=threading.Event(),
+        wakeword=_Wake(),
+        listener=_Listener(),
+        transcriber=_Transcriber(),
+        executor=_StreamingExecutor(),
+        speaker=_QueueingSpeaker(events),
+    )
+    registry = PluginRegistry()
+    registry.register_event_handler(lambda event, _context: events.append(event))
+    PipelineOrchestrator(context, registry).run_once_after_wake()
+
+    spoken_or_done = [
+        event for event in events if isinstance(event, (str, ActionCompleted, ResponseSpoken))
+    ]
+    assert spoken_or_done == [
+        "queued:Sure.",
+        "queued:It is sunny today!",
+        ActionCompleted(prompt="hello", response="Sure. It is sunny today! Enjoy it"),
+        "queued:Enjoy it",
+        "played:Sure.",
+        "played:It is sunny today!",
+        "played:Enjoy it",
+        ResponseSpoken(response="Sure. It is sunny today! Enjoy it"),
+    ]
+
+
+class _FailingStreamExecutor(_Executor):
+    def execute_stream(self, prompt: str):
+        yield "Sure. It is"
+        raise ConnectionError("gateway dropped")
+
+
+def test_failed_stream_cancels_queued_sentences_without_waiting() -> None:
+    events: list[object] = []
+    context = RuntimeContext(
+        settings=_S(wake_hello_prompt="", listen_start_prompt="", stream_responses=True),
+        stop_event=threading.Event(),
+        wakeword=_Wake(),
+        listener=_Listener(),
+        transcriber=_Transcriber(),
+        executor=_FailingStreamExecutor(),
+        speaker=_QueueingSpeaker(events),
+    )
+
+    with pytest.raises(ConnectionError, match="gateway dropped"):
+        PipelineOrchestrator(context, PluginRegistry()).run_once_after_wake()
+
+    assert events == ["queued:Sure.", "cancelled:Sure."]
+
+
+class _ReplayingSpeaker(_RecordingSpeaker):
+    def replay_last(self) -> bool:
+        self.events.append("replayed")
+        return True
+
+
+class _RepeatTranscriber:
+    def transcribe(self, _audio):
+        return "Say that again, please."
+
+
+class _FailingExecutor:
+    def execute(self, prompt: str):
+        raise AssertionError("local intents must not reach the gateway")
+
+
+def test_local_intent_is_handled_without_the_gateway() -> None:
+    events: list[object] = []
+    context = RuntimeContext(
+        settings=_S(
+            wake_hello_prompt="",
+            listen_start_prompt="",
+            local_intents=True,
+            local_intent_phrases="stop=stop|cancel;repeat=repeat that|say that again",
+        ),
+        stop_event=threading.Event(),
+        wakeword=_Wake(),
+        listener=_Listener(),
+        transcriber=_RepeatTranscriber(),
+        executor=_FailingExecutor(),
+        speaker=_ReplayingSpeaker(events),
+    )
+    registry = PluginRegistry()
+    registry.register_event_handler(lambda event, _context: events.append(event))
+
+    PipelineOrchestrator(context, registry).run_once_after_wake()
+
+    assert events[-2:] == [
+        "replayed",
+        LocalIntentHandled(intent="repeat", text="Say that again, please."),
+    ]
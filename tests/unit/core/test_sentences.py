@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from openclaw_assistant.core.sentences import SentenceChunker, split_units
+
+
+def test_sentences_are_released_once_the_following_whitespace_arrives() -> None:
+    chunker = SentenceChunker()
+    deltas = ["Sure", "! Dr. Smith is", " in. It costs 3.5", " dollars", ". Next"]
+
+    released = [chunker.feed(delta) for delta in deltas]
+
+    assert released == [[], ["Sure!"], ["Dr. Smith is in."], [], ["It costs 3.5 dollars."]]
+    assert chunker.feed(" up") == []
+    assert chunker.flush() == "Next up"
+
+
+def test_long_runs_without_punctuation_are_cut_at_a_soft_break() -> None:
+    chunker = SentenceChunker(max_chars=20)
+
+    assert chunker.feed("one two three, four five six seven") == ["one two three,"]
+    assert chunker.flush() == "four five six seven"
+
+
+def test_split_units_cuts_a_long_first_sentence_at_a_clause() -> None:
+    text = (
+        "Tomorrow looks bright, with a high of twenty one and a light breeze from the west. "
+        "Rain returns on Friday."
+    )
+
+    assert split_units(text, first_max_chars=40) == [
+        "Tomorrow looks bright,",
+        "with a high of twenty one and a light breeze from the west.",
+        "Rain returns on Friday.",
+    ]
+    assert split_units("Short one. Two.") == ["Short one.", "Two."]
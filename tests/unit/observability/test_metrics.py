@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from openclaw_assistant.observability.metrics import MetricsRegistry
+
+
+def test_metrics_registry_tracks_counters_and_timings() -> None:
+    metrics = MetricsRegistry()
+    metrics.increment("wakeword.session_rebuilds")
+    metrics.increment("wakeword.session_rebuilds")
+    metrics.observe_ms("wakeword.rearm_ms", 4.0)
+    metrics.observe_ms("wakeword.rearm_ms", 8.0)
+
+    assert metrics.counter("wakeword.session_rebuilds") == 2
+    stats = metrics.timing("wakeword.rearm_ms")
+    assert stats is not None
+    assert stats.count == 2
+    assert stats.mean_ms == 6.0
+    assert stats.min_ms == 4.0
+    assert stats.max_ms == 8.0
+    assert metrics.snapshot()["counters"] == {"wakeword.session_rebuilds": 2}
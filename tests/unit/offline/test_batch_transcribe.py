@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.wav_io import write_wav
+from openclaw_assistant.offline.batch_transcribe import transcribe_files
+
+_RATE = 16000
+
+
+class _Decoder:
+    # Emits two segments per clip timestamp, or one for an unpacked long file.
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, int | None]] = []
+
+    def __call__(self, audio: np.ndarray, clips: list[dict[str, float]] | None):
+        self.calls.append((audio.size, None if clips is None else len(clips)))
+        if clips is None:
+            return [SimpleNamespace(start=0.0, end=1.0, text=" long file")]
+        segments = []
+        for index, clip in enumerate(clips):
+            middle = (clip["start"] + clip["end"]) / 2
+            segments.append(SimpleNamespace(start=clip["start"], end=middle, text=f" c{index}a"))
+            segments.append(SimpleNamespace(start=middle, end=clip["end"], text=f" c{index}b"))
+        return segments
+
+
+def test_short_clips_are_packed_into_batches_and_mapped_back(tmp_path: Path) -> None:
+    for index in range(5):
+        write_wav(tmp_path / f"{index}.wav", np.full(8000 * (index + 1), 0.1, np.float32), 8000)
+    write_wav(tmp_path / "long.wav", np.zeros(31 * _RATE, np.float32), _RATE)
+    (tmp_path / "broken.wav").write_bytes(b"not a wav")
+    decoder = _Decoder()
+
+    results = transcribe_files(sorted(tmp_path.glob("*.wav")), tmp_path, decoder, batch_size=2)
+    by_path = {result.path: result for result in results}
+
+    assert decoder.calls == [
+        (3 * _RATE, 2),
+        (7 * _RATE, 2),
+        (5 * _RATE, 1),
+        (31 * _RATE, None),
+    ]
+    assert by_path["0.wav"].text == "c0a c0b"
+    assert by_path["1.wav"].text == "c1a c1b"
+    assert by_path["3.wav"].text == "c1a c1b"
+    assert by_path["4.wav"].audio_seconds == 5.0
+    assert by_path["long.wav"].text == "long file"
+    assert by_path["broken.wav"].error
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.wav_io import read_wav, write_wav
+from openclaw_assistant.adapters.gateway.stub import StubActionExecutor
+from openclaw_assistant.offline.replay import ReplayReport, format_report, replay_clips
+
+
+@dataclass(frozen=True)
+class _S:
+    wakeword_label: str = "OpenClaw"
+    listen_start_prompt: str = "Listening"
+    wake_hello_prompt: str = "Hi"
+    wakeword_start_delay: float = 0.5
+    capture_from_wake: bool = False
+    command_sample_rate: int = 16000
+    stt_trim_silence: bool = False
+    stream_responses: bool = False
+    local_intents: bool = False
+
+
+class _Transcriber:
+    def __init__(self) -> None:
+        self.sizes: list[int] = []
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        self.sizes.append(audio.size)
+        return "" if audio.size < 8000 else f"clip of {audio.size} samples"
+
+
+def _synthesize(text: str) -> tuple[np.ndarray, int]:
+    return np.full(len(text), 0.1, dtype=np.float32), 24000
+
+
+def test_replay_drives_pipeline_per_clip_and_writes_responses(tmp_path: Path) -> None:
+    corpus = tmp_path / "corpus"
+    write_wav(corpus / "a.wav", np.zeros(8000, dtype=np.float32), 8000)
+    write_wav(corpus / "nested" / "b.wav", np.zeros(16000, dtype=np.float32), 16000)
+    write_wav(corpus / "short.wav", np.zeros(1600, dtype=np.float32), 16000)
+    clips = sorted(corpus.rglob("*.wav"))
+    transcriber = _Transcriber()
+
+    timings = replay_clips(
+        clips,
+        _S(),  # type: ignore[arg-type]
+        corpus_dir=corpus,
+        output_dir=tmp_path / "out",
+        transcriber=transcriber,
+        executor=StubActionExecutor(),
+        synthesize=_synthesize,
+    )
+
+    assert [timing.clip for timing in timings] == ["a.wav", "nested/b.wav", "short.wav"]
+    assert transcriber.sizes == [16000, 16000, 1600]
+    assert set(timings[0].stages_ms) == {"capture", "transcribe", "action", "speak"}
+    assert timings[0].audio_seconds == 1.0
+    assert timings[0].response == "You said: clip of 16000 samples"
+    assert set(timings[2].stages_ms) == {"capture", "transcribe"}
+
+    audio, rate = read_wav(tmp_path / "out" / "nested" / "b.wav")
+    assert rate == 24000 and audio.size == len(timings[1].response)
+    assert not (tmp_path / "out" / "short.wav").exists()
+
+    report = ReplayReport(utterances=timings, workers=1, wall_seconds=1.0, replay_seconds=0.5)
+    assert report.summary()["realtime_factor"] == 4.2
+    assert "nested/b.wav" in format_report(report)
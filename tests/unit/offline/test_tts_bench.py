@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from openclaw_assistant.config.loader import load_settings
+from openclaw_assistant.config.settings import Settings
+from openclaw_assistant.offline.tts_bench import bench_configs, format_report, measure
+
+_RATE = 24000
+
+
+def _load(_settings: Settings):
+    def _synthesize(_text: str) -> tuple[np.ndarray, int]:
+        return np.zeros(_RATE // 2, dtype=np.float32), _RATE
+
+    return _synthesize
+
+
+def test_bench_configs_sweep_variants_and_threads(tmp_path: Path) -> None:
+    settings = load_settings(tmp_path)
+    configs = bench_configs(settings, variants=["fp32", "int8"], intra_op_threads=[1, 4])
+
+    assert [(c.kokoro_model_variant, c.kokoro_intra_op_threads) for c in configs] == [
+        ("fp32", 1),
+        ("fp32", 4),
+        ("int8", 1),
+        ("int8", 4),
+    ]
+    model_dir = settings.kokoro_model_path.parent
+    assert configs[0].kokoro.model_path == model_dir / "kokoro-v1.0.onnx"
+    assert configs[2].kokoro.model_path == model_dir / "kokoro-v1.0.int8.onnx"
+    assert bench_configs(settings) == [settings]
+
+
+def test_measure_reports_rtf_and_peak_rss(tmp_path: Path) -> None:
+    result = measure(load_settings(tmp_path), _load, texts=["a", "b"], repeats=2)
+
+    assert result.error is None
+    assert result.audio_seconds == pytest.approx(2.0)
+    assert len(result.unit_rtf) == 4
+    assert 0.0 <= result.realtime_factor < 0.1
+    assert result.peak_rss_bytes > 0
+    assert "/tauto/all" in format_report([result])
+
+
+def test_measure_records_load_errors(tmp_path: Path) -> None:
+    def _missing(_settings: Settings):
+        raise FileNotFoundError("k.int8.onnx")
+
+    result = measure(load_settings(tmp_path), _missing)
+
+    assert result.error == "k.int8.onnx"
+    assert "error: k.int8.onnx" in format_report([result])
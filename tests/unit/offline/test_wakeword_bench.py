@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from openclaw_assistant.adapters.audio.wav_io import write_wav
+from openclaw_assistant.offline.wakeword_bench import load_corpus, run_sweep
+
+_RATE = 16000
+
+
+def _clip(burst: tuple[float, float] | None, seconds: float = 3.0) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    audio = rng.normal(0.0, 0.002, int(seconds * _RATE)).astype(np.float32)
+    if burst is not None:
+        start, end = (int(value * _RATE) for value in burst)
+        audio[start:end] += 0.3 * np.sin(np.arange(end - start) * 0.2).astype(np.float32)
+    return audio
+
+
+def _write_corpus(root: Path) -> None:
+    write_wav(root / "hit.wav", _clip((1.0, 1.6)), _RATE)
+    write_wav(root / "silence.wav", _clip(None), _RATE)
+    (root / "labels.json").write_text(json.dumps({"hit.wav": 1.6}))
+
+
+def test_load_corpus_marks_unlabelled_clips_negative(tmp_path: Path) -> None:
+    _write_corpus(tmp_path)
+    clips = {clip.path.name: clip.keyword_end for clip in load_corpus(tmp_path)}
+    assert clips == {"hit.wav": 1.6, "silence.wav": None}
+
+
+def test_energy_sweep_reports_hits_and_latency(tmp_path: Path) -> None:
+    _write_corpus(tmp_path)
+    [result] = run_sweep(tmp_path, [0.5], detector_spec="energy")
+
+    assert result.detector == "energy"
+    assert result.clips == 2
+    assert result.hits == 1
+    assert result.false_accepts == 0
+    assert 0.0 <= result.latencies_ms[0] < 100.0
+    assert result.realtime_factor > 1.0
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from openclaw_assistant.plugins.builtin.listen_stage import ListenStagePlugin
+
+
+class _Speaker:
+    def __init__(self, log: list[str]) -> None:
+        self.log = log
+
+    def speak(self, text: str) -> None:
+        self.log.append(f"spoken:{text}")
+
+
+class _Listener:
+    def __init__(self, log: list[str]) -> None:
+        self.log = log
+
+    def record_command_audio(self) -> np.ndarray:
+        self.log.append("captured")
+        return np.zeros(4, dtype=np.float32)
+
+
+def _capture(*, capture_from_wake: bool) -> list[str]:
+    log: list[str] = []
+    settings = SimpleNamespace(
+        wake_hello_prompt="Hi",
+        listen_start_prompt="Listening",
+        wakeword_start_delay=0.0,
+        capture_from_wake=capture_from_wake,
+    )
+    context = SimpleNamespace(
+        settings=settings,
+        speaker=_Speaker(log),
+        listener=_Listener(log),
+        stop_event=threading.Event(),
+    )
+    ListenStagePlugin().capture_audio(context)  # type: ignore[arg-type]
+    return log
+
+
+def test_prompts_play_before_capture() -> None:
+    assert _capture(capture_from_wake=False) == ["spoken:Hi", "spoken:Listening", "captured"]
+
+
+def test_capture_from_wake_skips_prompts_so_they_are_not_recorded() -> None:
+    assert _capture(capture_from_wake=True) == ["captured"]
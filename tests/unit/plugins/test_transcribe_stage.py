@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from openclaw_assistant.core.contracts import SpeechMap
+from openclaw_assistant.plugins.builtin.transcribe_stage import TranscribeStagePlugin
+
+
+class _Listener:
+    def __init__(self, speech: SpeechMap | None) -> None:
+        self.speech = speech
+
+    def record_command_audio(self) -> np.ndarray:
+        return np.zeros(0, dtype=np.float32)
+
+    def last_speech_map(self) -> SpeechMap | None:
+        return self.speech
+
+
+class _Transcriber:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int]] = []
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        self.calls.append(("full", audio.size))
+        return "full"
+
+    def transcribe_speech(self, audio: np.ndarray) -> str:
+        self.calls.append(("speech", audio.size))
+        return "speech"
+
+
+def _transcribe(speech: SpeechMap | None, audio: np.ndarray) -> list[tuple[str, int]]:
+    transcriber = _Transcriber()
+    context = SimpleNamespace(listener=_Listener(speech), transcriber=transcriber)
+    TranscribeStagePlugin().transcribe(audio, context)  # type: ignore[arg-type]
+    return transcriber.calls
+
+
+def test_speech_regions_are_extracted_and_vad_path_skipped() -> None:
+    audio = np.arange(1000, dtype=np.float32)
+    speech = SpeechMap(16000, 1000, ((100, 300), (500, 600)))
+
+    assert _transcribe(speech, audio) == [("speech", 300)]
+
+
+def test_missing_or_empty_map_falls_back_to_full_audio() -> None:
+    audio = np.zeros(1000, dtype=np.float32)
+
+    assert _transcribe(None, audio) == [("full", 1000)]
+    assert _transcribe(SpeechMap(16000, 1000, ()), audio) == [("full", 1000)]
+    assert _transcribe(SpeechMap(16000, 800, ((0, 500),)), audio) == [("full", 1000)]